@@ -0,0 +1,114 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of the import time of the launcher plugin.
+
+Hydra imports the launcher config on every run, also when the sweep is not
+launched with SkyPilot. Every import runs in a fresh interpreter and the
+benchmark fails when the median import time exceeds ``--budget`` seconds or
+when importing the launcher loads SkyPilot.
+
+Example:
+-------
+    uv run benchmarks/import_time.py --budget 0.5 --output import_time.json
+
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess  # nosec B404
+import sys
+from pathlib import Path
+from typing import Any
+
+MODULES: list[str] = [
+    "hydra_skypilot_launcher.config.launcher",
+    "hydra_skypilot_launcher.launcher.launcher",
+]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+for module in {modules!r}:
+    __import__(module)
+elapsed = time.perf_counter() - start
+loaded = sorted(m for m in sys.modules if m == "sky" or m.startswith("sky."))
+print(json.dumps({{"seconds": elapsed, "sky_modules": loaded}}))
+"""
+
+
+def measure_import(modules: list[str]) -> dict[str, Any]:
+    """Import the modules in a fresh interpreter and time the import."""
+    output: str = subprocess.run(  # noqa: S603  # nosec B603
+        [sys.executable, "-c", IMPORT_SCRIPT.format(modules=modules)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=1.0)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Time the import of the launcher and check it against the budget."""
+    args = parse_args()
+    measurements: list[dict[str, Any]] = [
+        measure_import(MODULES) for _ in range(max(1, args.repeats))
+    ]
+    seconds: list[float] = [measurement["seconds"] for measurement in measurements]
+    sky_modules: list[str] = measurements[0]["sky_modules"]
+    result: dict[str, Any] = {
+        "python": platform.python_version(),
+        "modules": MODULES,
+        "budget_seconds": args.budget,
+        "median_seconds": statistics.median(seconds),
+        "max_seconds": max(seconds),
+        "sky_modules": sky_modules,
+    }
+    print(  # noqa: T201
+        f"Import time: median {result['median_seconds']:.3f}s, "
+        f"max {result['max_seconds']:.3f}s (budget {args.budget:.3f}s).",
+    )
+    if args.output is not None:
+        args.output.write_text(json.dumps(result, indent=2))
+
+    if sky_modules:
+        print(f"Importing the launcher loads SkyPilot: {sky_modules[:5]}")  # noqa: T201
+        sys.exit(1)
+    if result["median_seconds"] > args.budget:
+        print("Import time exceeds the budget.")  # noqa: T201
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
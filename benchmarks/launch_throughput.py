@@ -0,0 +1,283 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of the launch throughput against a local stand-in for SkyPilot.
+
+Every sweep size runs in a fresh process, so that the peak RSS is measured per
+sweep. ``sky.jobs.launch`` is replaced by a stand-in that sleeps for
+``--latency`` seconds and fails with probability ``--failure-rate``.
+
+Example:
+-------
+    uv run benchmarks/launch_throughput.py --sizes 10 1000 --output bench.json
+
+"""
+
+import argparse
+import json
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from itertools import count
+from multiprocessing import get_context
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from hydra import compose, initialize
+from hydra.core.config_store import ConfigStore
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.utils import JobStatus
+from hydra.types import HydraContext
+from hydra.utils import instantiate
+from omegaconf import DictConfig
+from sky import jobs as managed_jobs
+
+from hydra_skypilot_launcher.config.config_types import ResourcesConfig
+from hydra_skypilot_launcher.config.launcher import SkyPilotLauncherConfig
+
+LAUNCHER_TARGET = "hydra_skypilot_launcher.launcher.launcher.SkyPilotLauncher"
+
+
+@dataclass
+class BenchmarkConfig:
+    """Settings of one benchmark run."""
+
+    num_jobs: int
+    latency: float = 0.0
+    failure_rate: float = 0.0
+    max_concurrent_submissions: int = 1
+    compose_cache: bool = False
+    group_overrides: bool = False
+    seed: int = 0
+    launcher_overrides: list[str] = field(default_factory=list)
+
+
+class FakeJobsLaunch:
+    """Stand-in for ``sky.jobs.launch`` with a fixed latency and failure rate."""
+
+    def __init__(self, latency: float, failure_rate: float, seed: int) -> None:
+        """Initialize the stand-in."""
+        self.latency: float = latency
+        self.failure_rate: float = failure_rate
+        self._random = random.Random(seed)  # noqa: S311  # nosec B311
+        self._request_ids = count()
+        self._lock = Lock()
+
+    def __call__(self, task: Any, *args: Any, **kwargs: Any) -> str:  # noqa: ANN401, ARG002
+        """Submit a task, returning a request id."""
+        with self._lock:
+            request_idx: int = next(self._request_ids)
+            failed: bool = self._random.random() < self.failure_rate
+        time.sleep(self.latency)
+        if failed:
+            msg = f"Simulated launch failure of request {request_idx}."
+            raise RuntimeError(msg)
+        return f"benchmark-{request_idx}"
+
+
+def task_function(cfg: DictConfig) -> None:
+    """Task function of the synthetic sweep, never run by the launcher."""
+
+
+def get_job_overrides(config: BenchmarkConfig) -> list[list[str]]:
+    """Get the overrides of a synthetic sweep."""
+    job_overrides: list[list[str]] = []
+    for job_idx in range(config.num_jobs):
+        job_override: list[str] = [f"lr={1e-4 * (job_idx + 1)}", f"seed={job_idx}"]
+        if config.group_overrides:
+            job_override.append(f"model={'small' if job_idx % 2 else 'large'}")
+        job_overrides.append(job_override)
+    return job_overrides
+
+
+def register_configs() -> None:
+    """Register the configs of the synthetic sweep."""
+    config_store = ConfigStore.instance()
+    config_store.store(
+        group="hydra/launcher",
+        name="skypilot_benchmark",
+        node=SkyPilotLauncherConfig(
+            resources=ResourcesConfig(infrastructure="gcp", cpus=4),
+            _target_=LAUNCHER_TARGET,
+            secrets={"WANDB_API_KEY": "benchmark"},
+            setup_commands=["uv sync"],
+        ),
+    )
+    config_store.store(group="model", name="small", node={"layers": 2, "width": 64})
+    config_store.store(group="model", name="large", node={"layers": 8, "width": 512})
+    config_store.store(
+        name="benchmark",
+        node={
+            "defaults": ["_self_", {"model": "small"}],
+            "lr": 1e-3,
+            "seed": 0,
+            "data": {"path": "data/train", "batch_size": 32},
+        },
+    )
+
+
+def run_benchmark(config: BenchmarkConfig) -> dict[str, Any]:
+    """Launch a synthetic sweep and measure the throughput of the launcher."""
+    register_configs()
+    fake_launch = FakeJobsLaunch(config.latency, config.failure_rate, config.seed)
+    managed_jobs.launch = fake_launch  # type: ignore[invalid-assignment]
+
+    with tempfile.TemporaryDirectory() as sweep_dir:
+        GlobalHydra.instance().clear()
+        with initialize(version_base=None, config_path=None):
+            master_config: DictConfig = compose(
+                config_name="benchmark",
+                overrides=[
+                    "hydra/launcher=skypilot_benchmark",
+                    f"hydra.sweep.dir={sweep_dir}",
+                    f"hydra.launcher.max_concurrent_submissions={config.max_concurrent_submissions}",
+                    f"hydra.launcher.compose_cache.enabled={config.compose_cache}",
+                    "hydra.launcher.profiling.enabled=true",
+                    *config.launcher_overrides,
+                ],
+                return_hydra_config=True,
+            )
+            hydra_context = HydraContext(
+                config_loader=GlobalHydra.instance().config_loader(),
+                callbacks=None,  # type: ignore[invalid-argument-type]
+            )
+            launcher = instantiate(master_config.hydra.launcher)
+            job_overrides: list[list[str]] = get_job_overrides(config)
+
+            start: float = time.perf_counter()
+            launcher.setup(
+                config=master_config,
+                task_function=task_function,
+                hydra_context=hydra_context,
+            )
+            job_returns = launcher.launch(job_overrides, initial_job_idx=0)
+            elapsed: float = time.perf_counter() - start
+
+    failed_jobs: int = sum(
+        job_return.status is JobStatus.FAILED for job_return in job_returns
+    )
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    peak_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        peak_rss *= 1024
+    return {
+        "config": asdict(config),
+        "elapsed_seconds": elapsed,
+        "jobs_per_second": config.num_jobs / elapsed if elapsed else None,
+        "failed_jobs": failed_jobs,
+        "peak_rss_bytes": peak_rss,
+        "profile": launcher.profiler.get_summary(),
+    }
+
+
+def get_package_version() -> str | None:
+    """Get the installed version of the launcher."""
+    try:
+        return version("hydra_skypilot_launcher")
+    except PackageNotFoundError:
+        return None
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--max-concurrent-submissions", type=int, default=1)
+    parser.add_argument("--compose-cache", action="store_true")
+    parser.add_argument("--group-overrides", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--launcher-override",
+        action="append",
+        default=[],
+        dest="launcher_overrides",
+        help="Extra override of the launcher config, e.g. "
+        "hydra.launcher.packing.jobs_per_pack=8",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmark_results.json"),
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark for every sweep size and save the results."""
+    args = parse_args()
+    results: list[dict[str, Any]] = []
+    for num_jobs in args.sizes:
+        config = BenchmarkConfig(
+            num_jobs=num_jobs,
+            latency=args.latency,
+            failure_rate=args.failure_rate,
+            max_concurrent_submissions=args.max_concurrent_submissions,
+            compose_cache=args.compose_cache,
+            group_overrides=args.group_overrides,
+            seed=args.seed,
+            launcher_overrides=args.launcher_overrides,
+        )
+        # A fresh process per sweep keeps the peak RSS of the sweeps apart
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=get_context("spawn"),
+        ) as executor:
+            result: dict[str, Any] = executor.submit(run_benchmark, config).result()
+        results.append(result)
+
+        phases: dict[str, dict[str, float]] = result["profile"]["phases"]
+        print(  # noqa: T201
+            f"{num_jobs} jobs: {result['jobs_per_second']:.1f} jobs/s, "
+            f"peak RSS {result['peak_rss_bytes'] / 2**20:.0f} MiB, "
+            + ", ".join(
+                f"{name} {phases[name]['total']:.2f}s"
+                for name in ("load_sweep_config", "to_yaml_config", "save_configs")
+                if name in phases
+            ),
+        )
+
+    args.output.write_text(
+        json.dumps(
+            {
+                "version": get_package_version(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+            indent=2,
+        ),
+    )
+    print(f"Results saved to '{args.output}'.")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Hydra callbacks running inside the launched jobs."""
+
+import json
+import pickle  # nosec B403
+from pathlib import Path
+from typing import Any
+
+from hydra.core.hydra_config import HydraConfig
+from hydra.core.utils import JobReturn, JobStatus
+from hydra.experimental.callback import Callback
+from omegaconf import DictConfig
+
+__all__ = ["ERROR_FILE", "RETURN_VALUE_FILE", "ReturnValueCallback"]
+
+# Name of the file holding the return value, without the format suffix
+RETURN_VALUE_FILE = "return_value"
+# Name of the file holding the error of a failed job
+ERROR_FILE = "job_error.json"
+
+
+class ReturnValueCallback(Callback):
+    """Save the return value of the task function in the job output dir.
+
+    The error of a failed job is saved instead, so the launcher gets the status
+    of every job, also of the jobs packed into one SkyPilot job.
+    """
+
+    def __init__(self, format: str = "json") -> None:  # noqa: A002
+        """Initialize the callback with the format of the return value file."""
+        self.format: str = format
+
+    def on_job_end(
+        self,
+        config: DictConfig,  # noqa: ARG002
+        job_return: JobReturn,
+        **kwargs: Any,  # noqa: ANN401, ARG002
+    ) -> None:
+        """Save the return value of a completed job or the error of a failed job."""
+        output_dir = Path(HydraConfig.get().runtime.output_dir)
+        if job_return.status is JobStatus.FAILED:
+            error = job_return._return_value  # noqa: SLF001
+            (output_dir / ERROR_FILE).write_text(
+                json.dumps({"type": type(error).__name__, "message": str(error)}),
+            )
+            return
+        if job_return.status is not JobStatus.COMPLETED:
+            return
+
+        if self.format == "pickle":
+            (output_dir / f"{RETURN_VALUE_FILE}.pkl").write_bytes(
+                pickle.dumps(job_return.return_value),
+            )
+        else:
+            (output_dir / f"{RETURN_VALUE_FILE}.json").write_text(
+                json.dumps(job_return.return_value),
+            )
@@ -0,0 +1,371 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Collection of the outputs and logs of a sweep into its job output dirs.
+
+The jobs of a sweep are found from the configs saved in their output dirs
+at launch. The files the jobs wrote to the results bucket and the logs of
+their SkyPilot jobs are downloaded into the output dirs in parallel. The logs
+of jobs run by the pool backend are not collected.
+
+Only jobs launched with ``hydra.launcher.results.enabled=true`` write their
+outputs to the results bucket, the outputs of other jobs stay on the nodes
+that ran them and only their logs can be collected.
+
+Example:
+-------
+    uv run python -m hydra_skypilot_launcher.collect multirun/2025-01-01/12-00-00
+
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path, PurePosixPath
+from typing import Any, Protocol, Sequence
+
+from hydra_skypilot_launcher.config.handler import load_job_config
+from hydra_skypilot_launcher.config.launcher import LaunchBackend
+from hydra_skypilot_launcher.launcher.results import ResultReader
+from hydra_skypilot_launcher.launcher.sync import Bucket, get_bucket
+
+__all__ = [
+    "CollectedJob",
+    "LocalLogStore",
+    "LogStore",
+    "ManagedJobLogStore",
+    "SweepCollector",
+    "get_log_store",
+]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+PART_SUFFIX = ".part"
+
+
+class LogStore(Protocol):
+    """Source of the logs of launched SkyPilot jobs."""
+
+    def download(self, request_id: str, local_dir: Path) -> None:
+        """Download the logs of the job launched by a request."""
+        ...
+
+
+class LocalLogStore:
+    """Local directory standing in for SkyPilot, one subdirectory per request."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the local log store."""
+        self.root: Path = root.expanduser()
+
+    def download(self, request_id: str, local_dir: Path) -> None:
+        """Download the logs of the job launched by a request."""
+        shutil.copytree(self.root / request_id, local_dir, dirs_exist_ok=True)
+
+
+class ManagedJobLogStore:
+    """Logs of SkyPilot managed jobs."""
+
+    def download(self, request_id: str, local_dir: Path) -> None:
+        """Download the logs of the job launched by a request."""
+        import sky  # noqa: PLC0415
+        from sky.jobs import download_logs  # noqa: PLC0415
+
+        job_id: Any = sky.get(request_id)[0]
+        download_logs(
+            name=None,
+            job_id=job_id[0] if isinstance(job_id, list) else job_id,
+            refresh=False,
+            controller=False,
+            local_dir=local_dir.as_posix(),
+        )
+
+
+def get_log_store(local_log_dir: Path | None) -> LogStore:
+    """Get the log store, using a local directory as stand-in if given."""
+    if local_log_dir is not None:
+        return LocalLogStore(local_log_dir)
+    return ManagedJobLogStore()
+
+
+@dataclass
+class CollectedJob:
+    """Job of a sweep, with where its outputs are stored."""
+
+    job_dir: Path
+    request_id: str
+    results_bucket: str | None
+    bucket_dir: PurePosixPath
+    has_logs: bool = True
+
+
+class SweepCollector:
+    """Download the outputs and logs of the jobs of a sweep into their output dirs.
+
+    Files already present in an output dir are skipped. Objects are downloaded
+    to ``.part`` files first, so interrupted downloads are resumed. The Hydra
+    configs the jobs saved in the results bucket are not downloaded, as the
+    output dirs hold the configs saved at launch. The logs of packed jobs are
+    downloaded once per SkyPilot job and copied to every job of the pack.
+    """
+
+    def __init__(
+        self,
+        bucket: Bucket,
+        log_store: LogStore | None = None,
+        workers: int = 16,
+        output_subdir: str = ".hydra",
+        logs_subdir: str = "logs",
+    ) -> None:
+        """Initialize the sweep collector."""
+        self.bucket: Bucket = bucket
+        self.log_store: LogStore | None = log_store
+        self.workers: int = max(1, workers)
+        self.output_subdir: str = output_subdir
+        self.logs_subdir: str = logs_subdir
+
+    def find_jobs(self, sweep_dir: Path) -> list[CollectedJob]:
+        """Find the launched jobs of a sweep from their saved configs."""
+        jobs: list[CollectedJob] = []
+        for overrides_file in sorted(
+            sweep_dir.glob(f"**/{self.output_subdir}/overrides.yaml"),
+        ):
+            job_dir: Path = overrides_file.parent.parent
+            hydra: dict[str, Any] = load_job_config(job_dir, self.output_subdir)[
+                "hydra"
+            ]
+            if not hydra["job"].get("request_id"):
+                continue
+            output_dir = Path(hydra["runtime"]["output_dir"])
+            cwd = Path(hydra["runtime"]["cwd"])
+            results: dict[str, Any] = hydra["launcher"].get("results") or {}
+            jobs.append(
+                CollectedJob(
+                    job_dir=job_dir,
+                    request_id=str(hydra["job"]["request_id"]),
+                    results_bucket=results["bucket"]
+                    if results.get("enabled")
+                    else None,
+                    bucket_dir=PurePosixPath(
+                        ResultReader.get_bucket_dir(
+                            output_dir.relative_to(cwd)
+                            if output_dir.is_relative_to(cwd)
+                            else output_dir,
+                        ),
+                    ),
+                    # The requests of the pool backend resolve to cluster jobs,
+                    # not to the managed jobs the log store downloads from
+                    has_logs=str(hydra["launcher"].get("backend", "")).lower()
+                    != LaunchBackend.POOL.value,
+                ),
+            )
+        return jobs
+
+    def _get_downloads(
+        self,
+        jobs: Sequence[CollectedJob],
+    ) -> list[tuple[str, str, int, Path]]:
+        """Get the objects to download with one listing per results bucket."""
+        jobs_by_bucket: dict[str, dict[PurePosixPath, CollectedJob]] = defaultdict(
+            dict,
+        )
+        for job in jobs:
+            if job.results_bucket is not None:
+                jobs_by_bucket[job.results_bucket][job.bucket_dir] = job
+
+        downloads: list[tuple[str, str, int, Path]] = []
+        for bucket_name, bucket_jobs in jobs_by_bucket.items():
+            prefix: str = os.path.commonpath([str(path) for path in bucket_jobs])
+            objects = self.bucket.list_objects(bucket_name, f"{prefix}/")
+            for key, size in objects.items():
+                job = next(
+                    (
+                        bucket_jobs[parent]
+                        for parent in PurePosixPath(key).parents
+                        if parent in bucket_jobs
+                    ),
+                    None,
+                )
+                if job is None:
+                    continue
+                relative_path = PurePosixPath(key).relative_to(job.bucket_dir)
+                if relative_path.parts[0] == self.output_subdir:
+                    continue
+                downloads.append((bucket_name, key, size, job.job_dir / relative_path))
+        return downloads
+
+    def _download(self, bucket_name: str, key: str, size: int, file_path: Path) -> bool:
+        """Download an object unless present, returning whether it was downloaded."""
+        if file_path.exists():
+            return False
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path: Path = file_path.with_name(file_path.name + PART_SUFFIX)
+        start: int = part_path.stat().st_size if part_path.exists() else 0
+        if start > size:
+            part_path.unlink()
+            start = 0
+        if start < size:
+            self.bucket.download(bucket_name, key, part_path, start)
+        part_path.touch()
+        part_path.replace(file_path)
+        return True
+
+    def _download_logs(self, request_id: str, jobs: Sequence[CollectedJob]) -> bool:
+        """Download the logs of a SkyPilot job unless all its jobs have them."""
+        logs_dirs: list[Path] = [job.job_dir / self.logs_subdir for job in jobs]
+        if all(logs_dir.is_dir() and any(logs_dir.iterdir()) for logs_dir in logs_dirs):
+            return False
+        self.log_store.download(request_id, logs_dirs[0])  # type: ignore[union-attr]
+        for logs_dir in logs_dirs[1:]:
+            shutil.copytree(logs_dirs[0], logs_dir, dirs_exist_ok=True)
+        return True
+
+    def collect(self, sweep_dir: Path) -> dict[str, int]:
+        """Download the outputs and logs of the jobs of a sweep.
+
+        Returns the number of jobs, of jobs without outputs in a results bucket
+        and of downloaded, skipped and failed files and logs. Raises a
+        ``ValueError`` when there is nothing to collect, as no job has its
+        outputs in a results bucket and the logs are not collected.
+        """
+        jobs: list[CollectedJob] = self.find_jobs(sweep_dir)
+        without_outputs: int = sum(job.results_bucket is None for job in jobs)
+        if without_outputs:
+            if without_outputs == len(jobs) and self.log_store is None:
+                msg = (
+                    f"None of the {len(jobs)} jobs in '{sweep_dir}' were launched "
+                    "with hydra.launcher.results.enabled=true, their outputs are "
+                    "not in a bucket and the logs are not collected."
+                )
+                raise ValueError(msg)
+            logger.warning(
+                f"{without_outputs} of {len(jobs)} jobs were launched without "  # noqa: G004
+                "hydra.launcher.results.enabled=true, only their logs are "
+                "collected.",
+            )
+        downloads = self._get_downloads(jobs)
+        jobs_by_request: dict[str, list[CollectedJob]] = defaultdict(list)
+        if self.log_store is not None:
+            for job in jobs:
+                if job.has_logs:
+                    jobs_by_request[job.request_id].append(job)
+        logger.info(
+            f"Collecting {len(downloads)} files and the logs of "  # noqa: G004
+            f"{len(jobs_by_request)} SkyPilot jobs for {len(jobs)} jobs...",
+        )
+
+        summary: dict[str, int] = {
+            "jobs": len(jobs),
+            "jobs_without_outputs": without_outputs,
+            "files": 0,
+            "skipped_files": 0,
+            "logs": 0,
+            "skipped_logs": 0,
+            "failed": 0,
+        }
+        with ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="skypilot-collect",
+        ) as executor:
+            futures = [
+                ("files", download[1], executor.submit(self._download, *download))
+                for download in downloads
+            ]
+            futures.extend(
+                (
+                    "logs",
+                    request_id,
+                    executor.submit(self._download_logs, request_id, request_jobs),
+                )
+                for request_id, request_jobs in jobs_by_request.items()
+            )
+            for kind, name, future in futures:
+                try:
+                    downloaded: bool = future.result()
+                except Exception:
+                    logger.exception(f"Failed to collect '{name}'.")  # noqa: G004
+                    summary["failed"] += 1
+                    continue
+                summary[kind if downloaded else f"skipped_{kind}"] += 1
+        return summary
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        epilog=(
+            "Outputs are only collected for jobs launched with "
+            "hydra.launcher.results.enabled=true, the logs for all jobs."
+        ),
+    )
+    parser.add_argument("sweep_dir", type=Path)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--output-subdir", default=".hydra")
+    parser.add_argument("--logs-subdir", default="logs")
+    parser.add_argument(
+        "--no-logs",
+        action="store_true",
+        help="Only collect the outputs in the results bucket",
+    )
+    parser.add_argument(
+        "--local-bucket-dir",
+        type=Path,
+        default=None,
+        help="Local directory standing in for the buckets",
+    )
+    parser.add_argument(
+        "--local-log-dir",
+        type=Path,
+        default=None,
+        help="Local directory standing in for SkyPilot, one log dir per request",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Collect the outputs and logs of a sweep."""
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    collector = SweepCollector(
+        bucket=get_bucket(args.local_bucket_dir),
+        log_store=None if args.no_logs else get_log_store(args.local_log_dir),
+        workers=args.workers,
+        output_subdir=args.output_subdir,
+        logs_subdir=args.logs_subdir,
+    )
+    try:
+        summary = collector.collect(args.sweep_dir)
+    except ValueError as error:
+        raise SystemExit(str(error)) from error
+    print(json.dumps(summary, indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of the composed sweep configs."""
+
+import copy
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import Any, Sequence
+
+from hydra._internal.config_loader_impl import (
+    ConfigLoaderImpl,
+    get_overrides_dirname,
+)
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.override_parser.overrides_parser import OverridesParser
+from hydra.core.override_parser.types import Override
+from hydra.core.config_store import ConfigStore
+from omegaconf import DictConfig, OmegaConf
+
+from hydra_skypilot_launcher.config.launcher import ComposeCacheConfig
+
+__all__ = ["ComposeCache"]
+
+# State of the worker processes composing configs that change config groups
+_worker_config_loader: ConfigLoader | None = None
+_worker_master_config: DictConfig | None = None
+
+
+def _init_worker(
+    config_loader: ConfigLoader,
+    master_config: DictConfig,
+    config_store_repo: dict[str, Any],
+) -> None:
+    """Store the state passed by the launcher process in a worker process.
+
+    The workers are spawned, so the structured configs registered in the
+    config store of the launcher process are restored as well.
+    """
+    global _worker_config_loader, _worker_master_config  # noqa: PLW0603
+    ConfigStore.instance().repo = config_store_repo
+    _worker_config_loader = config_loader
+    _worker_master_config = master_config
+
+
+def _compose_in_worker(overrides: list[str]) -> DictConfig:
+    """Compose a sweep config in a worker process."""
+    assert _worker_config_loader is not None  # noqa: S101  # nosec B101
+    assert _worker_master_config is not None  # noqa: S101  # nosec B101
+    return _worker_config_loader.load_sweep_config(_worker_master_config, overrides)
+
+
+class ComposeCache:
+    """Cache of the sweep configs composed for the jobs of a sweep.
+
+    The sweep config without job overrides is composed once. Jobs whose
+    overrides only change config values get a copy of it with their overrides
+    applied, instead of a full composition. Composed configs are kept in a
+    bounded LRU cache keyed by the job overrides.
+
+    Overrides changing config groups can be composed up front in spawned
+    worker processes, which get their state passed explicitly and do not
+    inherit the threads of the launcher process.
+    """
+
+    def __init__(
+        self,
+        config: ComposeCacheConfig,
+        config_loader: ConfigLoader,
+        master_config: DictConfig,
+    ) -> None:
+        """Initialize the compose cache."""
+        self.config: ComposeCacheConfig = config
+        self.config_loader: ConfigLoader = config_loader
+        self.master_config: DictConfig = master_config
+        self._parser: OverridesParser = OverridesParser.create()
+        self._base_config: DictConfig | None = None
+        self._cache: OrderedDict[tuple[str, ...], DictConfig] = OrderedDict()
+        self._composed: dict[tuple[str, ...], DictConfig] = {}
+        self._lock = Lock()
+
+    @property
+    def base_config(self) -> DictConfig:
+        """Get the sweep config composed without job overrides."""
+        if self._base_config is None:
+            self._base_config = self.config_loader.load_sweep_config(
+                self.master_config,
+                [],
+            )
+        return self._base_config
+
+    def _is_group_override(self, override: Override) -> bool:
+        """Check whether an override changes a config group."""
+        if override.package is not None:
+            return True
+        key: str = override.key_or_group
+        if key in self.base_config.hydra.runtime.choices:
+            return True
+        repository = getattr(self.config_loader, "repository", None)
+        return repository is not None and repository.group_exists(key)
+
+    def _needs_composition(self, overrides: Sequence[str]) -> bool:
+        """Check whether the overrides need a full composition."""
+        return any(
+            self._is_group_override(override)
+            for override in self._parser.parse_overrides(list(overrides))
+        )
+
+    def _apply_overrides(self, overrides: Sequence[str]) -> DictConfig:
+        """Apply overrides of config values to a copy of the base config."""
+        parsed_overrides = self._parser.parse_overrides(list(overrides))
+        sweep_config: DictConfig = copy.deepcopy(self.base_config)
+        ConfigLoaderImpl._apply_overrides_to_config(parsed_overrides, sweep_config)  # noqa: SLF001
+
+        task_overrides: list[Override] = []
+        for override in parsed_overrides:
+            if override.is_hydra_override():
+                sweep_config.hydra.overrides.hydra.append(override.input_line)
+            else:
+                sweep_config.hydra.overrides.task.append(override.input_line)
+                task_overrides.append(override)
+
+        override_dirname_config = sweep_config.hydra.job.config.override_dirname
+        sweep_config.hydra.job.override_dirname = get_overrides_dirname(
+            overrides=task_overrides,
+            kv_sep=override_dirname_config.kv_sep,
+            item_sep=override_dirname_config.item_sep,
+            exclude_keys=override_dirname_config.exclude_keys,
+        )
+        return sweep_config
+
+    def _compose(self, overrides: Sequence[str]) -> DictConfig:
+        """Compose the sweep config of a job."""
+        key: tuple[str, ...] = tuple(overrides)
+        if key in self._composed:
+            return self._composed.pop(key)
+        if self._needs_composition(overrides):
+            return self.config_loader.load_sweep_config(
+                self.master_config,
+                list(overrides),
+            )
+        return self._apply_overrides(overrides)
+
+    def prefetch(self, job_overrides: Sequence[Sequence[str]]) -> None:
+        """Compose the configs of overrides changing config groups up front."""
+        if self.config.processes <= 0:
+            return
+        pending: list[list[str]] = [
+            list(overrides)
+            for overrides in job_overrides
+            if tuple(overrides) not in self._cache
+            and self._needs_composition(overrides)
+        ]
+        if not pending:
+            return
+        with ProcessPoolExecutor(
+            max_workers=self.config.processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                self.config_loader,
+                self.master_config,
+                ConfigStore.instance().repo,
+            ),
+        ) as executor:
+            for overrides, sweep_config in zip(
+                pending,
+                executor.map(_compose_in_worker, pending),
+                strict=True,
+            ):
+                self._composed[tuple(overrides)] = sweep_config
+
+    def compose(self, overrides: Sequence[str]) -> DictConfig:
+        """Get the sweep config of a job, composing it if it is not cached."""
+        key: tuple[str, ...] = tuple(overrides)
+        with self._lock:
+            sweep_config = self._cache.get(key)
+            if sweep_config is None:
+                sweep_config = self._compose(overrides)
+                self._cache[key] = sweep_config
+                if len(self._cache) > self.config.maxsize:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.move_to_end(key)
+
+        # The launcher modifies the returned config, the cached one stays intact
+        sweep_config = copy.deepcopy(sweep_config)
+        OmegaConf.copy_cache(from_config=self.master_config, to_config=sweep_config)
+        return sweep_config
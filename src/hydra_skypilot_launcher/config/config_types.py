@@ -23,38 +23,73 @@
 # limitations under the License.
 """Configuration dataclasses for Hydra SkyPilot Launcher."""
 
-from dataclasses import dataclass, field
+from dataclasses import astuple, dataclass, field
+from enum import Enum
 from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
 
-from sky.data.storage import Storage, StorageMode, StoreType
-from sky.resources import Resources
-from sky.task import Task
+# SkyPilot loads the SDKs of every cloud, it is only imported when converting
+# the configs to SkyPilot objects.
+if TYPE_CHECKING:
+    from sky.data.storage import Storage
+    from sky.resources import Resources
+    from sky.task import Task
 
 __all__ = [
     "FileMount",
     "ResourcesConfig",
+    "SkyObjectCache",
+    "StorageMode",
+    "StoreType",
     "TaskConfig",
 ]
 
 
+class StoreType(Enum):
+    """Storage backend of a bucket, mirroring ``sky.data.storage.StoreType``."""
+
+    S3 = "S3"
+    GCS = "GCS"
+    AZURE = "AZURE"
+    R2 = "R2"
+    IBM = "IBM"
+    OCI = "OCI"
+    NEBIUS = "NEBIUS"
+    COREWEAVE = "COREWEAVE"
+    VASTDATA = "VASTDATA"
+    HF = "HF"
+    VOLUME = "VOLUME"
+
+
+class StorageMode(Enum):
+    """Mode of a file mount, mirroring ``sky.data.storage.StorageMode``."""
+
+    MOUNT = "MOUNT"
+    COPY = "COPY"
+    MOUNT_CACHED = "MOUNT_CACHED"
+
+
 @dataclass
 class FileMount:
     """File mount configuration."""
 
     name: str
-    source: Path
+    source: Path | None
     destination: Path
     store: StoreType | None = None
     mode: StorageMode = StorageMode.MOUNT
     persistent: bool = True
 
-    def to_sky_storage(self) -> Storage:
+    def to_sky_storage(self) -> "Storage":
         """Convert to dictionary representation."""
-        storage = Storage(
+        from sky.data import storage as sky_storage  # noqa: PLC0415
+
+        storage = sky_storage.Storage(
             name=self.name,
-            source=self.source.as_posix(),
-            stores=[self.store] if self.store else None,  # type: ignore[invalid-argument-type]
-            mode=self.mode,
+            source=self.source.as_posix() if self.source else None,
+            stores=[sky_storage.StoreType[self.store.name]] if self.store else None,  # type: ignore[invalid-argument-type]
+            mode=sky_storage.StorageMode[self.mode.name],
             persistent=self.persistent,
         )
         return storage
@@ -62,7 +97,11 @@ class FileMount:
 
 @dataclass
 class ResourcesConfig:
-    """Resources configuration dataclass."""
+    """Resources configuration dataclass.
+
+    The ``infrastructure_candidates`` are tried in order after
+    ``infrastructure`` when it cannot provision the resources.
+    """
 
     infrastructure: str
     cpus: int | str | None = None
@@ -70,17 +109,54 @@ class ResourcesConfig:
     accelerators: str | None = None
     disk_size: int | str | None = None
     use_spot: bool = False
+    infrastructure_candidates: list[str] = field(default_factory=list)
 
-    def to_sky_resources(self) -> Resources:
-        """Convert to SkyPilot Resources object."""
-        return Resources(
-            infra=self.infrastructure,
-            cpus=self.cpus,
-            memory=self.memory,
-            accelerators=self.accelerators,
-            disk_size=self.disk_size,
-            use_spot=self.use_spot,
-        )
+    def to_sky_resources(self) -> "Resources | list[Resources]":
+        """Convert to SkyPilot Resources, an ordered list with candidates."""
+        from sky.resources import Resources  # noqa: PLC0415
+
+        resources: list[Resources] = [
+            Resources(
+                infra=infrastructure,
+                cpus=self.cpus,
+                memory=self.memory,
+                accelerators=self.accelerators,
+                disk_size=self.disk_size,
+                use_spot=self.use_spot,
+            )
+            for infrastructure in [self.infrastructure, *self.infrastructure_candidates]
+        ]
+        return resources[0] if len(resources) == 1 else resources
+
+
+class SkyObjectCache:
+    """SkyPilot resources and storage objects, built once per distinct config.
+
+    Building the objects validates them, a sweep using a few resource shapes
+    and file mounts only builds that many objects.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._resources: dict[str, Resources | list[Resources]] = {}
+        self._storages: dict[str, Storage] = {}
+        self._lock = Lock()
+
+    def get_resources(self, config: ResourcesConfig) -> "Resources | list[Resources]":
+        """Get the SkyPilot resources of a resources config."""
+        key: str = repr(astuple(config))
+        with self._lock:
+            if key not in self._resources:
+                self._resources[key] = config.to_sky_resources()
+            return self._resources[key]
+
+    def get_storage(self, file_mount: FileMount) -> "Storage":
+        """Get the SkyPilot storage of a file mount."""
+        key: str = repr(astuple(file_mount))
+        with self._lock:
+            if key not in self._storages:
+                self._storages[key] = file_mount.to_sky_storage()
+            return self._storages[key]
 
 
 @dataclass
@@ -96,14 +172,25 @@ class TaskConfig:
     setup_commands: str | list[str] | None = None
     run_commands: str | list[str] | None = None
 
-    def to_sky_task(self) -> Task:
-        """Convert to SkyPilot Task object."""
+    def to_sky_task(self, cache: SkyObjectCache | None = None) -> "Task":
+        """Convert to SkyPilot Task object.
+
+        The resources and storage objects are taken from ``cache`` if given.
+        """
+        from sky.task import Task  # noqa: PLC0415
+
         return Task(
             name=self.name,
-            resources=self.resources.to_sky_resources(),
+            resources=(
+                cache.get_resources(self.resources)
+                if cache is not None
+                else self.resources.to_sky_resources()
+            ),
             workdir=self.workdir.as_posix() if self.workdir else None,
             storage_mounts={
-                fm.destination.as_posix(): fm.to_sky_storage()
+                fm.destination.as_posix(): (
+                    cache.get_storage(fm) if cache is not None else fm.to_sky_storage()
+                )
                 for fm in self.file_mounts
             },
             envs=self.env_vars,
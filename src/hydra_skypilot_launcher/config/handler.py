@@ -17,27 +17,79 @@
 # limitations under the License."
 """Configuration output handler."""
 
+import os
 from pathlib import Path
+from typing import Any
 
+import yaml
 from hydra.core.hydra_config import HydraConf, HydraConfig
 from hydra.core.utils import _save_config
 from omegaconf import DictConfig, OmegaConf, open_dict
 
-__all__ = ["handle_output_dir_and_save_configs"]
+__all__ = [
+    "CompactConfigWriter",
+    "apply_config_delta",
+    "get_config_delta",
+    "get_output_dir",
+    "handle_output_dir_and_save_configs",
+    "load_job_config",
+    "rebuild_configs",
+]
+
+DELTA_FILE = "delta.yaml"
+
+
+def get_output_dir(
+    hydra_config: DictConfig,
+    job_dir_key: str = "hydra.sweep.dir",
+    job_subdir_key: str = "hydra.sweep.subdir",
+) -> Path:
+    """Get the output directory of a job.
+
+    Args:
+    ----
+        hydra_config (DictConfig): The hydra sweeper config
+        job_dir_key (str): The key to the output directory
+        job_subdir_key (str): The key to the output subdirectory
+
+    """
+    output_dir: Path = Path(OmegaConf.select(hydra_config, job_dir_key))
+    if job_subdir_key is not None:
+        subdir = Path(OmegaConf.select(hydra_config, job_subdir_key))
+        output_dir = output_dir / subdir
+    return output_dir
+
+
+def _save_container(container: dict[str, Any], filename: str, output_dir: Path) -> None:
+    """Save a config container without converting it to a DictConfig."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with (output_dir / filename).open("w", encoding="utf-8") as file:
+        yaml.safe_dump(container, file, sort_keys=False, allow_unicode=True)
+
+
+def _to_container(config: DictConfig | dict[str, Any]) -> dict[str, Any]:
+    """Get a config as a container, keeping its interpolations unresolved."""
+    if isinstance(config, DictConfig):
+        return OmegaConf.to_container(config, enum_to_str=True)  # type: ignore[invalid-return-type]
+    return config
 
 
 def handle_output_dir_and_save_configs(
     hydra_config: DictConfig,
-    sky_config: DictConfig,
+    sky_config: DictConfig | dict[str, Any],
     job_dir_key: str = "hydra.sweep.dir",
     job_subdir_key: str = "hydra.sweep.subdir",
 ) -> None:
     """Handle output directories and save configs.
 
+    The SkyPilot job config is saved as plain YAML, as its run commands hold
+    shell variables like ``${_hydra_args[@]}`` that OmegaConf would take for
+    interpolations.
+
     Args:
     ----
         hydra_config (DictConfig): The hydra sweeper config
-        sky_config (DictConfig): The SkyPilot job config
+        sky_config (DictConfig | dict): The SkyPilot job config
         job_dir_key (str): The key to the output directory
         job_subdir_key (str): The key to the output subdirectory
 
@@ -47,10 +99,7 @@ def handle_output_dir_and_save_configs(
     # init Hydra config for config evaluation
     HydraConfig.instance().set_config(hydra_config)
 
-    output_dir: Path = Path(OmegaConf.select(hydra_config, job_dir_key))
-    if job_subdir_key is not None:
-        subdir = Path(OmegaConf.select(hydra_config, job_subdir_key))
-        output_dir = output_dir / subdir
+    output_dir: Path = get_output_dir(hydra_config, job_dir_key, job_subdir_key)
 
     # Temporarily allow modification of the read-only config
     with open_dict(hydra_config):
@@ -87,6 +136,250 @@ def handle_output_dir_and_save_configs(
                 filename="overrides.yaml",
                 output_dir=hydra_output,
             )
-            _save_config(sky_config, "sky_job.yaml", hydra_output)
+            _save_container(_to_container(sky_config), "sky_job.yaml", hydra_output)
     finally:
         HydraConfig.instance().cfg = orig_hydra_cfg
+
+
+def _normalize(value: Any) -> Any:  # noqa: ANN401
+    """Normalize a config value to the value it is saved as."""
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def get_config_delta(base: dict[str, Any], config: dict[str, Any]) -> dict[str, Any]:
+    """Get the changes of a config relative to a base config.
+
+    Args:
+    ----
+        base (dict): The base config as a container
+        config (dict): The config as a container
+
+    Returns:
+    -------
+        dict: The changed values under ``set``, nested as in the config, and
+            the key paths of the deleted values under ``deleted``
+
+    """
+    deleted: list[list[Any]] = []
+
+    def get_changes(
+        base: dict[str, Any],
+        config: dict[str, Any],
+        path: list[Any],
+    ) -> dict[str, Any]:
+        changes: dict[str, Any] = {}
+        for key, value in config.items():
+            if key not in base:
+                changes[key] = _normalize(value)
+            elif isinstance(value, dict) and isinstance(base[key], dict):
+                nested_changes = get_changes(base[key], value, [*path, key])
+                if nested_changes:
+                    changes[key] = nested_changes
+            elif _normalize(value) != _normalize(base[key]):
+                changes[key] = _normalize(value)
+        deleted.extend([*path, key] for key in base if key not in config)
+        return changes
+
+    return {"set": get_changes(base, config, []), "deleted": deleted}
+
+
+def apply_config_delta(base: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    """Apply the changes from ``get_config_delta`` to a copy of the base config.
+
+    Args:
+    ----
+        base (dict): The base config as a container
+        delta (dict): The changes relative to the base config
+
+    """
+
+    def apply_changes(base: dict[str, Any], changes: dict[str, Any]) -> dict[str, Any]:
+        config: dict[str, Any] = dict(base)
+        for key, value in changes.items():
+            if isinstance(value, dict) and isinstance(config.get(key), dict):
+                config[key] = apply_changes(config[key], value)
+            else:
+                config[key] = value
+        return config
+
+    config: dict[str, Any] = apply_changes(base, delta.get("set") or {})
+    for path in delta.get("deleted") or []:
+        node: dict[str, Any] = config
+        for key in path[:-1]:
+            node[key] = dict(node[key])
+            node = node[key]
+        node.pop(path[-1], None)
+    return config
+
+
+def _load_container(path: Path) -> dict[str, Any]:
+    """Load a saved config as a container."""
+    return OmegaConf.to_container(OmegaConf.load(path))  # type: ignore[invalid-return-type]
+
+
+def _redact_secrets(config: dict[str, Any]) -> None:
+    """Redact the launcher secrets of a config container in place."""
+    secrets: dict[str, Any] | None = config["hydra"]["launcher"].get("secrets")
+    if secrets:
+        config["hydra"]["launcher"]["secrets"] = dict.fromkeys(secrets, "<redacted>")
+
+
+class CompactConfigWriter:
+    """Writer saving the configs of a sweep as a shared base and per-job deltas.
+
+    The redacted ``config.yaml``, ``hydra.yaml`` and ``sky_job.yaml`` of the
+    first saved job are written once to the output subdir of the sweep. Every
+    job dir holds its ``overrides.yaml`` and a ``delta.yaml`` with the changes
+    of its configs relative to the base, ``rebuild_configs`` restores the
+    full configs of a job.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the compact config writer."""
+        self._bases: dict[Path, dict[str, dict[str, Any]]] = {}
+
+    def _get_base(
+        self,
+        base_dir: Path,
+        config: dict[str, Any],
+        sky_config: dict[str, Any],
+    ) -> dict[str, dict[str, Any]]:
+        """Get the base configs of a sweep, saving them on first use."""
+        if base_dir in self._bases:
+            return self._bases[base_dir]
+        if (base_dir / "config.yaml").exists():
+            base = {
+                "config": _load_container(base_dir / "config.yaml"),
+                "sky_job": _load_container(base_dir / "sky_job.yaml"),
+            }
+        else:
+            base = {"config": config, "sky_job": sky_config}
+            _save_config(OmegaConf.create(config), "config.yaml", base_dir)
+            _save_config(
+                OmegaConf.create({"hydra": config["hydra"]}),
+                "hydra.yaml",
+                base_dir,
+            )
+            _save_container(sky_config, "sky_job.yaml", base_dir)
+        self._bases[base_dir] = base
+        return base
+
+    def save(
+        self,
+        hydra_config: DictConfig,
+        sky_config: DictConfig | dict[str, Any],
+        job_dir_key: str = "hydra.sweep.dir",
+        job_subdir_key: str = "hydra.sweep.subdir",
+    ) -> None:
+        """Set the output directory of a job and save its overrides and deltas.
+
+        Args:
+        ----
+            hydra_config (DictConfig): The hydra sweeper config
+            sky_config (DictConfig | dict): The SkyPilot job config
+            job_dir_key (str): The key to the output directory
+            job_subdir_key (str): The key to the output subdirectory
+
+        """
+        output_dir: Path = get_output_dir(hydra_config, job_dir_key, job_subdir_key)
+        with open_dict(hydra_config):
+            OmegaConf.set_readonly(hydra_config.hydra.runtime, value=False)
+            hydra_config.hydra.runtime.output_dir = str(output_dir.resolve())
+            OmegaConf.set_readonly(hydra_config.hydra.runtime, value=True)
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        if hydra_config.hydra.output_subdir is None:
+            return
+
+        config: dict[str, Any] = OmegaConf.to_container(  # type: ignore[invalid-assignment]
+            hydra_config,
+            enum_to_str=True,
+        )
+        _redact_secrets(config)
+        sky_container: dict[str, Any] = _to_container(sky_config)
+        base_dir: Path = (
+            Path(OmegaConf.select(hydra_config, job_dir_key))
+            / hydra_config.hydra.output_subdir
+        )
+        base = self._get_base(base_dir, config, sky_container)
+
+        hydra_output = output_dir / hydra_config.hydra.output_subdir
+        _save_config(
+            cfg=hydra_config.hydra.overrides.task,
+            filename="overrides.yaml",
+            output_dir=hydra_output,
+        )
+        delta: dict[str, Any] = {
+            "base": os.path.relpath(base_dir.resolve(), hydra_output.resolve()),
+            "config": get_config_delta(base["config"], config),
+            "sky_job": get_config_delta(base["sky_job"], sky_container),
+        }
+        _save_config(OmegaConf.create(delta), DELTA_FILE, hydra_output)
+
+
+def load_job_config(
+    job_output_dir: Path,
+    output_subdir: str = ".hydra",
+) -> dict[str, Any]:
+    """Load the saved config of a job as a container, also from a delta.
+
+    Args:
+    ----
+        job_output_dir (Path): The output directory of the job
+        output_subdir (str): The Hydra output subdirectory of the job
+
+    Returns:
+    -------
+        dict: The config of the job, including its Hydra config
+
+    """
+    hydra_output: Path = job_output_dir / output_subdir
+    if (hydra_output / "config.yaml").exists():
+        return _load_container(hydra_output / "config.yaml")
+    delta: dict[str, Any] = _load_container(hydra_output / DELTA_FILE)
+    return apply_config_delta(
+        _load_container(hydra_output / delta["base"] / "config.yaml"),
+        delta["config"],
+    )
+
+
+def rebuild_configs(
+    job_output_dir: Path,
+    output_subdir: str = ".hydra",
+) -> tuple[DictConfig, dict[str, Any]]:
+    """Rebuild the full configs of a job saved by ``CompactConfigWriter``.
+
+    The ``config.yaml``, ``hydra.yaml`` and ``sky_job.yaml`` of the job are
+    written next to its ``delta.yaml``. The SkyPilot job config is returned
+    and saved as a plain container, as its run commands hold shell variables.
+
+    Args:
+    ----
+        job_output_dir (Path): The output directory of the job
+        output_subdir (str): The Hydra output subdirectory of the job
+
+    Returns:
+    -------
+        tuple[DictConfig, dict]: The config and the SkyPilot job config
+
+    """
+    hydra_output: Path = job_output_dir / output_subdir
+    delta: dict[str, Any] = _load_container(hydra_output / DELTA_FILE)
+    base_dir: Path = hydra_output / delta["base"]
+    config = OmegaConf.create(
+        apply_config_delta(_load_container(base_dir / "config.yaml"), delta["config"]),
+    )
+    sky_config: dict[str, Any] = apply_config_delta(
+        _load_container(base_dir / "sky_job.yaml"),
+        delta["sky_job"],
+    )
+    _save_config(config, "config.yaml", hydra_output)
+    _save_config(OmegaConf.create({"hydra": config.hydra}), "hydra.yaml", hydra_output)
+    _save_container(sky_config, "sky_job.yaml", hydra_output)
+    return config, sky_config
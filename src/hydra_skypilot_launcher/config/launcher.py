@@ -24,20 +24,268 @@
 """Configuration for the Hydra SkyPilot Launcher."""
 
 from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
 
 from hydra_skypilot_launcher.config.config_types import (
     FileMount,
     ResourcesConfig,
+    StoreType,
 )
 
 
+class LaunchBackend(Enum):
+    """Backend used to run the sweep jobs."""
+
+    JOBS = "jobs"
+    POOL = "pool"
+
+
+@dataclass
+class ClusterPoolConfig:
+    """Configuration for the pool of clusters used by the pool backend."""
+
+    size: int = 1
+    name_prefix: str = "hydra-pool"
+    idle_minutes_to_autostop: int | None = 30
+    down: bool = False
+
+
+@dataclass
+class WorkdirSnapshotConfig:
+    """Configuration for the content-addressed snapshot of the workdir.
+
+    Not supported by the pool backend, which always syncs the workdir.
+    """
+
+    enabled: bool = False
+    name_prefix: str = "hydra-workdir"
+    store: StoreType = StoreType.GCS
+    destination: Path = Path("~/hydra_workdir")
+
+
+@dataclass
+class DeltaSyncConfig:
+    """Configuration for the incremental upload of file mount sources."""
+
+    enabled: bool = False
+    workers: int = 8
+
+
+@dataclass
+class SetupCacheConfig:
+    """Configuration for the cache of environments built by the setup commands.
+
+    The cache key is the hash of the ``key_files`` and the setup commands. The
+    ``paths`` built by the setup commands are archived in the bucket.
+    """
+
+    enabled: bool = False
+    bucket: str = "hydra-setup-cache"
+    store: StoreType = StoreType.GCS
+    destination: Path = Path("/hydra_setup_cache")
+    key_files: list[str] = field(default_factory=lambda: ["uv.lock", "pyproject.toml"])
+    paths: list[str] = field(default_factory=lambda: [".venv"])
+
+
+@dataclass
+class ComposeCacheConfig:
+    """Configuration for the cache of composed sweep configs.
+
+    Overrides that change config groups are composed up front in ``processes``
+    worker processes, composing them in the launcher process if it is zero.
+    """
+
+    enabled: bool = False
+    maxsize: int = 1024
+    processes: int = 0
+
+
+@dataclass
+class MonitorConfig:
+    """Configuration for waiting on the launched jobs to finish.
+
+    The poll interval grows by ``backoff`` after every poll without status
+    changes, up to ``max_poll_interval``, and drops back to
+    ``min_poll_interval`` when a job changes status.
+    """
+
+    wait: bool = False
+    min_poll_interval: float = 5.0
+    max_poll_interval: float = 120.0
+    backoff: float = 2.0
+    timeout: float | None = None
+
+
+@dataclass
+class HistoryConfig:
+    """Configuration for the history of provisioning latencies.
+
+    The time from submission until a job runs and its preemptions are
+    recorded per infra, accelerators and spot from the status polls of the
+    monitor, in ``file`` under the cache directory. The infrastructure
+    candidates of the resources are ranked by the median latency of the last
+    ``window`` jobs plus ``preemption_penalty`` seconds per preemption.
+    """
+
+    enabled: bool = False
+    file: str = "provisioning_history.jsonl"
+    window: int = 50
+    preemption_penalty: float = 600.0
+
+
+@dataclass
+class ResultsConfig:
+    """Configuration for collecting the return values of the jobs.
+
+    The jobs write their outputs to the results bucket mounted at
+    ``destination``, including the return value in ``format`` (json or pickle).
+    """
+
+    enabled: bool = False
+    bucket: str = "hydra-results"
+    store: StoreType = StoreType.GCS
+    destination: Path = Path("/hydra_results")
+    format: str = "json"
+
+
+@dataclass
+class ProfilingConfig:
+    """Configuration for timing the phases of launching jobs.
+
+    The per-phase summary and, with ``trace``, a Chrome trace of the phases
+    are written to the sweep directory.
+    """
+
+    enabled: bool = False
+    trace: bool = False
+    summary_file: str = "launch_profile.json"
+    trace_file: str = "launch_trace.json"
+
+
+@dataclass
+class JournalConfig:
+    """Configuration for the journal of submissions in the sweep directory.
+
+    Jobs recorded in the journal are not submitted again when the sweep is
+    rerun with the same sweep directory, they reuse the recorded request id.
+    """
+
+    enabled: bool = False
+    file: str = "submissions.jsonl"
+    fsync_every: int = 32
+    fsync_interval: float = 1.0
+
+
+@dataclass
+class RateLimitConfig:
+    """Configuration for the client-side rate limiting of submissions.
+
+    Submissions are limited to a rate, in submissions per second, with bursts
+    of up to ``burst`` submissions. The rate grows by ``increase`` after every
+    successful submission and is multiplied by ``decrease`` after a failed one
+    or one taking longer than ``slow_seconds``. Submissions refused by the API
+    server, or rejected for its rate or load, are retried up to
+    ``max_retries`` times after a jittered delay of ``base_delay`` seconds,
+    doubling on every retry up to ``max_delay``. ``min_rate`` must be positive
+    and ``burst`` at least 1.
+    """
+
+    enabled: bool = False
+    initial_rate: float = 2.0
+    min_rate: float = 0.1
+    max_rate: float = 50.0
+    burst: int = 4
+    increase: float = 0.5
+    decrease: float = 0.5
+    slow_seconds: float | None = 30.0
+    max_concurrency: int | None = None
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+
+
+@dataclass
+class PlanConfig:
+    """Configuration for planning sweeps without launching them.
+
+    The SkyPilot task of every pack of jobs is built and rendered in
+    ``workers`` threads, as many as processors if zero, and written to
+    ``file`` in the sweep directory. The accelerator hours are estimated from
+    ``job_minutes``, falling back to the job minutes of the packing config.
+    With ``validate`` the sweep config of every job is composed to check its
+    overrides.
+    """
+
+    enabled: bool = False
+    file: str = "sweep_plan.jsonl"
+    workers: int = 0
+    validate: bool = False
+    job_minutes: float | None = None
+
+
+@dataclass
+class StreamingConfig:
+    """Configuration for launching very large sweeps with bounded memory.
+
+    The jobs are encoded, composed and submitted in windows of ``window``
+    tasks. The configs of a job are released once they are saved, its job
+    return only holds the overrides, status, job id and output directory.
+    The sweep configs kept by the compose cache are bounded by its ``maxsize``.
+    """
+
+    enabled: bool = False
+    window: int = 256
+
+
+@dataclass
+class PackingConfig:
+    """Configuration for packing several sweep jobs into one SkyPilot job.
+
+    The pack size is taken from ``job_minutes`` and ``max_pack_minutes`` when
+    both are set and the number of jobs running at the same time on the node
+    from ``job_cpus`` when the node CPU count is known.
+    """
+
+    jobs_per_pack: int = 1
+    parallel_jobs: int = 1
+    job_minutes: float | None = None
+    max_pack_minutes: float | None = None
+    job_cpus: float | None = None
+
+
 @dataclass
 class SkyPilotLauncherConfig:
     """Configuration for HPC submission launcher."""
 
     resources: ResourcesConfig
     _target_: str = "hydra_skypilot_launcher.launcher.SkyPilotLauncher"
+    # Named resources selected by the jobs with +launch.resource_shape=<name>
+    resource_shapes: dict[str, ResourcesConfig] = field(default_factory=dict)
     file_mounts: list[FileMount] = field(default_factory=list)
     env_vars: dict[str, str] = field(default_factory=dict)
     secrets: dict[str, str] = field(default_factory=dict)
     setup_commands: list[str] | None = None
+    max_concurrent_submissions: int = 1
+    packing: PackingConfig = field(default_factory=PackingConfig)
+    backend: LaunchBackend = LaunchBackend.JOBS
+    pool: ClusterPoolConfig = field(default_factory=ClusterPoolConfig)
+    workdir_snapshot: WorkdirSnapshotConfig = field(
+        default_factory=WorkdirSnapshotConfig,
+    )
+    delta_sync: DeltaSyncConfig = field(default_factory=DeltaSyncConfig)
+    setup_cache: SetupCacheConfig = field(default_factory=SetupCacheConfig)
+    compose_cache: ComposeCacheConfig = field(default_factory=ComposeCacheConfig)
+    monitor: MonitorConfig = field(default_factory=MonitorConfig)
+    history: HistoryConfig = field(default_factory=HistoryConfig)
+    results: ResultsConfig = field(default_factory=ResultsConfig)
+    profiling: ProfilingConfig = field(default_factory=ProfilingConfig)
+    journal: JournalConfig = field(default_factory=JournalConfig)
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    plan: PlanConfig = field(default_factory=PlanConfig)
+    streaming: StreamingConfig = field(default_factory=StreamingConfig)
+    # Save a shared base config per sweep and only a delta per job
+    compact_output: bool = False
+    cache_dir: Path = Path("~/.cache/hydra_skypilot_launcher")
+    # Local directory standing in for the buckets, one subdirectory each
+    local_bucket_dir: Path | None = None
@@ -0,0 +1,121 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""File listing and hashing with a size and modification time cache."""
+
+import hashlib
+import json
+import os
+import subprocess  # nosec B404
+from pathlib import Path
+from threading import Lock
+
+__all__ = ["FileHashCache", "list_files"]
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def _hash_file(file_path: Path) -> str:
+    """Compute the SHA-256 hash of a file."""
+    file_hash = hashlib.sha256()
+    with file_path.open("rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def list_files(directory: Path) -> list[str]:
+    """List the files in a directory, skipping files ignored by git.
+
+    Tracked files of submodules are listed as well, git only lists them apart
+    from the untracked files. Falls back to listing every file outside of
+    ``.git`` when the directory is not part of a git repository.
+    """
+    try:
+        output = b"\0".join(
+            subprocess.run(  # noqa: S603  # nosec B603 B607
+                ["git", "ls-files", "-z", *options],  # noqa: S607
+                cwd=directory,
+                capture_output=True,
+                check=True,
+            ).stdout
+            for options in (
+                ("--cached", "--recurse-submodules"),
+                ("--others", "--exclude-standard"),
+            )
+        )
+    except (OSError, subprocess.CalledProcessError):
+        file_names: list[str] = []
+        for root, dir_names, root_file_names in os.walk(directory):
+            if ".git" in dir_names:
+                dir_names.remove(".git")
+            file_names.extend(
+                Path(root, file_name).relative_to(directory).as_posix()
+                for file_name in root_file_names
+            )
+        return sorted(file_names)
+    return sorted(
+        {
+            file_name
+            for file_name in output.decode().split("\0")
+            if file_name and (directory / file_name).is_file()
+        }
+    )
+
+
+class FileHashCache:
+    """Cache of file hashes, invalidated by file size and modification time.
+
+    The cache can be shared by threads, only its entries are locked so files
+    are hashed concurrently.
+    """
+
+    def __init__(self, cache_file: Path) -> None:
+        """Initialize the cache, loading earlier entries from the cache file."""
+        self.cache_file: Path = cache_file.expanduser()
+        self._entries: dict[str, tuple[int, int, str]] = {}
+        self._lock = Lock()
+        if self.cache_file.exists():
+            self._entries = {
+                path: tuple(entry)
+                for path, entry in json.loads(self.cache_file.read_text()).items()
+            }
+
+    def get_hash(self, file_path: Path) -> tuple[int, int, str]:
+        """Get the size, modification time and hash of a file."""
+        key: str = file_path.resolve().as_posix()
+        stat = file_path.stat()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[:2] != (stat.st_size, stat.st_mtime_ns):
+            entry = (stat.st_size, stat.st_mtime_ns, _hash_file(file_path))
+            with self._lock:
+                self._entries[key] = entry
+        return entry
+
+    def save(self) -> None:
+        """Write the cache entries to the cache file."""
+        with self._lock:
+            data: str = json.dumps(self._entries)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_file.write_text(data)
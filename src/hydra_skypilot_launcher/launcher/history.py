@@ -0,0 +1,216 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""History of provisioning latencies to rank infrastructure candidates."""
+
+import json
+import statistics
+import time
+from dataclasses import astuple, dataclass, replace
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from hydra_skypilot_launcher.config.config_types import ResourcesConfig
+from hydra_skypilot_launcher.config.launcher import HistoryConfig
+from hydra_skypilot_launcher.launcher.monitor import JobState, JobStatusUpdate
+
+__all__ = ["ProvisioningHistory"]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+
+@dataclass
+class _SubmittedJob:
+    """Job submitted in this sweep whose provisioning is being observed."""
+
+    submitted_at: float
+    infra: str
+    accelerators: str | None
+    use_spot: bool
+    started: bool = False
+    running: bool = False
+    preemptions: int = 0
+
+
+class ProvisioningHistory:
+    """History of provisioning latencies and preemptions per infrastructure.
+
+    Every job contributes a ``running`` event with the time from submission
+    until it ran and a ``finished`` event with the number of preemptions,
+    keyed by infra, accelerators and spot. The events are appended to a JSONL
+    file, which can be replayed to rank candidates without launching jobs.
+    """
+
+    def __init__(self, config: HistoryConfig, path: Path) -> None:
+        """Initialize the history, loading the recorded events."""
+        self.config: HistoryConfig = config
+        self.path: Path = path.expanduser()
+        self._events: list[dict[str, Any]] = self._load()
+        self._jobs: dict[str, _SubmittedJob] = {}
+        self._ranked: dict[str, ResourcesConfig] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Get the number of recorded events."""
+        return len(self._events)
+
+    def _load(self) -> list[dict[str, Any]]:
+        """Load the recorded events."""
+        events: list[dict[str, Any]] = []
+        if not self.path.exists():
+            return events
+        with self.path.open() as history_file:
+            for line in history_file:
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt history line in '{self.path}'.")  # noqa: G004
+        return events
+
+    def _record(self, event: str, job: _SubmittedJob, **values: float) -> None:
+        """Append an event of a job to the history."""
+        entry: dict[str, Any] = {
+            "event": event,
+            "time": time.time(),
+            "infra": job.infra,
+            "accelerators": job.accelerators,
+            "use_spot": job.use_spot,
+            **values,
+        }
+        self._events.append(entry)
+        self._ranked.clear()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as history_file:
+            history_file.write(json.dumps(entry) + "\n")
+
+    def submit(self, request_id: str, resources: ResourcesConfig) -> None:
+        """Start observing the provisioning of a submitted job."""
+        with self._lock:
+            self._jobs[request_id] = _SubmittedJob(
+                submitted_at=time.time(),
+                infra=resources.infrastructure.lower(),
+                accelerators=resources.accelerators,
+                use_spot=resources.use_spot,
+            )
+
+    def observe(self, request_id: str, status: JobStatusUpdate) -> None:
+        """Record the provisioning events of a polled job status."""
+        with self._lock:
+            job = self._jobs.get(request_id)
+            if job is None:
+                return
+            if status.infra:
+                job.infra = status.infra.lower()
+
+            if not job.started and (
+                status.state is JobState.RUNNING
+                or (status.state.is_terminal and status.started_at)
+            ):
+                job.started = True
+                started_at: float = status.started_at or time.time()
+                self._record(
+                    "running",
+                    job,
+                    latency=max(0.0, started_at - job.submitted_at),
+                )
+            if status.state is JobState.PENDING and job.running:
+                job.preemptions += 1
+            job.running = status.state is JobState.RUNNING
+
+            if status.state.is_terminal:
+                del self._jobs[request_id]
+                if job.started:
+                    self._record(
+                        "finished",
+                        job,
+                        preemptions=max(job.preemptions, status.recoveries),
+                    )
+
+    @staticmethod
+    def _matches(event: dict[str, Any], infra: str, resources: ResourcesConfig) -> bool:
+        """Check whether an event is of an infra and the given resources."""
+        event_infra: str = event["infra"]
+        return (
+            (event_infra == infra or event_infra.startswith(f"{infra}/"))
+            and event["accelerators"] == resources.accelerators
+            and event["use_spot"] == resources.use_spot
+        )
+
+    def get_score(self, infra: str, resources: ResourcesConfig) -> float | None:
+        """Get the expected provisioning time of an infra, None without history.
+
+        The score is the median latency of the last jobs plus the preemption
+        penalty times their mean number of preemptions.
+        """
+        infra = infra.lower()
+        events = [
+            event for event in self._events if self._matches(event, infra, resources)
+        ]
+        latencies: list[float] = [
+            event["latency"] for event in events if event["event"] == "running"
+        ][-self.config.window :]
+        if not latencies:
+            return None
+        preemptions: list[int] = [
+            event["preemptions"] for event in events if event["event"] == "finished"
+        ][-self.config.window :]
+        return statistics.median(latencies) + self.config.preemption_penalty * (
+            statistics.fmean(preemptions) if preemptions else 0.0
+        )
+
+    def rank(self, resources: ResourcesConfig) -> ResourcesConfig:
+        """Order the infrastructure candidates of resources, fastest first.
+
+        Candidates without history are tried first in their configured
+        order, so every candidate gets explored.
+        """
+        if not resources.infrastructure_candidates:
+            return resources
+        key: str = repr(astuple(resources))
+        with self._lock:
+            ranked = self._ranked.get(key)
+            if ranked is None:
+                candidates: list[str] = [
+                    resources.infrastructure,
+                    *resources.infrastructure_candidates,
+                ]
+                scores = {
+                    candidate: self.get_score(candidate, resources)
+                    for candidate in candidates
+                }
+                order: list[str] = sorted(
+                    candidates,
+                    key=lambda candidate: (
+                        scores[candidate] is not None,
+                        scores[candidate] or 0.0,
+                    ),
+                )
+                ranked = replace(
+                    resources,
+                    infrastructure=order[0],
+                    infrastructure_candidates=order[1:],
+                )
+                self._ranked[key] = ranked
+        return ranked
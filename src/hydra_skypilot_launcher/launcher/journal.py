@@ -0,0 +1,140 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Journal of submitted jobs, used to resume interrupted sweeps."""
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from typing import Any, Sequence, TextIO
+
+from hydra_skypilot_launcher.config.config_types import ResourcesConfig
+from hydra_skypilot_launcher.config.launcher import JournalConfig
+
+__all__ = ["SubmissionJournal"]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+
+class SubmissionJournal:
+    """Append-only journal of the submissions of a sweep.
+
+    Every submission is recorded as a JSON line keyed by the hash of its job
+    overrides, resources and run command. Lines are flushed to the file on
+    every record and synced to disk every ``fsync_every`` records or
+    ``fsync_interval`` seconds. A truncated last line, left by a crash while
+    writing, is ignored on load.
+    """
+
+    def __init__(self, config: JournalConfig, path: Path) -> None:
+        """Initialize the journal, loading the submissions recorded before."""
+        self.config: JournalConfig = config
+        self.path: Path = path
+        self._request_ids: dict[str, str] = self._load()
+        self._file: TextIO | None = None
+        self._unsynced: int = 0
+        self._last_sync: float = time.monotonic()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Get the number of recorded submissions."""
+        return len(self._request_ids)
+
+    def _load(self) -> dict[str, str]:
+        """Load the request ids of the recorded submissions."""
+        request_ids: dict[str, str] = {}
+        if not self.path.exists():
+            return request_ids
+        with self.path.open() as journal_file:
+            for line in journal_file:
+                try:
+                    entry: dict[str, Any] = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt journal line in '{self.path}'.")  # noqa: G004
+                    continue
+                request_ids[entry["key"]] = entry["request_id"]
+        return request_ids
+
+    @staticmethod
+    def get_key(
+        job_overrides: Sequence[Sequence[str]],
+        resources: ResourcesConfig,
+        run_command: Sequence[str],
+    ) -> str:
+        """Get the key of a submission from its overrides, resources and command."""
+        payload: str = json.dumps(
+            {
+                "overrides": [list(job_override) for job_override in job_overrides],
+                "resources": asdict(resources),
+                "run": list(run_command),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Get the request id of a recorded submission."""
+        with self._lock:
+            return self._request_ids.get(key)
+
+    def record(self, key: str, request_id: str, job_nums: Sequence[int]) -> None:
+        """Append a submission to the journal."""
+        entry: str = json.dumps(
+            {
+                "key": key,
+                "request_id": request_id,
+                "submitted_at": time.time(),
+                "job_nums": list(job_nums),
+            },
+        )
+        with self._lock:
+            self._request_ids[key] = request_id
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a")
+            self._file.write(f"{entry}\n")
+            self._file.flush()
+            self._unsynced += 1
+            if (
+                self._unsynced >= self.config.fsync_every
+                or time.monotonic() - self._last_sync >= self.config.fsync_interval
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        """Sync the written records to disk."""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def flush(self) -> None:
+        """Sync all records to disk."""
+        with self._lock:
+            self._sync()
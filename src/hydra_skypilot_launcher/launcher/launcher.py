@@ -23,23 +23,86 @@
 # limitations under the License.
 """Launcher Class."""
 
-import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
 from logging import getLogger
 from pathlib import Path
-from typing import Sequence
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
 
 from hydra.core.utils import HydraConfig, JobReturn, JobStatus
 from hydra.plugins.launcher import Launcher
 from hydra.types import HydraContext, TaskFunction
-from omegaconf import DictConfig, OmegaConf, open_dict
-from sky.jobs import launch
+from omegaconf import DictConfig, OmegaConf, open_dict, read_write
 
+from hydra_skypilot_launcher.config.compose import ComposeCache
 from hydra_skypilot_launcher.config.config_types import (
     FileMount,
     ResourcesConfig,
+    SkyObjectCache,
     TaskConfig,
 )
-from hydra_skypilot_launcher.config.handler import handle_output_dir_and_save_configs
+from hydra_skypilot_launcher.config.handler import (
+    CompactConfigWriter,
+    get_output_dir,
+    handle_output_dir_and_save_configs,
+)
+from hydra_skypilot_launcher.config.launcher import (
+    ClusterPoolConfig,
+    ComposeCacheConfig,
+    DeltaSyncConfig,
+    HistoryConfig,
+    JournalConfig,
+    LaunchBackend,
+    MonitorConfig,
+    PackingConfig,
+    PlanConfig,
+    ProfilingConfig,
+    RateLimitConfig,
+    ResultsConfig,
+    SetupCacheConfig,
+    StreamingConfig,
+    WorkdirSnapshotConfig,
+)
+from hydra_skypilot_launcher.launcher.history import ProvisioningHistory
+from hydra_skypilot_launcher.launcher.journal import SubmissionJournal
+from hydra_skypilot_launcher.launcher.monitor import (
+    ClusterJobsStatusBackend,
+    JobMonitor,
+    ManagedJobsStatusBackend,
+    StatusBackend,
+)
+from hydra_skypilot_launcher.launcher.overrides import (
+    EncodedJob,
+    OverrideEncoder,
+    get_run_command,
+)
+from hydra_skypilot_launcher.launcher.packing import (
+    get_job_id,
+    get_job_id_override,
+    get_pack_id,
+    get_pack_size,
+    get_packed_run_command,
+    get_parallel_jobs,
+)
+from hydra_skypilot_launcher.launcher.plan import PlannedTask, SweepPlanner
+from hydra_skypilot_launcher.launcher.pool import ClusterPool
+from hydra_skypilot_launcher.launcher.profiling import PhaseProfiler
+from hydra_skypilot_launcher.launcher.results import (
+    LaunchedJobReturn,
+    ResultReader,
+    ResultStream,
+)
+from hydra_skypilot_launcher.launcher.setup_cache import SetupCache
+from hydra_skypilot_launcher.launcher.shapes import ResourceShapes
+from hydra_skypilot_launcher.launcher.snapshot import WorkdirSnapshot
+from hydra_skypilot_launcher.launcher.sync import Bucket, DeltaSync, get_bucket
+from hydra_skypilot_launcher.launcher.throttle import SubmissionThrottle
+
+if TYPE_CHECKING:
+    from sky.task import Task
 
 __all__ = ["SkyPilotLauncher"]
 
@@ -52,17 +115,136 @@ class SkyPilotLauncher(Launcher):
     def __init__(
         self,
         resources: ResourcesConfig,
+        resource_shapes: dict[str, ResourcesConfig] | None = None,
         file_mounts: list[FileMount] | None = None,
         env_vars: dict[str, str] | None = None,
         secrets: dict[str, str] | None = None,
         setup_commands: list[str] | None = None,
+        max_concurrent_submissions: int = 1,
+        packing: PackingConfig | None = None,
+        backend: LaunchBackend = LaunchBackend.JOBS,
+        pool: ClusterPoolConfig | None = None,
+        workdir_snapshot: WorkdirSnapshotConfig | None = None,
+        delta_sync: DeltaSyncConfig | None = None,
+        setup_cache: SetupCacheConfig | None = None,
+        compose_cache: ComposeCacheConfig | None = None,
+        monitor: MonitorConfig | None = None,
+        history: HistoryConfig | None = None,
+        results: ResultsConfig | None = None,
+        profiling: ProfilingConfig | None = None,
+        journal: JournalConfig | None = None,
+        rate_limit: RateLimitConfig | None = None,
+        plan: PlanConfig | None = None,
+        streaming: StreamingConfig | None = None,
+        compact_output: bool = False,
+        cache_dir: Path = Path("~/.cache/hydra_skypilot_launcher"),
+        local_bucket_dir: Path | None = None,
     ) -> None:
         """Initialize the SkyPilot Launcher."""
         self.resources: ResourcesConfig = OmegaConf.to_object(resources)
+        self.resource_shapes: dict[str, ResourcesConfig] = (
+            OmegaConf.to_object(resource_shapes) or {}
+        )
+        self._resource_shapes = ResourceShapes(self.resources, self.resource_shapes)
+        self._sky_objects = SkyObjectCache()
         self.file_mounts: list[FileMount] = OmegaConf.to_object(file_mounts) or []
         self.env_vars: dict[str, str] = OmegaConf.to_object(env_vars) or {}
         self.secrets: dict[str, str] = OmegaConf.to_object(secrets) or {}
         self.setup_commands: list[str] | None = OmegaConf.to_object(setup_commands)
+        self.max_concurrent_submissions: int = max(1, max_concurrent_submissions)
+        self.packing: PackingConfig = (
+            OmegaConf.to_object(packing) if packing else PackingConfig()
+        )
+        self.backend: LaunchBackend = LaunchBackend(backend)
+        self.pool: ClusterPoolConfig = (
+            OmegaConf.to_object(pool) if pool else ClusterPoolConfig()
+        )
+        self._cluster_pool: ClusterPool | None = None
+        self.cache_dir: Path = Path(cache_dir)
+        self.workdir_snapshot: WorkdirSnapshotConfig = (
+            OmegaConf.to_object(workdir_snapshot)
+            if workdir_snapshot
+            else WorkdirSnapshotConfig()
+        )
+        if self.workdir_snapshot.enabled and self.backend is LaunchBackend.POOL:
+            # sky.exec skips the storage mounts, the snapshot mounted when a pool
+            # cluster was brought up would be stale for the later sweeps
+            logger.warning(
+                "The workdir snapshot is not supported by the pool backend, "
+                "the workdir is synced instead.",
+            )
+            self.workdir_snapshot.enabled = False
+        self._workdir_snapshot: WorkdirSnapshot | None = (
+            WorkdirSnapshot(self.workdir_snapshot, self.cache_dir)
+            if self.workdir_snapshot.enabled
+            else None
+        )
+        self._workdir_mount: FileMount | None = None
+        self.delta_sync: DeltaSyncConfig = (
+            OmegaConf.to_object(delta_sync) if delta_sync else DeltaSyncConfig()
+        )
+        self.setup_cache: SetupCacheConfig = (
+            OmegaConf.to_object(setup_cache) if setup_cache else SetupCacheConfig()
+        )
+        self.compose_cache: ComposeCacheConfig = (
+            OmegaConf.to_object(compose_cache)
+            if compose_cache
+            else ComposeCacheConfig()
+        )
+        self._compose_cache: ComposeCache | None = None
+        self.monitor: MonitorConfig = (
+            OmegaConf.to_object(monitor) if monitor else MonitorConfig()
+        )
+        self.history: HistoryConfig = (
+            OmegaConf.to_object(history) if history else HistoryConfig()
+        )
+        self._history: ProvisioningHistory | None = (
+            ProvisioningHistory(self.history, self.cache_dir / self.history.file)
+            if self.history.enabled
+            else None
+        )
+        # Backend polling the job status, replaceable to drive the monitor
+        self.status_backend: StatusBackend | None = None
+        self.results: ResultsConfig = (
+            OmegaConf.to_object(results) if results else ResultsConfig()
+        )
+        self._result_reader: ResultReader | None = None
+        self._result_stream: ResultStream | None = None
+        self.profiling: ProfilingConfig = (
+            OmegaConf.to_object(profiling) if profiling else ProfilingConfig()
+        )
+        self.profiler: PhaseProfiler = PhaseProfiler(self.profiling)
+        self.journal: JournalConfig = (
+            OmegaConf.to_object(journal) if journal else JournalConfig()
+        )
+        self._journal: SubmissionJournal | None = None
+        self.rate_limit: RateLimitConfig = (
+            OmegaConf.to_object(rate_limit) if rate_limit else RateLimitConfig()
+        )
+        self._throttle: SubmissionThrottle | None = (
+            SubmissionThrottle(self.rate_limit) if self.rate_limit.enabled else None
+        )
+        self.plan: PlanConfig = OmegaConf.to_object(plan) if plan else PlanConfig()
+        self._planned_tasks: int = 0
+        self._override_encoder = OverrideEncoder()
+        self.streaming: StreamingConfig = (
+            OmegaConf.to_object(streaming) if streaming else StreamingConfig()
+        )
+        self.compact_output: bool = compact_output
+        self._compact_writer: CompactConfigWriter | None = (
+            CompactConfigWriter() if compact_output else None
+        )
+        self.local_bucket_dir: Path | None = (
+            Path(local_bucket_dir) if local_bucket_dir else None
+        )
+        self._bucket: Bucket | None = None
+        # File mounts and setup commands of the current sweep
+        self._file_mounts: list[FileMount] = self.file_mounts
+        self._setup_commands: list[str] | None = self.setup_commands
+
+        # The Hydra config singleton is global state, composing and saving the
+        # sweep configs of concurrently submitted jobs must not interleave.
+        self._hydra_config_lock = Lock()
 
     def setup(
         self,
@@ -74,6 +256,12 @@ class SkyPilotLauncher(Launcher):
         self.task_function: TaskFunction = task_function
         self.config = config
         self.hydra_context = hydra_context
+        if self.compose_cache.enabled:
+            self._compose_cache = ComposeCache(
+                self.compose_cache,
+                hydra_context.config_loader,
+                config,
+            )
 
     def _get_job_name(self, initial_job_idx: int, idx: int) -> str:
         """Get the job name based on the task function name and job index."""
@@ -85,135 +273,668 @@ class SkyPilotLauncher(Launcher):
             job_name = f"{self.task_function.__name__}_{initial_job_idx + idx}"
         return job_name
 
-    def _get_job_script(self, job_override: Sequence[str]) -> Path:
-        """Get the job script path."""
-        job_script: Path = Path(sys.argv[0])
-        if any("+launch.script=" in arg for arg in job_override):
-            job_script = Path(
-                next(arg for arg in job_override if "+launch.script=" in arg).split(
-                    "=",
-                    1,
-                )[1],
-            )
-            job_override.pop(  # type: ignore[unresolved-attribute]
-                job_override.index(
-                    next(arg for arg in job_override if "+launch.script=" in arg),
-                ),
+    def _load_sweep_config(self, job_override: Sequence[str]) -> DictConfig:
+        """Compose the sweep config of a job, using the cache if enabled."""
+        with self.profiler.phase("load_sweep_config"):
+            if self._compose_cache is not None:
+                return self._compose_cache.compose(job_override)
+            return self.hydra_context.config_loader.load_sweep_config(
+                self.config,
+                list(job_override),
             )
-        if job_script.suffix == "" and job_script.resolve().parent.name == "bin":
-            job_script = Path(job_script.name)
-        return job_script
-
-    def _format_overrides(self, job_override: Sequence[str]) -> list[str]:
-        """Format the overrides for command line usage."""
-        # Reformat string overrides to handle spaces in the values
-        overrides_list: list[str] = []
-        launch_command_overrides: list[str] = []
-        for override in job_override:
-            if (
-                "\\" not in override
-                and "$" not in override
-                and "+launch" not in override
-            ):
-                overrides_list.append(override)
-                continue
-
-            override_key, override_value = override.split("=", 1)
-            override_value = override_value.replace("\\", "")
-
-            if "(" in override_value:
-                override_value = override_value.replace("(", "\\(")
-            if ")" in override_value:
-                override_value = override_value.replace(")", "\\)")
-            if "{" in override_value:
-                override_value = override_value.replace("{", "\\{")
-            if "}" in override_value:
-                override_value = override_value.replace("}", "\\}")
-            if "$" in override_value:
-                override_value = override_value.replace("$", "\\\\\\\\$")
-
-            # Handle launch command overrides
-            if "+launch" in override_key:
-                override_key = override_key.replace("+launch.", "").replace(
-                    "+launch/",
-                    "",
-                )
-                launch_command_overrides.append(
-                    f'{override_key}=\\"{override_value}\\"',
-                )
-                continue
-            overrides_list.append(f'{override_key}=\\"{override_value}\\"')
-
-        if launch_command_overrides:
-            overrides_list.append("--")
-            overrides_list.extend(launch_command_overrides)
-        return overrides_list
-
-    def _get_run_command(self, job_override: Sequence[str]) -> list[str]:
-        """Get the run command for the job."""
-        job_script: Path = self._get_job_script(job_override)
-        overrides_list: list[str] = self._format_overrides(job_override)
-        overrides_list = [f"\t{override} \\" for override in overrides_list]
-        if overrides_list:
-            overrides_list[-1] = overrides_list[-1].rstrip(" \\")
-        job_script_str = f"uv run {job_script.as_posix()}"
-        job_script_str += " \\" if overrides_list else ""
-        run_command: list[str] = [job_script_str, *overrides_list]
-        return run_command
 
-    def launch(
-        self,
-        job_overrides: Sequence[Sequence[str]],
-        initial_job_idx: int = 0,
-    ) -> Sequence[JobReturn]:
-        """Launch the jobs with the given overrides."""
-        results: list[JobReturn] = []
-        for idx, job_override in enumerate(job_overrides):
-            job_name: str = self._get_job_name(initial_job_idx, idx)
-            run_command: list[str] = self._get_run_command(job_override)
-            work_dir: Path = Path.cwd()
+    def _get_remote_output_dir(self, output_dir: Path) -> Path:
+        """Get the output directory of a job relative to the remote workdir."""
+        if output_dir.is_absolute() and output_dir.is_relative_to(Path.cwd()):
+            return output_dir.relative_to(Path.cwd())
+        return output_dir
+
+    def _get_bucket(self) -> Bucket:
+        """Get the buckets used by the launcher, creating the client once."""
+        if self._bucket is None:
+            self._bucket = get_bucket(self.local_bucket_dir)
+        return self._bucket
+
+    def _submit(self, skypilot_task: "Task") -> str:
+        """Submit a task to the configured backend."""
+        with self.profiler.phase("submit"):
+            if self._cluster_pool is not None:
+                submit = self._cluster_pool.submit
+            else:
+                from sky.jobs import launch as submit  # noqa: PLC0415
 
-            task_config: TaskConfig = TaskConfig(
+            if self._throttle is not None:
+                return self._throttle.call(submit, skypilot_task)
+            return submit(skypilot_task)
+
+    def _get_task_config(
+        self,
+        job_name: str,
+        run_command: list[str],
+        resources: ResourcesConfig,
+    ) -> TaskConfig:
+        """Get the task configuration of a job."""
+        if self._workdir_snapshot is not None and self._workdir_mount is not None:
+            # Every job runs from the snapshot uploaded for the sweep
+            return TaskConfig(
                 name=job_name,
-                resources=self.resources,
-                workdir=work_dir,
-                file_mounts=self.file_mounts,
+                resources=resources,
+                file_mounts=[self._workdir_mount, *self._file_mounts],
                 env_vars=self.env_vars,
                 secrets=self.secrets,
-                setup_commands=self.setup_commands,
-                run_commands=run_command,
+                setup_commands=self._workdir_snapshot.get_commands(
+                    self._setup_commands,
+                ),
+                run_commands=self._workdir_snapshot.get_commands(run_command),
             )
-            skypilot_task = task_config.to_sky_task()
-            sky_config_dict = skypilot_task.to_yaml_config(use_user_specified_yaml=True)
-            sky_config: DictConfig = OmegaConf.create(sky_config_dict)
 
-            # Launch the job using SkyPilot
-            logger.info(f"Launching job '{job_name}' with SkyPilot...")  # noqa: G004
-            logger.info(f"Run command: {' '.join(run_command)}")  # noqa: G004
-            request_id = launch(skypilot_task)
-            logger.info(f"Job '{job_name}' launched successfully.")  # noqa: G004
+        work_dir: Path = Path.cwd()
+        return TaskConfig(
+            name=job_name,
+            resources=resources,
+            workdir=work_dir,
+            file_mounts=self._file_mounts,
+            env_vars=self.env_vars,
+            secrets=self.secrets,
+            setup_commands=self._setup_commands,
+            run_commands=run_command,
+        )
 
-            # Get the sweeper configuration
-            sweep_config = self.hydra_context.config_loader.load_sweep_config(
-                self.config,
-                list(job_override),
+    def _get_pack_id(self, job_num: int) -> str:
+        """Get the id of the pack starting with a job."""
+        return get_pack_id(str(self.config.hydra.sweep.dir), job_num)
+
+    def _get_extra_overrides(
+        self,
+        job_id: str,
+        output_dir: Path,
+        packed: bool,
+    ) -> list[str]:
+        """Get the overrides added by the launcher to the run command of a job."""
+        extra_overrides: list[str] = [get_job_id_override(job_id)]
+        remote_output_dir: Path = self._get_remote_output_dir(output_dir)
+        if self._result_reader is not None:
+            extra_overrides.extend(self._result_reader.get_overrides(remote_output_dir))
+        elif packed:
+            extra_overrides.append(
+                f'hydra.run.dir="{remote_output_dir.as_posix()}"',
             )
+        return extra_overrides
+
+    def _compose_job(
+        self,
+        job_num: int,
+        job_override: Sequence[str],
+    ) -> tuple[DictConfig, Path]:
+        """Compose the sweep config of a job and get its output directory."""
+        with self._hydra_config_lock:
+            # Get the sweeper configuration
+            sweep_config = self._load_sweep_config(job_override)
             with open_dict(sweep_config):
-                # Assign HPC job id to the sweep configuration
-                sweep_config.hydra.job.id = request_id
+                sweep_config.hydra.job.num = job_num
             HydraConfig.instance().set_config(sweep_config)
+            output_dir = get_output_dir(sweep_config)
+        return sweep_config, output_dir
+
+    def _build_pack(
+        self,
+        jobs: Sequence[tuple[int, EncodedJob]],
+        initial_job_idx: int,
+        parallel_jobs: int,
+        packed: bool,
+        compose: bool = True,
+    ) -> tuple[TaskConfig, list[str], list[DictConfig | None]]:
+        """Build the task config and run command of a pack of jobs.
+
+        Without ``compose`` the sweep configs are only composed when the run
+        command depends on the output directory of the jobs.
+        """
+        job_name: str = self._get_job_name(initial_job_idx, jobs[0][0])
+        if len(jobs) > 1:
+            job_name += f"-{initial_job_idx + jobs[-1][0]}"
+
+        compose = compose or packed or self._result_reader is not None
+        pack_id: str = self._get_pack_id(initial_job_idx + jobs[0][0])
+        sweep_configs: list[DictConfig | None] = []
+        run_commands: list[list[str]] = []
+        for slot, (job_idx, job) in enumerate(jobs):
+            job_id: str = get_job_id(pack_id, slot, packed)
+            extra_overrides: list[str] = [get_job_id_override(job_id)]
+            sweep_config: DictConfig | None = None
+            if compose:
+                sweep_config, output_dir = self._compose_job(
+                    initial_job_idx + job_idx,
+                    job.overrides,
+                )
+                extra_overrides = self._get_extra_overrides(job_id, output_dir, packed)
+            sweep_configs.append(sweep_config)
+            with self.profiler.phase("get_run_command"):
+                run_commands.append(get_run_command(job, extra_overrides))
+
+        run_command: list[str] = run_commands[0]
+        if packed:
+            run_command = get_packed_run_command(run_commands, parallel_jobs)
+
+        resources: ResourcesConfig = self._resource_shapes.get(
+            jobs[0][1].resource_shape,
+            jobs[0][1].resource_overrides,
+        )
+        if self._history is not None:
+            resources = self._history.rank(resources)
+        task_config: TaskConfig = self._get_task_config(
+            job_name,
+            run_command,
+            resources,
+        )
+        return task_config, run_command, sweep_configs
 
-            handle_output_dir_and_save_configs(
-                hydra_config=sweep_config,
-                sky_config=sky_config,
+    def _launch_pack(
+        self,
+        jobs: Sequence[tuple[int, EncodedJob]],
+        initial_job_idx: int,
+        parallel_jobs: int,
+        packed: bool,
+        streaming: bool = False,
+    ) -> list[JobReturn]:
+        """Build, launch and save the configs of a pack of jobs.
+
+        Without packing every pack holds a single job. Packed jobs share one
+        SkyPilot managed job and each gets its own ``hydra.job.id`` of the
+        form ``pack_id:slot`` and its own output directory. The job id is
+        passed to the remote job and the SkyPilot request id is saved next to
+        it as ``hydra.job.request_id``. When ``streaming`` the sweep configs are
+        released once they are saved.
+        """
+        task_config, run_command, sweep_configs = self._build_pack(
+            jobs,
+            initial_job_idx,
+            parallel_jobs,
+            packed,
+        )
+        job_name: str = task_config.name
+        with self.profiler.phase("to_sky_task"):
+            skypilot_task = task_config.to_sky_task(self._sky_objects)
+        with self.profiler.phase("to_yaml_config"):
+            sky_config_dict = skypilot_task.to_yaml_config(
+                use_user_specified_yaml=True,
+            )
+
+        journal_key: str | None = None
+        request_id: str | None = None
+        if self._journal is not None:
+            # Ranking reorders the infrastructure candidates between sweeps
+            journal_key = self._journal.get_key(
+                [job.overrides for _, job in jobs],
+                self._resource_shapes.get(
+                    jobs[0][1].resource_shape,
+                    jobs[0][1].resource_overrides,
+                ),
+                run_command,
             )
+            request_id = self._journal.get(journal_key)
+
+        if request_id is not None:
+            logger.info(
+                f"Job '{job_name}' was already launched as '{request_id}', skipping.",  # noqa: G004
+            )
+            self.profiler.count("resumed_jobs", len(jobs))
+        else:
+            # Launch the job using SkyPilot
+            logger.info(f"Launching job '{job_name}' with SkyPilot...")  # noqa: G004
+            logger.info(f"Run command: {' '.join(run_command)}")  # noqa: G004
+            request_id = self._submit(skypilot_task)
+            logger.info(f"Job '{job_name}' launched successfully.")  # noqa: G004
+            # The job runs from here on, failing bookkeeping must not fail it
+            try:
+                if self._history is not None:
+                    self._history.submit(request_id, task_config.resources)
+                if self._journal is not None and journal_key is not None:
+                    self._journal.record(
+                        journal_key,
+                        request_id,
+                        [initial_job_idx + job_idx for job_idx, _ in jobs],
+                    )
+            except Exception:
+                logger.exception(
+                    f"Failed to record job '{job_name}' launched as '{request_id}'.",  # noqa: G004
+                )
+
+        results: list[JobReturn] = []
+        pack_id: str = self._get_pack_id(initial_job_idx + jobs[0][0])
+        for slot, ((_, job), sweep_config) in enumerate(
+            zip(jobs, sweep_configs, strict=True),
+        ):
+            with self._hydra_config_lock:
+                with (
+                    read_write(sweep_config.hydra),
+                    open_dict(sweep_config.hydra.job),
+                ):
+                    # Assign the ids of the job to the sweep configuration
+                    sweep_config.hydra.job.id = get_job_id(pack_id, slot, packed)
+                    sweep_config.hydra.job.request_id = request_id
+
+                with self.profiler.phase("save_configs"):
+                    self._save_configs(sweep_config, sky_config_dict, request_id)
 
             results.append(
-                JobReturn(
-                    overrides=job_override,
+                LaunchedJobReturn(
+                    overrides=job.overrides,
+                    status=JobStatus.COMPLETED,
+                    working_dir=str(sweep_config.hydra.runtime.output_dir),
+                    job_id=str(sweep_config.hydra.job.id),
+                    request_id=request_id,
+                )
+                if streaming
+                else JobReturn(
+                    overrides=job.overrides,
                     status=JobStatus.COMPLETED,
                     cfg=sweep_config,
                 ),
             )
+        self.profiler.count("launched_jobs", len(jobs))
+        self.profiler.count("launched_tasks")
+        return results
+
+    def _save_configs(
+        self,
+        sweep_config: DictConfig,
+        sky_config: dict[str, Any],
+        request_id: str,
+    ) -> None:
+        """Save the configs of a launched job, logging failures.
+
+        The job is already running, so a failure to save its configs is logged
+        and the job stays launched.
+        """
+        try:
+            if self._compact_writer is not None:
+                self._compact_writer.save(
+                    hydra_config=sweep_config,
+                    sky_config=sky_config,
+                )
+            else:
+                HydraConfig.instance().set_config(sweep_config)
+                handle_output_dir_and_save_configs(
+                    hydra_config=sweep_config,
+                    sky_config=sky_config,
+                )
+        except Exception:
+            logger.exception(
+                f"Failed to save the configs of job '{sweep_config.hydra.job.id}' "  # noqa: G004
+                f"launched as '{request_id}'.",
+            )
 
+    def _try_launch_pack(
+        self,
+        jobs: Sequence[tuple[int, EncodedJob]],
+        initial_job_idx: int,
+        parallel_jobs: int,
+        packed: bool,
+        streaming: bool = False,
+    ) -> list[JobReturn]:
+        """Launch a pack of jobs, reporting failures on its job returns."""
+        try:
+            return self._launch_pack(
+                jobs,
+                initial_job_idx,
+                parallel_jobs,
+                packed,
+                streaming,
+            )
+        except Exception as error:
+            job_indices = [initial_job_idx + job_idx for job_idx, _ in jobs]
+            logger.exception(f"Failed to launch jobs {job_indices}.")  # noqa: G004
+            self.profiler.count("failed_jobs", len(jobs))
+            return [
+                JobReturn(
+                    overrides=job.overrides,
+                    status=JobStatus.FAILED,
+                    _return_value=error,
+                )
+                for _, job in jobs
+            ]
+
+    def _prepare_sweep(self, num_tasks: int, dry_run: bool = False) -> None:
+        """Prepare the resources shared by the tasks launched in one call.
+
+        A dry run prepares the same file mounts and setup commands without
+        uploading anything or querying SkyPilot and the buckets.
+        """
+        if (
+            not dry_run
+            and self.backend is LaunchBackend.POOL
+            and self._cluster_pool is None
+        ):
+            # The pool is brought up once and reused for the rest of the sweep
+            self._cluster_pool = ClusterPool(self.pool)
+            self._cluster_pool.refresh()
+
+        if self.journal.enabled and self._journal is None and not dry_run:
+            sweep_dir = Path(str(self.config.hydra.sweep.dir))
+            self._journal = SubmissionJournal(
+                self.journal, sweep_dir / self.journal.file
+            )
+            if len(self._journal):
+                logger.info(
+                    f"Resuming sweep, {len(self._journal)} submissions are journaled.",  # noqa: G004
+                )
+
+        if self._workdir_snapshot is not None:
+            self._workdir_mount = self._workdir_snapshot.prepare(
+                Path.cwd(),
+                upload=not dry_run,
+            )
+
+        self._file_mounts = self.file_mounts
+        if self.delta_sync.enabled:
+            delta_sync = DeltaSync(self.delta_sync, self.cache_dir, self._get_bucket())
+            self._file_mounts = [
+                (
+                    replace(file_mount, source=None)
+                    if dry_run
+                    else delta_sync.sync(file_mount)
+                )
+                if delta_sync.supports(file_mount)
+                else file_mount
+                for file_mount in self.file_mounts
+            ]
+
+        self._setup_commands = self.setup_commands
+        if self.setup_cache.enabled and self.setup_commands:
+            setup_cache = SetupCache(self.setup_cache, self._get_bucket())
+            key: str = setup_cache.get_key(Path.cwd(), self.setup_commands)
+            if not dry_run:
+                is_cached: bool = setup_cache.is_cached(key)
+                # The archive may be published while the jobs start, every job
+                # logs whether its setup actually hit the cache
+                logger.info(
+                    f"Setup cache '{key}' is "  # noqa: G004
+                    f"{'archived' if is_cached else 'not archived yet'} at launch, "
+                    f"predicting {num_tasks if is_cached else 0} hits and up to "
+                    f"{0 if is_cached else num_tasks} misses.",
+                )
+            self._setup_commands = setup_cache.get_setup_commands(
+                key,
+                self.setup_commands,
+            )
+            self._file_mounts = [setup_cache.get_file_mount(), *self._file_mounts]
+
+        if self.results.enabled:
+            if self._result_reader is None:
+                self._result_reader = ResultReader(self.results, self._get_bucket())
+            self._file_mounts = [
+                self._result_reader.get_file_mount(),
+                *self._file_mounts,
+            ]
+
+    def _prefetch_sweep_configs(self, jobs: Sequence[EncodedJob]) -> None:
+        """Compose the sweep configs of the jobs up front if they are cached."""
+        if self._compose_cache is None:
+            return
+        with self.profiler.phase("prefetch_sweep_configs"):
+            self._compose_cache.prefetch([job.overrides for job in jobs])
+
+    def _iter_windows(
+        self,
+        job_overrides: Sequence[Sequence[str]],
+        pack_size: int,
+        window: int,
+    ) -> Iterator[list[list[tuple[int, EncodedJob]]]]:
+        """Encode the jobs and split them into packs, a window at a time.
+
+        A pack is split where the resource shape of the jobs changes, as the
+        jobs of a pack share the resources of their task.
+        """
+        window_jobs: int = pack_size * max(1, window)
+        for start in range(0, len(job_overrides), window_jobs):
+            with self.profiler.phase("encode_overrides"):
+                encoded_jobs = self._override_encoder.encode_jobs(
+                    job_overrides[start : start + window_jobs],
+                )
+            packs: list[list[tuple[int, EncodedJob]]] = []
+            for job_idx, job in enumerate(encoded_jobs, start):
+                if (
+                    not packs
+                    or len(packs[-1]) >= pack_size
+                    or packs[-1][-1][1].resource_shape != job.resource_shape
+                    or packs[-1][-1][1].resource_overrides != job.resource_overrides
+                ):
+                    packs.append([])
+                packs[-1].append((job_idx, job))
+            yield packs
+
+    def _plan_pack(
+        self,
+        jobs: Sequence[tuple[int, EncodedJob]],
+        initial_job_idx: int,
+        parallel_jobs: int,
+        packed: bool,
+    ) -> tuple[PlannedTask | None, list[JobReturn]]:
+        """Build and render the task of a pack of jobs, reporting failures."""
+        job_nums: list[int] = [initial_job_idx + job_idx for job_idx, _ in jobs]
+        try:
+            task_config, _, sweep_configs = self._build_pack(
+                jobs,
+                initial_job_idx,
+                parallel_jobs,
+                packed,
+                compose=self.plan.validate,
+            )
+            sky_config: dict[str, Any] = task_config.to_sky_task(
+                self._sky_objects,
+            ).to_yaml_config(use_user_specified_yaml=True)
+        except Exception as error:
+            logger.exception(f"Failed to plan jobs {job_nums}.")  # noqa: G004
+            return None, [
+                JobReturn(
+                    overrides=job.overrides,
+                    status=JobStatus.FAILED,
+                    _return_value=error,
+                )
+                for _, job in jobs
+            ]
+
+        planned_task = PlannedTask(
+            job_nums=job_nums,
+            overrides=[job.overrides for _, job in jobs],
+            task_config=task_config,
+            sky_config=sky_config,
+        )
+        return planned_task, [
+            JobReturn(
+                overrides=job.overrides,
+                status=JobStatus.COMPLETED,
+                cfg=sweep_config,
+            )
+            for (_, job), sweep_config in zip(jobs, sweep_configs, strict=True)
+        ]
+
+    def _plan(
+        self,
+        job_overrides: Sequence[Sequence[str]],
+        initial_job_idx: int,
+    ) -> list[JobReturn]:
+        """Render the SkyPilot tasks of the jobs to the plan without launching.
+
+        The tasks are appended to the plan file of the sweep and a summary
+        of the jobs, resource shapes and accelerator hours is logged.
+        """
+        parallel_jobs: int = get_parallel_jobs(self.packing, self.resources)
+        pack_size: int = get_pack_size(self.packing, parallel_jobs)
+        packs = [
+            pack
+            for window in self._iter_windows(
+                job_overrides, pack_size, len(job_overrides)
+            )
+            for pack in window
+        ]
+        with self.profiler.phase("prepare_sweep"):
+            self._prepare_sweep(num_tasks=len(packs), dry_run=True)
+        if self.plan.validate:
+            self._prefetch_sweep_configs([job for pack in packs for _, job in pack])
+
+        plan_pack = partial(
+            self._plan_pack,
+            initial_job_idx=initial_job_idx,
+            parallel_jobs=parallel_jobs,
+            packed=pack_size > 1,
+        )
+        planned_tasks: list[PlannedTask] = []
+        results: list[JobReturn] = []
+        with (
+            self.profiler.phase("build_plan"),
+            ThreadPoolExecutor(
+                max_workers=self.plan.workers or os.cpu_count() or 1,
+                thread_name_prefix="skypilot-plan",
+            ) as executor,
+        ):
+            for planned_task, pack_results in executor.map(plan_pack, packs):
+                if planned_task is not None:
+                    planned_tasks.append(planned_task)
+                results.extend(pack_results)
+
+        sweep_dir = Path(str(self.config.hydra.sweep.dir))
+        planner = SweepPlanner(self.plan, parallel_jobs, self.packing.job_minutes)
+        with self.profiler.phase("write_plan"):
+            summary = planner.plan(
+                planned_tasks,
+                sweep_dir / self.plan.file,
+                append=self._planned_tasks > 0,
+            )
+        self._planned_tasks += len(planned_tasks)
+
+        logger.info(
+            f"Planned {summary['jobs']} jobs in {summary['tasks']} tasks, "  # noqa: G004
+            f"written to '{sweep_dir / self.plan.file}'.",
+        )
+        for shape in summary["resource_shapes"]:
+            logger.info(f"  {shape['tasks']} tasks with {shape['resources']}")  # noqa: G004
+        if summary["accelerator_hours"] is not None:
+            for name, hours in summary["accelerator_hours"].items():
+                logger.info(f"  {hours:.1f} estimated {name} hours")  # noqa: G004
+        self.profiler.save(sweep_dir)
         return results
+
+    def _launch(
+        self,
+        job_overrides: Sequence[Sequence[str]],
+        initial_job_idx: int,
+    ) -> list[JobReturn]:
+        """Launch the jobs with the given overrides without waiting on them.
+
+        Jobs are submitted concurrently when ``max_concurrent_submissions`` is
+        larger than one. The returned job returns keep the order of the
+        overrides and a failed submission is reported on its own job return
+        without aborting the rest of the sweep. With ``streaming`` the jobs are
+        launched a window at a time and get lightweight job returns.
+        """
+        if not job_overrides:
+            return []
+        if self.plan.enabled:
+            return self._plan(job_overrides, initial_job_idx)
+
+        parallel_jobs: int = get_parallel_jobs(self.packing, self.resources)
+        pack_size: int = get_pack_size(self.packing, parallel_jobs)
+        num_tasks: int = -(-len(job_overrides) // pack_size)
+        with self.profiler.phase("prepare_sweep"):
+            self._prepare_sweep(num_tasks=num_tasks)
+        launch_pack = partial(
+            self._try_launch_pack,
+            initial_job_idx=initial_job_idx,
+            parallel_jobs=parallel_jobs,
+            packed=pack_size > 1,
+            streaming=self.streaming.enabled,
+        )
+
+        results: list[JobReturn] = []
+        executor: ThreadPoolExecutor | None = (
+            ThreadPoolExecutor(
+                max_workers=self.max_concurrent_submissions,
+                thread_name_prefix="skypilot-launch",
+            )
+            if self.max_concurrent_submissions > 1
+            else None
+        )
+        try:
+            for packs in self._iter_windows(
+                job_overrides,
+                pack_size,
+                self.streaming.window if self.streaming.enabled else num_tasks,
+            ):
+                self._prefetch_sweep_configs([job for pack in packs for _, job in pack])
+                pack_results = (
+                    executor.map(launch_pack, packs)
+                    if executor is not None
+                    else map(launch_pack, packs)
+                )
+                results.extend(result for pack in pack_results for result in pack)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if self._journal is not None:
+                self._journal.flush()
+
+        # Summaries cover every batch launched in the sweep
+        self.profiler.save(Path(str(self.config.hydra.sweep.dir)))
+        return results
+
+    def launch(
+        self,
+        job_overrides: Sequence[Sequence[str]],
+        initial_job_idx: int = 0,
+    ) -> Sequence[JobReturn]:
+        """Launch the jobs with the given overrides.
+
+        With ``monitor.wait`` the jobs are tracked until they finish, and their
+        job returns get the final status and return value of the jobs.
+        """
+        results = self._launch(job_overrides, initial_job_idx)
+        if self.monitor.wait and not self.plan.enabled:
+            logger.info("Waiting for the launched jobs to finish...")
+            result_stream = self._create_result_stream()
+            result_stream.add(results)
+            for _ in result_stream:
+                pass
+        return results
+
+    def launch_async(
+        self,
+        job_overrides: Sequence[Sequence[str]],
+        initial_job_idx: int = 0,
+    ) -> Sequence[JobReturn]:
+        """Launch the jobs with the given overrides without waiting on them.
+
+        The job returns are yielded by ``result_stream`` as the jobs finish, so
+        a sweeper can launch new jobs while iterating over the results.
+        """
+        results = self._launch(job_overrides, initial_job_idx)
+        self.result_stream.add(results)
+        return results
+
+    @property
+    def result_stream(self) -> ResultStream:
+        """Get the stream of the jobs launched with ``launch_async``."""
+        if self._result_stream is None:
+            self._result_stream = self._create_result_stream()
+        return self._result_stream
+
+    def _create_result_stream(self) -> ResultStream:
+        """Create a stream yielding job returns as the jobs finish."""
+        return ResultStream(
+            JobMonitor(
+                self.monitor,
+                self._get_status_backend(),
+                on_update=self._history.observe if self._history is not None else None,
+            ),
+            self._result_reader,
+        )
+
+    def _get_status_backend(self) -> StatusBackend:
+        """Get the backend polling the status of the launched jobs."""
+        if self.status_backend is None:
+            self.status_backend = (
+                ClusterJobsStatusBackend(self._cluster_pool)
+                if self._cluster_pool is not None
+                else ManagedJobsStatusBackend()
+            )
+        return self.status_backend
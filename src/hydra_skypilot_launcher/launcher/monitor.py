@@ -0,0 +1,289 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tracking of the status of launched jobs."""
+
+import time
+from dataclasses import dataclass
+from enum import Enum
+from logging import getLogger
+from threading import Lock
+from typing import Any, Callable, Iterable, Iterator, Protocol, Sequence
+
+from hydra_skypilot_launcher.config.launcher import MonitorConfig
+from hydra_skypilot_launcher.launcher.pool import ClusterPool
+
+__all__ = [
+    "ClusterJobsStatusBackend",
+    "JobMonitor",
+    "JobState",
+    "JobStatusUpdate",
+    "ManagedJobsStatusBackend",
+    "StatusBackend",
+]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+
+class JobState(Enum):
+    """State of a launched job."""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+    @property
+    def is_terminal(self) -> bool:
+        """Check whether the job finished."""
+        return self in (JobState.SUCCEEDED, JobState.FAILED, JobState.CANCELLED)
+
+    @classmethod
+    def from_status(cls, status: str) -> "JobState":
+        """Get the state of a SkyPilot job or request status."""
+        if status.startswith("FAILED"):
+            return cls.FAILED
+        if status in ("SUCCEEDED", "RUNNING", "CANCELLED"):
+            return cls(status)
+        return cls.PENDING
+
+
+@dataclass
+class JobStatusUpdate:
+    """Status of a launched job.
+
+    The infra the job runs on, the time it started and the number of times
+    it was recovered from preemptions are set when SkyPilot reports them.
+    """
+
+    state: JobState
+    error: str | None = None
+    infra: str | None = None
+    started_at: float | None = None
+    recoveries: int = 0
+
+
+class StatusBackend(Protocol):
+    """Backend querying the status of launched jobs."""
+
+    def poll(self, request_ids: Sequence[str]) -> dict[str, JobStatusUpdate]:
+        """Query the status of the jobs launched by the requests in one batch."""
+        ...
+
+
+class _RequestStatusBackend:
+    """Base for backends resolving launch requests to SkyPilot job ids."""
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        self._job_ids: dict[str, int] = {}
+
+    def _resolve(self, request_ids: Sequence[str]) -> dict[str, JobStatusUpdate]:
+        """Resolve finished launch requests, returning failed or pending ones."""
+        statuses: dict[str, JobStatusUpdate] = {}
+        unresolved = [rid for rid in request_ids if rid not in self._job_ids]
+        if not unresolved:
+            return statuses
+
+        import sky  # noqa: PLC0415
+
+        for payload in sky.api_status(request_ids=unresolved):
+            request_id: str = payload.request_id
+            state = JobState.from_status(str(payload.status))
+            if state is JobState.SUCCEEDED:
+                job_id: Any = sky.get(request_id)[0]
+                self._job_ids[request_id] = (
+                    job_id[0] if isinstance(job_id, list) else job_id
+                )
+            elif state.is_terminal:
+                statuses[request_id] = JobStatusUpdate(
+                    JobState.FAILED,
+                    payload.error or f"Launch request {request_id} {state.value}.",
+                )
+            else:
+                statuses[request_id] = JobStatusUpdate(JobState.PENDING)
+        return statuses
+
+    @staticmethod
+    def _get_update(record: Any) -> JobStatusUpdate:  # noqa: ANN401
+        """Get the status update of a SkyPilot job record."""
+        status = record["status"]
+        state = JobState.from_status(getattr(status, "value", str(status)))
+        error: str | None = None
+        if state is JobState.FAILED:
+            error = record.get("failure_reason") or f"Job {state.value}."
+        return JobStatusUpdate(
+            state,
+            error,
+            infra=record.get("infra"),
+            started_at=record.get("start_at"),
+            recoveries=record.get("recovery_count") or 0,
+        )
+
+
+class ManagedJobsStatusBackend(_RequestStatusBackend):
+    """Status of managed jobs, from one managed job queue query per poll."""
+
+    def poll(self, request_ids: Sequence[str]) -> dict[str, JobStatusUpdate]:
+        """Query the status of the jobs launched by the requests in one batch."""
+        statuses = self._resolve(request_ids)
+        job_ids = {
+            rid: self._job_ids[rid] for rid in request_ids if rid in self._job_ids
+        }
+        if not job_ids:
+            return statuses
+
+        import sky  # noqa: PLC0415
+        from sky.jobs import queue as managed_jobs_queue  # noqa: PLC0415
+
+        records = sky.get(
+            managed_jobs_queue(
+                refresh=False,
+                skip_finished=False,
+                job_ids=list(job_ids.values()),
+            ),
+        )
+        records_by_id = {record["job_id"]: record for record in records}
+        for request_id, job_id in job_ids.items():
+            if job_id in records_by_id:
+                statuses[request_id] = self._get_update(records_by_id[job_id])
+        return statuses
+
+
+class ClusterJobsStatusBackend(_RequestStatusBackend):
+    """Status of jobs on a cluster pool, from one queue query per cluster."""
+
+    def __init__(self, cluster_pool: ClusterPool) -> None:
+        """Initialize the backend."""
+        super().__init__()
+        self.cluster_pool: ClusterPool = cluster_pool
+
+    def poll(self, request_ids: Sequence[str]) -> dict[str, JobStatusUpdate]:
+        """Query the status of the jobs launched by the requests in one batch."""
+        statuses = self._resolve(request_ids)
+        cluster_jobs: dict[str, dict[int, str]] = {}
+        for request_id in request_ids:
+            cluster_name = self.cluster_pool.get_cluster(request_id)
+            if request_id in self._job_ids and cluster_name is not None:
+                cluster_jobs.setdefault(cluster_name, {})[self._job_ids[request_id]] = (
+                    request_id
+                )
+
+        import sky  # noqa: PLC0415
+
+        for cluster_name, request_ids_by_job in cluster_jobs.items():
+            for record in sky.get(sky.queue(cluster_name, skip_finished=False)):
+                request_id = request_ids_by_job.get(record["job_id"])
+                if request_id is not None:
+                    statuses[request_id] = self._get_update(record)
+
+        for request_id, status in statuses.items():
+            if status.state.is_terminal:
+                self.cluster_pool.release(request_id)
+        return statuses
+
+
+class JobMonitor:
+    """Poll the status of launched jobs until they finish.
+
+    All tracked jobs are queried with a single backend call per poll. Jobs can
+    be tracked while the finished ones are being iterated. Every polled status
+    is passed to ``on_update`` if given.
+    """
+
+    def __init__(
+        self,
+        config: MonitorConfig,
+        backend: StatusBackend,
+        on_update: Callable[[str, JobStatusUpdate], None] | None = None,
+    ) -> None:
+        """Initialize the job monitor."""
+        self.config: MonitorConfig = config
+        self.backend: StatusBackend = backend
+        self.on_update: Callable[[str, JobStatusUpdate], None] | None = on_update
+        self._pending: dict[str, JobState] = {}
+        self._lock = Lock()
+
+    def track(self, request_ids: Iterable[str]) -> None:
+        """Start tracking the jobs launched by the requests."""
+        with self._lock:
+            for request_id in request_ids:
+                self._pending.setdefault(request_id, JobState.PENDING)
+
+    def iter_finished(self) -> Iterator[tuple[str, JobStatusUpdate]]:
+        """Yield the tracked jobs as they finish.
+
+        Jobs still running when the timeout expires are not yielded.
+        """
+        deadline: float | None = (
+            time.monotonic() + self.config.timeout
+            if self.config.timeout is not None
+            else None
+        )
+        poll_interval: float = self.config.min_poll_interval
+        while True:
+            with self._lock:
+                request_ids = list(self._pending)
+            if not request_ids:
+                return
+
+            changed: bool = False
+            for request_id, status in self.backend.poll(request_ids).items():
+                if self.on_update is not None:
+                    self.on_update(request_id, status)
+                with self._lock:
+                    previous = self._pending.get(request_id)
+                    if previous is None:
+                        continue
+                    changed |= previous is not status.state
+                    if status.state.is_terminal:
+                        del self._pending[request_id]
+                    else:
+                        self._pending[request_id] = status.state
+                if status.state.is_terminal:
+                    yield request_id, status
+
+            with self._lock:
+                if not self._pending:
+                    return
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning(
+                    f"Stopped waiting on {len(self._pending)} unfinished jobs.",  # noqa: G004
+                )
+                return
+
+            if changed:
+                poll_interval = self.config.min_poll_interval
+            else:
+                poll_interval = min(
+                    poll_interval * self.config.backoff,
+                    self.config.max_poll_interval,
+                )
+            if deadline is not None:
+                poll_interval = min(poll_interval, deadline - time.monotonic())
+            time.sleep(max(0.0, poll_interval))
+
+    def wait(self) -> dict[str, JobStatusUpdate]:
+        """Wait for the tracked jobs to finish."""
+        return dict(self.iter_finished())
@@ -0,0 +1,193 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Encoding of job overrides into the run commands of the remote jobs."""
+
+import shlex
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+__all__ = ["EncodedJob", "OverrideEncoder", "get_job_script", "get_run_command"]
+
+LAUNCH_PREFIX = "+launch"
+LAUNCH_SCRIPT_PREFIX = "+launch.script="
+RESOURCE_SHAPE_PREFIX = "+launch.resource_shape="
+RESOURCES_PREFIX = "+launch.resources."
+# Hydra treats launch/... as a config group, which resources are not
+UNSUPPORTED_RESOURCES_PREFIX = "+launch/resource"
+ARGS_DELIMITER = "HYDRA_ARGS"
+
+
+@dataclass
+class EncodedJob:
+    """Overrides of a job, encoded as the arguments of its run command.
+
+    ``args`` are passed to the job script, ``launch_args`` after ``--``. The
+    resource shape and resource overrides select the resources of the job, they
+    are part of ``overrides`` but not of the arguments.
+    """
+
+    overrides: list[str]
+    script: Path
+    args: list[str]
+    launch_args: list[str]
+    resource_shape: str | None = None
+    resource_overrides: tuple[str, ...] = ()
+
+
+def get_job_script(script: str | None = None) -> Path:
+    """Get the job script, defaulting to the script of the sweep."""
+    job_script: Path = Path(script) if script is not None else Path(sys.argv[0])
+    if job_script.suffix == "" and job_script.resolve().parent.name == "bin":
+        job_script = Path(job_script.name)
+    return job_script
+
+
+class OverrideEncoder:
+    """Single-pass encoder of overrides into run command arguments.
+
+    Overrides are passed to the remote job verbatim, launch overrides only
+    lose the ``+launch`` prefix of their key. Encoded overrides are memoized,
+    as most overrides repeat across the jobs of a sweep.
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        """Initialize the override encoder."""
+        self.maxsize: int = maxsize
+        self._cache: dict[str, tuple[bool, str]] = {}
+
+    def encode(self, override: str) -> tuple[bool, str]:
+        """Encode an override, returning whether it is a launch override."""
+        encoded = self._cache.get(override)
+        if encoded is not None:
+            return encoded
+
+        key, separator, value = override.partition("=")
+        if key.startswith(LAUNCH_PREFIX):
+            key = key.replace("+launch.", "").replace("+launch/", "")
+            encoded = (True, f"{key}{separator}{value}")
+        else:
+            encoded = (False, override)
+
+        if len(self._cache) >= self.maxsize:
+            self._cache.clear()
+        self._cache[override] = encoded
+        return encoded
+
+    def encode_job(self, job_override: Sequence[str]) -> EncodedJob:
+        """Encode the overrides of a job, splitting off its script and resources.
+
+        Resource overrides in the ``+launch/resources`` form are rejected, as
+        they would be passed to the job instead of selecting its resources.
+        """
+        script: str | None = None
+        resource_shape: str | None = None
+        resource_overrides: list[str] = []
+        overrides: list[str] = []
+        args: list[str] = []
+        launch_args: list[str] = []
+        for override in job_override:
+            if override.startswith(UNSUPPORTED_RESOURCES_PREFIX):
+                msg = (
+                    f"Unsupported resource override '{override}', use "
+                    f"'{RESOURCE_SHAPE_PREFIX}<name>' or "
+                    f"'{RESOURCES_PREFIX}<field>=<value>'."
+                )
+                raise ValueError(msg)
+            if override.startswith(LAUNCH_SCRIPT_PREFIX):
+                script = override[len(LAUNCH_SCRIPT_PREFIX) :]
+                continue
+            overrides.append(override)
+            # Resource overrides are kept in the overrides of the job but not
+            # passed to the remote job
+            if override.startswith(RESOURCE_SHAPE_PREFIX):
+                resource_shape = override[len(RESOURCE_SHAPE_PREFIX) :]
+                continue
+            if override.startswith(RESOURCES_PREFIX):
+                resource_overrides.append(override[len(RESOURCES_PREFIX) :])
+                continue
+            is_launch, arg = self.encode(override)
+            (launch_args if is_launch else args).append(arg)
+        return EncodedJob(
+            overrides=overrides,
+            script=get_job_script(script),
+            args=args,
+            launch_args=launch_args,
+            resource_shape=resource_shape,
+            resource_overrides=tuple(resource_overrides),
+        )
+
+    def encode_jobs(self, job_overrides: Sequence[Sequence[str]]) -> list[EncodedJob]:
+        """Encode the overrides of all jobs of a sweep."""
+        return [self.encode_job(job_override) for job_override in job_overrides]
+
+
+def _get_array_args(variable: str, args: Sequence[str]) -> tuple[list[str], list[str]]:
+    """Get the commands reading arguments into an array and the array reference.
+
+    The arguments are written to a quoted heredoc, which the shell does not
+    expand, so they need no escaping. Arguments that cannot be written as a
+    heredoc line are quoted inline instead.
+    """
+    if not args:
+        return [], []
+    if any("\n" in arg or arg == ARGS_DELIMITER for arg in args):
+        return [], [shlex.quote(arg) for arg in args]
+    return (
+        [f"mapfile -t {variable} <<'{ARGS_DELIMITER}'", *args, ARGS_DELIMITER],
+        [f'"${{{variable}[@]}}"'],
+    )
+
+
+def get_run_command(
+    job: EncodedJob,
+    extra_overrides: Sequence[str] = (),
+) -> list[str]:
+    """Get the run command of a job.
+
+    The arguments of the job and the extra overrides are read from heredocs
+    into arrays passed to the job script, so the job gets them verbatim.
+    """
+    args_commands, arguments = _get_array_args(
+        "_hydra_args",
+        [*job.args, *extra_overrides],
+    )
+    launch_commands, launch_arguments = _get_array_args(
+        "_hydra_launch_args",
+        job.launch_args,
+    )
+    if launch_arguments:
+        arguments.extend(["--", *launch_arguments])
+
+    lines: list[str] = [
+        f"uv run {shlex.quote(job.script.as_posix())}",
+        *(f"\t{argument}" for argument in arguments),
+    ]
+    return [
+        *args_commands,
+        *launch_commands,
+        *(f"{line} \\" for line in lines[:-1]),
+        lines[-1],
+    ]
@@ -0,0 +1,117 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Packing of several sweep jobs into a single SkyPilot job."""
+
+import hashlib
+import math
+from typing import Sequence
+
+from hydra_skypilot_launcher.config.config_types import ResourcesConfig
+from hydra_skypilot_launcher.config.launcher import PackingConfig
+
+__all__ = [
+    "get_job_id",
+    "get_job_id_override",
+    "get_pack_id",
+    "get_pack_size",
+    "get_packed_run_command",
+    "get_parallel_jobs",
+]
+
+
+def _get_node_cpus(resources: ResourcesConfig) -> float | None:
+    """Get the number of CPUs of a node, if it is known."""
+    if resources.cpus is None:
+        return None
+    try:
+        return float(str(resources.cpus).rstrip("+"))
+    except ValueError:
+        return None
+
+
+def get_parallel_jobs(packing: PackingConfig, resources: ResourcesConfig) -> int:
+    """Get the number of packed jobs that run at the same time on a node."""
+    node_cpus = _get_node_cpus(resources)
+    if packing.job_cpus and node_cpus:
+        return max(1, math.floor(node_cpus / packing.job_cpus))
+    return max(1, packing.parallel_jobs)
+
+
+def get_pack_size(packing: PackingConfig, parallel_jobs: int) -> int:
+    """Get the number of sweep jobs packed into a single SkyPilot job."""
+    if packing.job_minutes and packing.max_pack_minutes:
+        rounds = max(1, math.floor(packing.max_pack_minutes / packing.job_minutes))
+        return rounds * parallel_jobs
+    return max(1, packing.jobs_per_pack)
+
+
+def get_packed_run_command(
+    run_commands: Sequence[Sequence[str]],
+    parallel_jobs: int,
+) -> list[str]:
+    """Combine the run commands of packed jobs into a single run section.
+
+    At most ``parallel_jobs`` commands run at the same time. A failing command
+    does not stop the remaining ones, but the run section exits with a
+    non-zero status once all of them finished.
+    """
+    packed_command: list[str] = ["_hydra_pids=()"]
+    for run_command in run_commands:
+        packed_command.extend(
+            [
+                f'while [ "$(jobs -rp | wc -l)" -ge {parallel_jobs} ]; do sleep 1; done',
+                *run_command[:-1],
+                f"{run_command[-1]} &",
+                "_hydra_pids+=($!)",
+            ],
+        )
+    packed_command.extend(
+        [
+            "_hydra_failed=0",
+            'for _hydra_pid in "${_hydra_pids[@]}"; do',
+            '\twait "$_hydra_pid" || _hydra_failed=1',
+            "done",
+            "exit $_hydra_failed",
+        ],
+    )
+    return packed_command
+
+
+def get_pack_id(sweep_dir: str, job_num: int) -> str:
+    """Get the id of a pack of jobs, known before the pack is submitted.
+
+    The id is derived from the sweep dir and the number of the first job of
+    the pack, so a resumed sweep assigns the same ids.
+    """
+    return hashlib.sha256(f"{sweep_dir}\0{job_num}".encode()).hexdigest()[:16]
+
+
+def get_job_id(pack_id: str, slot: int, packed: bool) -> str:
+    """Get the ``hydra.job.id`` of a job, ``pack_id:slot`` for packed jobs."""
+    return f"{pack_id}:{slot}" if packed else pack_id
+
+
+def get_job_id_override(job_id: str) -> str:
+    """Get the override giving a job the job id it is saved with."""
+    return f'hydra.job.id="{job_id}"'
@@ -0,0 +1,138 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Dry-run planning of sweeps, rendering the SkyPilot tasks without launching."""
+
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Sequence
+
+from hydra_skypilot_launcher.config.config_types import TaskConfig
+from hydra_skypilot_launcher.config.launcher import PlanConfig
+
+__all__ = ["PlannedTask", "SweepPlanner", "get_accelerators"]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+
+@dataclass
+class PlannedTask:
+    """Task of a pack of jobs planned in a sweep."""
+
+    job_nums: list[int]
+    overrides: list[list[str]]
+    task_config: TaskConfig
+    sky_config: dict[str, Any]
+
+
+def get_accelerators(accelerators: str | dict[str, Any] | None) -> dict[str, float]:
+    """Get the number of accelerators of each type from a resources config."""
+    if not accelerators:
+        return {}
+    if isinstance(accelerators, dict):
+        return {name: float(count or 1) for name, count in accelerators.items()}
+    name, _, count = accelerators.partition(":")
+    return {name: float(count or 1)}
+
+
+class SweepPlanner:
+    """Planner writing the rendered SkyPilot task of every pack of a sweep.
+
+    The tasks are written as one JSON line per task and summarized by their
+    resource shapes and accelerator hours. The planner never contacts
+    SkyPilot or the cloud.
+    """
+
+    def __init__(
+        self,
+        config: PlanConfig,
+        parallel_jobs: int = 1,
+        job_minutes: float | None = None,
+    ) -> None:
+        """Initialize the sweep planner."""
+        self.config: PlanConfig = config
+        self.parallel_jobs: int = max(1, parallel_jobs)
+        self.job_minutes: float | None = config.job_minutes or job_minutes
+
+    def _get_task_hours(self, num_jobs: int) -> float | None:
+        """Estimate the run time of a task in hours."""
+        if self.job_minutes is None:
+            return None
+        return math.ceil(num_jobs / self.parallel_jobs) * self.job_minutes / 60
+
+    def plan(
+        self,
+        tasks: Sequence[PlannedTask],
+        output_file: Path,
+        append: bool = False,
+    ) -> dict[str, Any]:
+        """Write the tasks to the output file and get a summary of the tasks."""
+        shapes: Counter[str] = Counter()
+        accelerator_hours: dict[str, float] = {}
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with output_file.open("a" if append else "w") as plan_file:
+            for task in tasks:
+                sky_config: dict[str, Any] = task.sky_config
+                plan_file.write(
+                    json.dumps(
+                        {
+                            "name": task.task_config.name,
+                            "job_nums": task.job_nums,
+                            "overrides": task.overrides,
+                            "task": sky_config,
+                        },
+                        default=str,
+                    )
+                    + "\n",
+                )
+                resources: dict[str, Any] = sky_config.get("resources") or {}
+                shapes[json.dumps(resources, sort_keys=True, default=str)] += 1
+                task_hours = self._get_task_hours(len(task.job_nums))
+                if task_hours is None:
+                    continue
+                # Tasks with candidate resources are estimated by the first one
+                candidates: list[dict[str, Any]] = resources.get("ordered") or [
+                    resources,
+                ]
+                for name, count in get_accelerators(
+                    candidates[0].get("accelerators"),
+                ).items():
+                    accelerator_hours[name] = (
+                        accelerator_hours.get(name, 0.0) + count * task_hours
+                    )
+
+        return {
+            "jobs": sum(len(task.job_nums) for task in tasks),
+            "tasks": len(tasks),
+            "resource_shapes": [
+                {"resources": json.loads(shape), "tasks": count}
+                for shape, count in shapes.most_common()
+            ],
+            "accelerator_hours": accelerator_hours
+            if self.job_minutes is not None
+            else None,
+        }
@@ -0,0 +1,147 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pool of persistent clusters the sweep jobs are dispatched to."""
+
+from logging import getLogger
+from threading import Event, Lock
+from typing import TYPE_CHECKING
+
+from hydra_skypilot_launcher.config.launcher import ClusterPoolConfig
+
+if TYPE_CHECKING:
+    from sky.task import Task
+
+__all__ = ["ClusterPool"]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+
+class ClusterPool:
+    """Fixed set of named clusters shared by the jobs of a sweep.
+
+    Clusters that are not up yet are brought up by the first job dispatched to
+    them, every later job is submitted with ``sky.exec``. As ``sky.launch`` only
+    schedules the launch, the submission blocks until the cluster is up, and
+    later jobs dispatched to a cluster being brought up wait for it.
+
+    Each job goes to the cluster with the fewest jobs dispatched to it and not
+    yet released. Jobs are released by the status backend as they finish, so
+    without waiting for the jobs the dispatch falls back to round-robin.
+    """
+
+    def __init__(self, config: ClusterPoolConfig) -> None:
+        """Initialize the cluster pool."""
+        self.config: ClusterPoolConfig = config
+        self.cluster_names: list[str] = [
+            f"{config.name_prefix}-{idx}" for idx in range(max(1, config.size))
+        ]
+        self._queue_depths: dict[str, int] = dict.fromkeys(self.cluster_names, 0)
+        self._up_clusters: set[str] = set()
+        self._job_clusters: dict[str, str] = {}
+        self._launches: dict[str, Event] = {}
+        self._lock = Lock()
+
+    def refresh(self) -> None:
+        """Look up which clusters of the pool are already up."""
+        import sky  # noqa: PLC0415
+
+        records = sky.get(sky.status(cluster_names=self.cluster_names))
+        up_clusters = {
+            record["name"]
+            for record in records
+            if record["status"] == sky.ClusterStatus.UP
+        }
+        logger.info(
+            f"Cluster pool: {len(up_clusters)}/{len(self.cluster_names)} clusters up.",  # noqa: G004
+        )
+        with self._lock:
+            self._up_clusters = up_clusters
+
+    def submit(self, task: "Task") -> str:
+        """Submit a task to the least loaded cluster of the pool."""
+        import sky  # noqa: PLC0415
+
+        with self._lock:
+            cluster_name = min(self.cluster_names, key=self._queue_depths.__getitem__)
+            self._queue_depths[cluster_name] += 1
+            bring_up = cluster_name not in self._up_clusters
+            self._up_clusters.add(cluster_name)
+            if bring_up:
+                self._launches[cluster_name] = Event()
+            launch = self._launches.get(cluster_name)
+
+        try:
+            if bring_up:
+                request_id = self._bring_up(task, cluster_name)
+            else:
+                if launch is not None:
+                    launch.wait()
+                with self._lock:
+                    is_up = cluster_name in self._up_clusters
+                if not is_up:
+                    msg = f"Pool cluster '{cluster_name}' failed to come up."
+                    raise RuntimeError(msg)
+                request_id = sky.exec(task, cluster_name=cluster_name)
+        except Exception:
+            with self._lock:
+                self._queue_depths[cluster_name] -= 1
+            raise
+
+        with self._lock:
+            self._job_clusters[request_id] = cluster_name
+        return request_id
+
+    def _bring_up(self, task: "Task", cluster_name: str) -> str:
+        """Launch a task on a cluster, blocking until the cluster is up."""
+        import sky  # noqa: PLC0415
+
+        logger.info(f"Bringing up pool cluster '{cluster_name}'...")  # noqa: G004
+        try:
+            request_id = sky.launch(
+                task,
+                cluster_name=cluster_name,
+                idle_minutes_to_autostop=self.config.idle_minutes_to_autostop,
+                down=self.config.down,
+            )
+            sky.get(request_id)
+        except Exception:
+            with self._lock:
+                self._up_clusters.discard(cluster_name)
+            raise
+        finally:
+            with self._lock:
+                self._launches.pop(cluster_name).set()
+        return request_id
+
+    def get_cluster(self, request_id: str) -> str | None:
+        """Get the name of the cluster a job was dispatched to."""
+        with self._lock:
+            return self._job_clusters.get(request_id)
+
+    def release(self, request_id: str) -> None:
+        """Mark a job as finished, lowering the queue depth of its cluster."""
+        with self._lock:
+            cluster_name = self._job_clusters.pop(request_id, None)
+            if cluster_name is not None:
+                self._queue_depths[cluster_name] -= 1
@@ -0,0 +1,158 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Timing of the phases of launching jobs."""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterator
+
+from hydra_skypilot_launcher.config.launcher import ProfilingConfig
+
+__all__ = ["PhaseProfiler", "PhaseSpan"]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+
+@dataclass
+class PhaseSpan:
+    """Timing of one run of a launch phase."""
+
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+
+
+def _get_percentile(durations: list[int], percentile: float) -> int:
+    """Get the nearest-rank percentile of sorted durations."""
+    rank: int = max(1, math.ceil(len(durations) * percentile / 100))
+    return durations[rank - 1]
+
+
+class PhaseProfiler:
+    """Timers and counters of the phases of launching jobs.
+
+    Spans are recorded from every submission thread and summarised per phase
+    with the p50, p95 and max duration. With ``trace`` the spans are also
+    exported in the Chrome trace event format.
+    """
+
+    def __init__(self, config: ProfilingConfig) -> None:
+        """Initialize the phase profiler."""
+        self.config: ProfilingConfig = config
+        self._spans: list[PhaseSpan] = []
+        self._counters: dict[str, int] = {}
+        self._origin_ns: int = time.perf_counter_ns()
+        self._lock = Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the phase run inside the context."""
+        if not self.config.enabled:
+            yield
+            return
+        start_ns: int = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            span = PhaseSpan(
+                name=name,
+                start_ns=start_ns - self._origin_ns,
+                duration_ns=time.perf_counter_ns() - start_ns,
+                thread_id=threading.get_ident(),
+            )
+            with self._lock:
+                self._spans.append(span)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increase a counter."""
+        if not self.config.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get_summary(self) -> dict[str, Any]:
+        """Get the number of runs and p50, p95, max and total seconds per phase."""
+        with self._lock:
+            spans: list[PhaseSpan] = list(self._spans)
+            counters: dict[str, int] = dict(self._counters)
+
+        durations: dict[str, list[int]] = {}
+        for span in spans:
+            durations.setdefault(span.name, []).append(span.duration_ns)
+
+        phases: dict[str, dict[str, float]] = {}
+        for name, phase_durations in durations.items():
+            phase_durations.sort()
+            phases[name] = {
+                "count": len(phase_durations),
+                "total": sum(phase_durations) / 1e9,
+                "p50": _get_percentile(phase_durations, 50) / 1e9,
+                "p95": _get_percentile(phase_durations, 95) / 1e9,
+                "max": phase_durations[-1] / 1e9,
+            }
+        return {"phases": phases, "counters": counters}
+
+    def get_trace(self) -> dict[str, Any]:
+        """Get the spans as Chrome trace events, in microseconds."""
+        with self._lock:
+            spans: list[PhaseSpan] = list(self._spans)
+
+        pid: int = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": "launch",
+                    "ph": "X",
+                    "ts": span.start_ns / 1e3,
+                    "dur": span.duration_ns / 1e3,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                }
+                for span in spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def save(self, output_dir: Path) -> None:
+        """Write the summary, and the trace if enabled, to the output directory."""
+        if not self.config.enabled:
+            return
+        output_dir.mkdir(parents=True, exist_ok=True)
+        summary_file: Path = output_dir / self.config.summary_file
+        summary_file.write_text(json.dumps(self.get_summary(), indent=2))
+        logger.info(f"Launch profile saved to '{summary_file}'.")  # noqa: G004
+        if self.config.trace:
+            trace_file: Path = output_dir / self.config.trace_file
+            trace_file.write_text(json.dumps(self.get_trace()))
+            logger.info(f"Launch trace saved to '{trace_file}'.")  # noqa: G004
@@ -0,0 +1,212 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Collection of the return values of finished jobs."""
+
+import json
+import pickle  # nosec B403
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterator, Sequence
+
+from hydra.core.utils import JobReturn, JobStatus
+
+from hydra_skypilot_launcher.callbacks import ERROR_FILE, RETURN_VALUE_FILE
+from hydra_skypilot_launcher.config.config_types import FileMount, StorageMode
+from hydra_skypilot_launcher.config.launcher import ResultsConfig
+from hydra_skypilot_launcher.launcher.monitor import JobMonitor, JobState
+from hydra_skypilot_launcher.launcher.sync import Bucket
+
+__all__ = ["LaunchedJobReturn", "ResultReader", "ResultStream"]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+CALLBACK_NAME = "hydra_skypilot_launcher_results"
+
+
+@dataclass
+class LaunchedJobReturn(JobReturn):
+    """Job return of a launched job without its sweep config.
+
+    The configs of the job are saved in its ``working_dir``.
+    """
+
+    job_id: str | None = None
+    request_id: str | None = None
+
+
+class ResultReader:
+    """Reader of the return values the jobs write to the results bucket."""
+
+    def __init__(self, config: ResultsConfig, bucket: Bucket) -> None:
+        """Initialize the result reader."""
+        self.config: ResultsConfig = config
+        self.bucket: Bucket = bucket
+
+    def get_file_mount(self) -> FileMount:
+        """Get the file mount of the results bucket."""
+        return FileMount(
+            name=self.config.bucket,
+            source=None,
+            destination=self.config.destination,
+            store=self.config.store,
+            mode=StorageMode.MOUNT,
+        )
+
+    @staticmethod
+    def get_bucket_dir(remote_output_dir: Path) -> Path:
+        """Get the directory of a job in the bucket, also for absolute paths."""
+        if remote_output_dir.is_absolute():
+            return remote_output_dir.relative_to(remote_output_dir.anchor)
+        return remote_output_dir
+
+    def get_overrides(self, remote_output_dir: Path) -> list[str]:
+        """Get the overrides making a job write its outputs to the bucket."""
+        callback = f"+hydra.callbacks.{CALLBACK_NAME}"
+        bucket_dir: Path = self.get_bucket_dir(remote_output_dir)
+        run_dir: str = (self.config.destination / bucket_dir).as_posix()
+        return [
+            f"{callback}._target_=hydra_skypilot_launcher.callbacks.ReturnValueCallback",
+            f"{callback}.format={self.config.format}",
+            f'hydra.run.dir="{run_dir}"',
+        ]
+
+    def read_result(self, remote_output_dir: Path) -> tuple[JobStatus | None, Any]:
+        """Read the status and return value or error a job wrote to the bucket.
+
+        The status is None when the job wrote neither, e.g. when it was killed.
+        """
+        bucket_dir: Path = self.get_bucket_dir(remote_output_dir)
+        data = self.bucket.read(
+            self.config.bucket, (bucket_dir / ERROR_FILE).as_posix()
+        )
+        if data is not None:
+            error: dict[str, str] = json.loads(data)
+            return JobStatus.FAILED, RuntimeError(
+                f"{error['type']}: {error['message']}",
+            )
+        key: str = (bucket_dir / RETURN_VALUE_FILE).as_posix()
+        data = self.bucket.read(self.config.bucket, f"{key}.json")
+        if data is not None:
+            return JobStatus.COMPLETED, json.loads(data)
+        data = self.bucket.read(self.config.bucket, f"{key}.pkl")
+        if data is not None:
+            return JobStatus.COMPLETED, pickle.loads(data)  # noqa: S301  # nosec B301
+        return None, None
+
+
+class ResultStream:
+    """Job returns of launched jobs, yielded as the jobs finish.
+
+    Jobs can be added while iterating, which lets adaptive sweepers keep a
+    fixed number of jobs in flight. Jobs that did not finish when the monitor
+    stops waiting are yielded last, failed with a ``TimeoutError``.
+
+    The status of a job is read from the return value or error it wrote to the
+    results bucket, the status of its SkyPilot job is only used for the jobs
+    that wrote neither. This way one failing job of a pack does not fail the
+    other jobs of the pack.
+    """
+
+    def __init__(
+        self,
+        monitor: JobMonitor,
+        reader: ResultReader | None = None,
+    ) -> None:
+        """Initialize the result stream."""
+        self.monitor: JobMonitor = monitor
+        self.reader: ResultReader | None = reader
+        self._job_returns: dict[str, list[JobReturn]] = {}
+        self._lock = Lock()
+
+    def add(self, job_returns: Sequence[JobReturn]) -> None:
+        """Add the job returns of launched jobs to the stream."""
+        request_ids: list[str] = []
+        with self._lock:
+            for job_return in job_returns:
+                request_id: str | None = self._get_request_id(job_return)
+                if job_return.status is not JobStatus.COMPLETED or request_id is None:
+                    continue
+                self._job_returns.setdefault(request_id, []).append(job_return)
+                request_ids.append(request_id)
+        self.monitor.track(request_ids)
+
+    @staticmethod
+    def _get_request_id(job_return: JobReturn) -> str | None:
+        """Get the SkyPilot request of a launched job, None if it was not launched."""
+        if isinstance(job_return, LaunchedJobReturn):
+            return job_return.request_id
+        if not job_return.cfg:
+            return None
+        return job_return.cfg.hydra.job.get("request_id")
+
+    def _get_remote_output_dir(self, job_return: JobReturn) -> Path:
+        """Get the output dir of a job relative to the results bucket."""
+        output_dir = Path(
+            job_return.working_dir  # type: ignore[invalid-argument-type]
+            if isinstance(job_return, LaunchedJobReturn)
+            else job_return.cfg.hydra.runtime.output_dir,  # type: ignore[union-attr]
+        )
+        if output_dir.is_relative_to(Path.cwd()):
+            return output_dir.relative_to(Path.cwd())
+        return output_dir
+
+    def __iter__(self) -> Iterator[JobReturn]:
+        """Yield the job returns of the jobs as they finish."""
+        for request_id, status in self.monitor.iter_finished():
+            with self._lock:
+                job_returns = self._job_returns.pop(request_id, [])
+            for job_return in job_returns:
+                job_status, return_value = (
+                    self.reader.read_result(self._get_remote_output_dir(job_return))
+                    if self.reader is not None
+                    else (None, None)
+                )
+                if job_status is None:
+                    if status.state is JobState.SUCCEEDED:
+                        job_status = JobStatus.COMPLETED
+                        if self.reader is not None:
+                            logger.warning(
+                                f"No return value found for job {request_id}.",  # noqa: G004
+                            )
+                    else:
+                        job_status = JobStatus.FAILED
+                        return_value = RuntimeError(
+                            status.error or f"Job {request_id} {status.state.value}.",
+                        )
+                job_return.status = job_status
+                job_return.return_value = return_value
+                yield job_return
+
+        with self._lock:
+            unfinished: dict[str, list[JobReturn]] = self._job_returns
+            self._job_returns = {}
+        for request_id, job_returns in unfinished.items():
+            for job_return in job_returns:
+                job_return.status = JobStatus.FAILED
+                job_return.return_value = TimeoutError(
+                    f"Job {request_id} did not finish before the monitor timed out.",
+                )
+                yield job_return
@@ -0,0 +1,125 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of the environments built by the setup commands."""
+
+import hashlib
+import shlex
+from logging import getLogger
+from pathlib import Path
+
+from hydra_skypilot_launcher.config.config_types import FileMount, StorageMode
+from hydra_skypilot_launcher.config.launcher import SetupCacheConfig
+from hydra_skypilot_launcher.launcher.sync import Bucket
+
+__all__ = ["SetupCache"]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+
+class SetupCache:
+    """Environments built by the setup commands, archived in a bucket.
+
+    A job whose cache key is archived restores the archive instead of running
+    the setup commands. Otherwise the job runs the setup commands and, only if
+    all of them succeed, archives the result for later jobs. A failing setup
+    command fails the setup of the job. Restored virtual environments link to
+    an interpreter that may not exist on the node, a restore with a broken
+    environment is discarded and the setup commands are run instead. The job
+    logs whether its setup hit or missed the cache.
+
+    The build is not serialized: on a cold cache every job that starts before
+    the archive is published builds the environment itself. The archive is
+    published atomically by the first job to finish and not overwritten.
+    """
+
+    def __init__(self, config: SetupCacheConfig, bucket: Bucket) -> None:
+        """Initialize the setup cache."""
+        self.config: SetupCacheConfig = config
+        self.bucket: Bucket = bucket
+
+    def get_key(self, workdir: Path, setup_commands: list[str]) -> str:
+        """Hash the key files and setup commands into the cache key."""
+        key = hashlib.sha256()
+        for file_name in self.config.key_files:
+            file_path = workdir / file_name
+            if file_path.is_file():
+                key.update(file_name.encode() + b"\0" + file_path.read_bytes())
+        key.update("\n".join(setup_commands).encode())
+        return key.hexdigest()[:32]
+
+    def get_archive_name(self, key: str) -> str:
+        """Get the name of the environment archive of a cache key."""
+        return f"{key}.tar.gz"
+
+    def is_cached(self, key: str) -> bool:
+        """Check whether the environment of a cache key is archived."""
+        return self.bucket.exists(self.config.bucket, self.get_archive_name(key))
+
+    def get_file_mount(self) -> FileMount:
+        """Get the file mount of the cache bucket."""
+        return FileMount(
+            name=self.config.bucket,
+            source=None,
+            destination=self.config.destination,
+            store=self.config.store,
+            mode=StorageMode.MOUNT,
+        )
+
+    def get_setup_commands(self, key: str, setup_commands: list[str]) -> list[str]:
+        """Wrap the setup commands to restore or publish the environment."""
+        archive: str = (self.config.destination / self.get_archive_name(key)).as_posix()
+        paths: str = " ".join(shlex.quote(path) for path in self.config.paths)
+        # The subshell stops at the first failing command. It must not be
+        # part of a condition, where bash ignores ``set -e``
+        return [
+            f"_hydra_archive={shlex.quote(archive)}",
+            "_hydra_restored=0",
+            'if [ -f "$_hydra_archive" ] && tar -xzf "$_hydra_archive"; then',
+            "\t_hydra_restored=1",
+            f"\tfor _hydra_path in {paths}; do",
+            '\t\tif [ -f "$_hydra_path/pyvenv.cfg" ] && '
+            "! \"$_hydra_path/bin/python\" -c '' 2>/dev/null; then",
+            "\t\t\t_hydra_restored=0",
+            "\t\tfi",
+            "\tdone",
+            '\t[ "$_hydra_restored" -eq 1 ] || {',
+            '\t\techo "Setup cache: the restored environment is broken."',
+            f"\t\trm -rf {paths}",
+            "\t}",
+            "fi",
+            'if [ "$_hydra_restored" -eq 1 ]; then',
+            '\techo "Setup cache hit: restored $_hydra_archive."',
+            "else",
+            '\techo "Setup cache miss: running the setup commands."',
+            "\t(",
+            "\t\tset -e",
+            *(f"\t\t{command}" for command in setup_commands),
+            "\t)",
+            '\t[ "$?" -eq 0 ] || exit 1',
+            '\t[ -f "$_hydra_archive" ] || {',
+            f'\t\ttar -czf "$_hydra_archive.$$" {paths} && '
+            'mv "$_hydra_archive.$$" "$_hydra_archive"',
+            '\t} || rm -f "$_hydra_archive.$$"',
+            "fi",
+        ]
@@ -0,0 +1,89 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Resource shapes selected by the jobs of a sweep."""
+
+from threading import Lock
+from typing import Sequence
+
+from omegaconf import OmegaConf
+
+from hydra_skypilot_launcher.config.config_types import ResourcesConfig
+
+__all__ = ["ResourceShapes"]
+
+
+class ResourceShapes:
+    """Resources of the jobs, selected from named shapes with field overrides.
+
+    A job selects a shape with ``+launch.resource_shape=<name>`` and overrides
+    fields of its resources with ``+launch.resources.<field>=<value>``. Jobs
+    without either use the resources of the launcher. The resources of every
+    distinct selection are resolved once. The ``+launch/resources`` form is
+    rejected when the overrides are encoded.
+    """
+
+    def __init__(
+        self,
+        resources: ResourcesConfig,
+        shapes: dict[str, ResourcesConfig],
+    ) -> None:
+        """Initialize the resource shapes."""
+        self.resources: ResourcesConfig = resources
+        self.shapes: dict[str, ResourcesConfig] = shapes
+        self._resolved: dict[tuple[str | None, tuple[str, ...]], ResourcesConfig] = {}
+        self._lock = Lock()
+
+    def _resolve(self, shape: str | None, overrides: Sequence[str]) -> ResourcesConfig:
+        """Resolve the resources of a shape with field overrides."""
+        resources: ResourcesConfig = self.resources
+        if shape is not None:
+            if shape not in self.shapes:
+                msg = (
+                    f"Unknown resource shape '{shape}', "
+                    f"expected one of {sorted(self.shapes)}."
+                )
+                raise ValueError(msg)
+            resources = self.shapes[shape]
+        if not overrides:
+            return resources
+        return OmegaConf.to_object(
+            OmegaConf.merge(
+                OmegaConf.structured(resources),
+                OmegaConf.from_dotlist(list(overrides)),
+            ),
+        )  # type: ignore[invalid-return-type]
+
+    def get(
+        self,
+        shape: str | None = None,
+        overrides: Sequence[str] = (),
+    ) -> ResourcesConfig:
+        """Get the resources of a shape with field overrides."""
+        key = (shape, tuple(overrides))
+        with self._lock:
+            resources = self._resolved.get(key)
+            if resources is None:
+                resources = self._resolve(shape, overrides)
+                self._resolved[key] = resources
+        return resources
@@ -0,0 +1,103 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Content-addressed snapshot of the workdir shared by the jobs of a sweep."""
+
+import hashlib
+import json
+from logging import getLogger
+from pathlib import Path
+
+from hydra_skypilot_launcher.config.config_types import FileMount, StorageMode
+from hydra_skypilot_launcher.config.launcher import WorkdirSnapshotConfig
+from hydra_skypilot_launcher.launcher.hashing import FileHashCache, list_files
+
+__all__ = ["WorkdirSnapshot"]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+
+class WorkdirSnapshot:
+    """Snapshot of the workdir uploaded once to a content-addressed bucket.
+
+    The bucket name is derived from the hash of the files in the workdir, so a
+    snapshot is uploaded only when its content has not been uploaded before.
+    """
+
+    def __init__(self, config: WorkdirSnapshotConfig, cache_dir: Path) -> None:
+        """Initialize the workdir snapshot."""
+        self.config: WorkdirSnapshotConfig = config
+        cache_dir = cache_dir.expanduser()
+        self._hash_cache = FileHashCache(cache_dir / "file_hashes.json")
+        self._uploaded_file: Path = cache_dir / "workdir_snapshots.json"
+
+    def get_digest(self, workdir: Path) -> str:
+        """Hash the files in the workdir that are not ignored by git."""
+        digest = hashlib.sha256()
+        for file_name in list_files(workdir):
+            _, _, file_hash = self._hash_cache.get_hash(workdir / file_name)
+            digest.update(f"{file_name}\0{file_hash}\n".encode())
+        self._hash_cache.save()
+        return digest.hexdigest()
+
+    def _load_uploaded(self) -> set[str]:
+        """Load the names of the snapshots uploaded before."""
+        if not self._uploaded_file.exists():
+            return set()
+        return set(json.loads(self._uploaded_file.read_text()))
+
+    def prepare(self, workdir: Path, upload: bool = True) -> FileMount:
+        """Upload the workdir snapshot if needed and get its file mount."""
+        name: str = f"{self.config.name_prefix}-{self.get_digest(workdir)[:16]}"
+        uploaded: set[str] = self._load_uploaded()
+        if not upload:
+            logger.info(f"Skipping the upload of workdir snapshot '{name}'.")  # noqa: G004
+        elif name in uploaded:
+            logger.info(f"Workdir snapshot '{name}' is already uploaded.")  # noqa: G004
+        else:
+            logger.info(f"Uploading workdir snapshot '{name}'...")  # noqa: G004
+            FileMount(
+                name=name,
+                source=workdir,
+                destination=self.config.destination,
+                store=self.config.store,
+            ).to_sky_storage().construct()
+            uploaded.add(name)
+            self._uploaded_file.parent.mkdir(parents=True, exist_ok=True)
+            self._uploaded_file.write_text(json.dumps(sorted(uploaded)))
+
+        return FileMount(
+            name=name,
+            source=None,
+            destination=self.config.destination,
+            store=self.config.store,
+            mode=StorageMode.COPY,
+        )
+
+    def get_commands(self, commands: str | list[str] | None) -> list[str] | None:
+        """Prefix commands to run from the snapshot instead of the workdir."""
+        if commands is None:
+            return None
+        if isinstance(commands, str):
+            commands = [commands]
+        return [f"cd {self.config.destination.as_posix()}", *commands]
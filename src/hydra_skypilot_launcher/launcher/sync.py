@@ -0,0 +1,327 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Incremental upload of file mount sources to their buckets."""
+
+import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Protocol
+
+from hydra_skypilot_launcher.config.config_types import FileMount, StoreType
+from hydra_skypilot_launcher.config.launcher import DeltaSyncConfig
+from hydra_skypilot_launcher.launcher.hashing import FileHashCache, list_files
+
+if TYPE_CHECKING:
+    from google.cloud.storage import Bucket as GcsBucketHandle
+    from google.cloud.storage import Client as GcsClient
+
+__all__ = [
+    "Bucket",
+    "DeltaSync",
+    "GcsBucket",
+    "LocalBucket",
+    "get_bucket",
+]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+MANIFEST_KEY = ".hydra_skypilot_manifest.json"
+
+Manifest = dict[str, tuple[int, int, str]]
+
+
+class Bucket(Protocol):
+    """Object store holding the content of the file mounts."""
+
+    def exists(self, bucket_name: str, key: str) -> bool:
+        """Check whether an object exists."""
+        ...
+
+    def read(self, bucket_name: str, key: str) -> bytes | None:
+        """Read an object, returning None if it does not exist."""
+        ...
+
+    def write(self, bucket_name: str, key: str, data: bytes) -> None:
+        """Write an object."""
+        ...
+
+    def upload(self, bucket_name: str, key: str, file_path: Path) -> None:
+        """Upload a local file as an object."""
+        ...
+
+    def delete(self, bucket_name: str, key: str) -> None:
+        """Delete an object."""
+        ...
+
+    def list_objects(self, bucket_name: str, prefix: str) -> dict[str, int]:
+        """List the objects under a prefix with their sizes."""
+        ...
+
+    def download(
+        self,
+        bucket_name: str,
+        key: str,
+        file_path: Path,
+        start: int = 0,
+    ) -> None:
+        """Append the bytes of an object from ``start`` on to a local file."""
+        ...
+
+
+class LocalBucket:
+    """Local directory standing in for the buckets, one subdirectory each."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the local bucket."""
+        self.root: Path = root.expanduser()
+
+    def _get_path(self, bucket_name: str, key: str) -> Path:
+        """Get the path of an object."""
+        return self.root / bucket_name / key
+
+    def exists(self, bucket_name: str, key: str) -> bool:
+        """Check whether an object exists."""
+        return self._get_path(bucket_name, key).exists()
+
+    def read(self, bucket_name: str, key: str) -> bytes | None:
+        """Read an object, returning None if it does not exist."""
+        path = self._get_path(bucket_name, key)
+        return path.read_bytes() if path.exists() else None
+
+    def write(self, bucket_name: str, key: str, data: bytes) -> None:
+        """Write an object."""
+        path = self._get_path(bucket_name, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def upload(self, bucket_name: str, key: str, file_path: Path) -> None:
+        """Upload a local file as an object."""
+        path = self._get_path(bucket_name, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(file_path, path)
+
+    def delete(self, bucket_name: str, key: str) -> None:
+        """Delete an object."""
+        self._get_path(bucket_name, key).unlink(missing_ok=True)
+
+    def list_objects(self, bucket_name: str, prefix: str) -> dict[str, int]:
+        """List the objects under a prefix with their sizes."""
+        bucket_dir = self.root / bucket_name
+        search_dir = bucket_dir / prefix.rpartition("/")[0]
+        objects: dict[str, int] = {}
+        if not search_dir.is_dir():
+            return objects
+        for path in search_dir.rglob("*"):
+            key = path.relative_to(bucket_dir).as_posix()
+            if path.is_file() and key.startswith(prefix):
+                objects[key] = path.stat().st_size
+        return objects
+
+    def download(
+        self,
+        bucket_name: str,
+        key: str,
+        file_path: Path,
+        start: int = 0,
+    ) -> None:
+        """Append the bytes of an object from ``start`` on to a local file."""
+        with (
+            self._get_path(bucket_name, key).open("rb") as source,
+            file_path.open("ab") as target,
+        ):
+            source.seek(start)
+            shutil.copyfileobj(source, target)
+
+
+class GcsBucket:
+    """Google Cloud Storage buckets."""
+
+    def __init__(self) -> None:
+        """Initialize the buckets, the client is created on first access."""
+        self._client: GcsClient | None = None
+        self._buckets: dict[str, GcsBucketHandle] = {}
+        self._lock = Lock()
+
+    def _get_bucket(self, bucket_name: str) -> "GcsBucketHandle":
+        """Get a bucket, creating it if it does not exist."""
+        with self._lock:
+            if self._client is None:
+                from google.cloud import storage  # noqa: PLC0415
+
+                self._client = storage.Client()
+            if bucket_name not in self._buckets:
+                self._buckets[bucket_name] = self._client.lookup_bucket(
+                    bucket_name,
+                ) or self._client.create_bucket(bucket_name)
+            return self._buckets[bucket_name]
+
+    def exists(self, bucket_name: str, key: str) -> bool:
+        """Check whether an object exists."""
+        return self._get_bucket(bucket_name).blob(key).exists()
+
+    def read(self, bucket_name: str, key: str) -> bytes | None:
+        """Read an object, returning None if it does not exist."""
+        blob = self._get_bucket(bucket_name).get_blob(key)
+        return blob.download_as_bytes() if blob is not None else None
+
+    def write(self, bucket_name: str, key: str, data: bytes) -> None:
+        """Write an object."""
+        self._get_bucket(bucket_name).blob(key).upload_from_string(data)
+
+    def upload(self, bucket_name: str, key: str, file_path: Path) -> None:
+        """Upload a local file as an object."""
+        self._get_bucket(bucket_name).blob(key).upload_from_filename(file_path)
+
+    def delete(self, bucket_name: str, key: str) -> None:
+        """Delete an object."""
+        blob = self._get_bucket(bucket_name).get_blob(key)
+        if blob is not None:
+            blob.delete()
+
+    def list_objects(self, bucket_name: str, prefix: str) -> dict[str, int]:
+        """List the objects under a prefix with their sizes."""
+        return {
+            blob.name: blob.size
+            for blob in self._get_bucket(bucket_name).list_blobs(prefix=prefix)
+        }
+
+    def download(
+        self,
+        bucket_name: str,
+        key: str,
+        file_path: Path,
+        start: int = 0,
+    ) -> None:
+        """Append the bytes of an object from ``start`` on to a local file."""
+        with file_path.open("ab") as target:
+            self._get_bucket(bucket_name).blob(key).download_to_file(
+                target,
+                start=start or None,
+            )
+
+
+def get_bucket(local_bucket_dir: Path | None) -> Bucket:
+    """Get the buckets, using a local directory as stand-in if given."""
+    if local_bucket_dir is not None:
+        return LocalBucket(local_bucket_dir)
+    return GcsBucket()
+
+
+class DeltaSync:
+    """Upload only the files of a file mount that changed since the last sweep.
+
+    A manifest with the size, modification time and hash of every uploaded
+    file is kept next to the files in the bucket, so a deleted or emptied
+    bucket is uploaded in full. Mounts without changes are not uploaded at
+    all.
+    """
+
+    def __init__(
+        self,
+        config: DeltaSyncConfig,
+        cache_dir: Path,
+        bucket: Bucket,
+    ) -> None:
+        """Initialize the delta sync."""
+        self.config: DeltaSyncConfig = config
+        self._hash_cache = FileHashCache(cache_dir / "file_hashes.json")
+        self.bucket: Bucket = bucket
+
+    def supports(self, file_mount: FileMount) -> bool:
+        """Check whether a file mount can be synced incrementally."""
+        if file_mount.source is None or not file_mount.source.is_dir():
+            return False
+        return isinstance(self.bucket, LocalBucket) or file_mount.store in (
+            None,
+            StoreType.GCS,
+        )
+
+    def _load_manifest(self, name: str) -> Manifest:
+        """Load the manifest of the last upload from the bucket."""
+        data: bytes | None = self.bucket.read(name, MANIFEST_KEY)
+        if data is None:
+            return {}
+        return {key: tuple(entry) for key, entry in json.loads(data).items()}
+
+    def _save_manifest(self, name: str, manifest: Manifest) -> None:
+        """Save the manifest in the bucket."""
+        self.bucket.write(name, MANIFEST_KEY, json.dumps(manifest).encode())
+
+    def sync(self, file_mount: FileMount) -> FileMount:
+        """Upload the changed files of a mount and get the mount of its bucket."""
+        source: Path = file_mount.source  # type: ignore[invalid-assignment]
+        file_names: list[str] = list_files(source)
+        with ThreadPoolExecutor(max_workers=self.config.workers) as executor:
+            manifest: Manifest = dict(
+                zip(
+                    file_names,
+                    executor.map(
+                        self._hash_cache.get_hash,
+                        (source / file_name for file_name in file_names),
+                    ),
+                    strict=True,
+                ),
+            )
+            self._hash_cache.save()
+
+            previous: Manifest = self._load_manifest(file_mount.name)
+            changed: list[str] = [
+                file_name
+                for file_name, entry in manifest.items()
+                if file_name not in previous or previous[file_name][2] != entry[2]
+            ]
+            removed: list[str] = [name for name in previous if name not in manifest]
+            if not changed and not removed:
+                logger.info(
+                    f"File mount '{file_mount.name}' is unchanged, skipping upload.",  # noqa: G004
+                )
+                return replace(file_mount, source=None)
+
+            logger.info(
+                f"Syncing file mount '{file_mount.name}': "  # noqa: G004
+                f"{len(changed)} changed, {len(removed)} removed files.",
+            )
+            list(
+                executor.map(
+                    lambda file_name: self.bucket.upload(
+                        file_mount.name,
+                        file_name,
+                        source / file_name,
+                    ),
+                    changed,
+                ),
+            )
+            list(
+                executor.map(
+                    lambda file_name: self.bucket.delete(file_mount.name, file_name),
+                    removed,
+                ),
+            )
+
+        self._save_manifest(file_mount.name, manifest)
+        return replace(file_mount, source=None)
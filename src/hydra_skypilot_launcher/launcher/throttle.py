@@ -0,0 +1,179 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Client-side rate limiting of job submissions."""
+
+import random
+import time
+from logging import getLogger
+from threading import BoundedSemaphore, Lock
+from typing import Callable, TypeVar
+
+from hydra_skypilot_launcher.config.launcher import RateLimitConfig
+
+__all__ = ["SubmissionThrottle", "is_retryable"]
+
+logger = getLogger("HydraSkyPilotLauncher")
+
+T = TypeVar("T")
+
+# Responses of an API server rejecting a request for its rate or load
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 503})
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Check whether a failed submission surely did not submit the job.
+
+    Only refused connections and responses rejecting the request for its rate
+    or load are retried. Other errors, like a timeout waiting for the response,
+    may have left a submitted job behind, and retrying them would launch it
+    twice. The errors the failure was raised from are checked as well.
+    """
+    pending: list[BaseException] = [error]
+    seen: set[int] = set()
+    while pending:
+        current: BaseException = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, ConnectionRefusedError):
+            return True
+        response = getattr(current, "response", None)
+        if getattr(response, "status_code", None) in RETRYABLE_STATUS_CODES:
+            return True
+        pending.extend(
+            cause
+            for cause in (
+                current.__cause__,
+                current.__context__,
+                getattr(current, "reason", None),
+            )
+            if isinstance(cause, BaseException)
+        )
+    return False
+
+
+class SubmissionThrottle:
+    """Token bucket rate limiter with AIMD backpressure and retries.
+
+    Submissions take a token from a bucket refilled at the current rate. The
+    rate grows by ``increase`` after every fast successful submission and is
+    multiplied by ``decrease`` after a failed or slow one. Submissions failing
+    before they reached the API server are retried after a jittered
+    exponential delay.
+    """
+
+    def __init__(self, config: RateLimitConfig) -> None:
+        """Initialize the submission throttle."""
+        if config.min_rate <= 0 or config.burst < 1:
+            # A zero rate or a bucket holding less than a token never refills
+            msg = (
+                "The rate limit needs a positive min_rate and a burst of at "
+                f"least 1, got min_rate={config.min_rate} and burst={config.burst}."
+            )
+            raise ValueError(msg)
+        self.config: RateLimitConfig = config
+        self._rate: float = min(
+            max(config.initial_rate, config.min_rate), config.max_rate
+        )
+        self._tokens: float = float(config.burst)
+        self._last_refill: float = time.monotonic()
+        self._lock = Lock()
+        self._concurrency: BoundedSemaphore | None = (
+            BoundedSemaphore(config.max_concurrency) if config.max_concurrency else None
+        )
+        self._random = random.Random()  # noqa: S311  # nosec B311
+
+    @property
+    def rate(self) -> float:
+        """Get the current submission rate, in submissions per second."""
+        with self._lock:
+            return self._rate
+
+    def acquire(self) -> None:
+        """Wait for a token of the bucket."""
+        while True:
+            with self._lock:
+                now: float = time.monotonic()
+                self._tokens = min(
+                    float(self.config.burst),
+                    self._tokens + (now - self._last_refill) * self._rate,
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait: float = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def _increase(self) -> None:
+        """Raise the rate additively after a successful submission."""
+        with self._lock:
+            self._rate = min(self.config.max_rate, self._rate + self.config.increase)
+
+    def _decrease(self) -> None:
+        """Cut the rate multiplicatively after a failed or slow submission."""
+        with self._lock:
+            self._rate = max(self.config.min_rate, self._rate * self.config.decrease)
+            logger.info(f"Lowering the submission rate to {self._rate:.2f}/s.")  # noqa: G004
+
+    def get_retry_delay(self, attempt: int) -> float:
+        """Get the jittered exponential delay before a retry."""
+        delay: float = min(self.config.max_delay, self.config.base_delay * 2**attempt)
+        return self._random.uniform(0, delay)
+
+    def call(self, function: Callable[..., T], *args: object, **kwargs: object) -> T:
+        """Call a submission function, throttled and retried on safe failures."""
+        if self._concurrency is not None:
+            self._concurrency.acquire()
+        try:
+            attempt: int = 0
+            while True:
+                self.acquire()
+                start: float = time.monotonic()
+                try:
+                    result: T = function(*args, **kwargs)
+                except Exception as error:
+                    self._decrease()
+                    if attempt >= self.config.max_retries or not is_retryable(error):
+                        raise
+                    delay: float = self.get_retry_delay(attempt)
+                    attempt += 1
+                    logger.warning(
+                        f"Submission failed ({error}), retry {attempt} in {delay:.1f}s...",  # noqa: G004
+                    )
+                    time.sleep(delay)
+                    continue
+
+                latency: float = time.monotonic() - start
+                if (
+                    self.config.slow_seconds is not None
+                    and latency > self.config.slow_seconds
+                ):
+                    self._decrease()
+                else:
+                    self._increase()
+                return result
+        finally:
+            if self._concurrency is not None:
+                self._concurrency.release()
@@ -0,0 +1,135 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Fixtures launching sweeps against a local stand-in for SkyPilot."""
+
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+import pytest
+from hydra import compose, initialize
+from hydra.core.config_store import ConfigStore
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.utils import JobReturn
+from hydra.types import HydraContext
+from hydra.utils import instantiate
+from omegaconf import DictConfig
+
+from hydra_skypilot_launcher.config.config_types import ResourcesConfig
+from hydra_skypilot_launcher.config.launcher import SkyPilotLauncherConfig
+
+LAUNCHER_TARGET = "hydra_skypilot_launcher.launcher.launcher.SkyPilotLauncher"
+
+
+class FakeLaunch:
+    """Stand-in for ``sky.jobs.launch`` recording the submitted tasks."""
+
+    def __init__(self) -> None:
+        """Initialize the stand-in without submissions."""
+        self.tasks: list[Any] = []
+        self.failing_names: set[str] = set()
+        self._lock = Lock()
+
+    def __call__(self, task: Any, *args: Any, **kwargs: Any) -> str:
+        """Submit a task, returning a request id."""
+        if task.name in self.failing_names:
+            msg = f"Simulated launch failure of {task.name}."
+            raise RuntimeError(msg)
+        with self._lock:
+            self.tasks.append(task)
+            return f"req-{len(self.tasks) - 1}"
+
+
+def task_function(cfg: DictConfig) -> None:
+    """Task function of the sweeps, never run by the launcher."""
+
+
+@pytest.fixture
+def fake_launch(monkeypatch: pytest.MonkeyPatch) -> FakeLaunch:
+    """Replace the submission of managed jobs."""
+    from sky import jobs
+
+    launch = FakeLaunch()
+    monkeypatch.setattr(jobs, "launch", launch)
+    return launch
+
+
+@pytest.fixture
+def launch_sweep(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    fake_launch: FakeLaunch,
+) -> Iterator[Callable[..., tuple[Any, Sequence[JobReturn]]]]:
+    """Get a function launching a sweep in a temporary sweep dir."""
+    monkeypatch.chdir(tmp_path)
+    config_store = ConfigStore.instance()
+    config_store.store(
+        group="hydra/launcher",
+        name="skypilot_test",
+        node=SkyPilotLauncherConfig(
+            resources=ResourcesConfig(infrastructure="gcp", cpus=4),
+            _target_=LAUNCHER_TARGET,
+            resource_shapes={"big": ResourcesConfig(infrastructure="aws", cpus=32)},
+            secrets={"TOKEN": "secret"},
+            setup_commands=["uv sync"],
+        ),
+    )
+    config_store.store(group="db", name="a", node={"port": 1})
+    config_store.store(group="db", name="b", node={"port": 2})
+    config_store.store(
+        name="sweep",
+        node={"defaults": ["_self_", {"db": "a"}], "x": 0, "y": "a"},
+    )
+
+    def launch(
+        job_overrides: Sequence[Sequence[str]],
+        *launcher_overrides: str,
+        sweep_dir: Path = tmp_path / "multirun",
+    ) -> tuple[Any, Sequence[JobReturn]]:
+        GlobalHydra.instance().clear()
+        with initialize(version_base=None, config_path=None):
+            master_config: DictConfig = compose(
+                config_name="sweep",
+                overrides=[
+                    "hydra/launcher=skypilot_test",
+                    f"hydra.sweep.dir={sweep_dir}",
+                    f"hydra.launcher.cache_dir={tmp_path / 'cache'}",
+                    *launcher_overrides,
+                ],
+                return_hydra_config=True,
+            )
+            launcher = instantiate(master_config.hydra.launcher)
+            launcher.setup(
+                config=master_config,
+                task_function=task_function,
+                hydra_context=HydraContext(
+                    config_loader=GlobalHydra.instance().config_loader(),
+                    callbacks=None,  # type: ignore[invalid-argument-type]
+                ),
+            )
+            return launcher, launcher.launch(job_overrides, initial_job_idx=0)
+
+    yield launch
+    GlobalHydra.instance().clear()
@@ -0,0 +1,82 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests running the benchmarks on small inputs."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).parents[1] / "benchmarks"
+
+
+def run_benchmark(name: str, *args: str) -> subprocess.CompletedProcess[str]:
+    """Run a benchmark script in a fresh interpreter."""
+    return subprocess.run(
+        [sys.executable, str(BENCHMARKS_DIR / name), *args],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_launch_throughput(tmp_path: Path) -> None:
+    output = tmp_path / "bench.json"
+
+    process = run_benchmark(
+        "launch_throughput.py",
+        "--sizes",
+        "2",
+        "3",
+        "--failure-rate",
+        "1",
+        "--output",
+        str(output),
+    )
+
+    assert process.returncode == 0, process.stderr
+    results = json.loads(output.read_text())["results"]
+    assert [result["config"]["num_jobs"] for result in results] == [2, 3]
+    assert [result["failed_jobs"] for result in results] == [2, 3]
+    assert all(result["jobs_per_second"] > 0 for result in results)
+    assert all(result["peak_rss_bytes"] > 0 for result in results)
+    assert all("submit" in result["profile"]["phases"] for result in results)
+
+
+def test_importing_the_launcher_does_not_load_skypilot(tmp_path: Path) -> None:
+    output = tmp_path / "import_time.json"
+
+    # The budget is left generous, the import time depends on the machine
+    process = run_benchmark(
+        "import_time.py",
+        "--repeats",
+        "1",
+        "--budget",
+        "60",
+        "--output",
+        str(output),
+    )
+
+    assert process.returncode == 0, process.stdout
+    assert json.loads(output.read_text())["sky_modules"] == []
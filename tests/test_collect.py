@@ -0,0 +1,226 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the collection of the outputs and logs of a sweep."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from hydra_skypilot_launcher.collect import LocalLogStore, SweepCollector
+from hydra_skypilot_launcher.launcher.sync import LocalBucket
+
+RESULTS_BUCKET = "results"
+
+
+class RecordingLogStore(LocalLogStore):
+    """Local log store recording the requests it downloaded logs of."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the log store with empty records."""
+        super().__init__(root)
+        self.requests: list[str] = []
+
+    def download(self, request_id: str, local_dir: Path) -> None:
+        """Record and download the logs of a request."""
+        self.requests.append(request_id)
+        super().download(request_id, local_dir)
+
+
+def save_job(
+    sweep_dir: Path,
+    job_num: int,
+    request_id: str,
+    backend: str = "JOBS",
+    results: bool = True,
+) -> Path:
+    """Save the configs of a launched job like the launcher does."""
+    job_dir = sweep_dir / str(job_num)
+    hydra_dir = job_dir / ".hydra"
+    hydra_dir.mkdir(parents=True)
+    config = {
+        "hydra": {
+            "job": {"id": f"pack{job_num}", "request_id": request_id},
+            "runtime": {"output_dir": job_dir.as_posix(), "cwd": "/"},
+            "launcher": {
+                "backend": backend,
+                "results": {"enabled": results, "bucket": RESULTS_BUCKET},
+            },
+        },
+    }
+    (hydra_dir / "config.yaml").write_text(yaml.safe_dump(config))
+    (hydra_dir / "overrides.yaml").write_text(yaml.safe_dump([f"x={job_num}"]))
+    return job_dir
+
+
+def get_bucket_key(job_dir: Path, file_name: str) -> str:
+    """Get the key a job wrote a file of its output dir to."""
+    return (job_dir.relative_to("/") / file_name).as_posix()
+
+
+@pytest.fixture
+def bucket(tmp_path: Path) -> LocalBucket:
+    """Create a local bucket."""
+    return LocalBucket(tmp_path / "buckets")
+
+
+@pytest.fixture
+def log_store(tmp_path: Path) -> RecordingLogStore:
+    """Create a local log store with the logs of two SkyPilot jobs."""
+    for request_id in ("req-0", "req-1"):
+        log_dir = tmp_path / "logs" / request_id
+        log_dir.mkdir(parents=True)
+        (log_dir / "run.log").write_text(request_id)
+    return RecordingLogStore(tmp_path / "logs")
+
+
+def test_collects_files_once(tmp_path: Path, bucket: LocalBucket) -> None:
+    sweep_dir = tmp_path / "multirun"
+    job_dirs = [save_job(sweep_dir, job_num, f"req-{job_num}") for job_num in range(2)]
+    for job_dir in job_dirs:
+        bucket.write(RESULTS_BUCKET, get_bucket_key(job_dir, "metrics.json"), b"{}")
+        bucket.write(RESULTS_BUCKET, get_bucket_key(job_dir, "ckpt/model.pt"), b"pt")
+        bucket.write(RESULTS_BUCKET, get_bucket_key(job_dir, ".hydra/config.yaml"), b"")
+    collector = SweepCollector(bucket, workers=2)
+
+    summary = collector.collect(sweep_dir)
+
+    assert summary["jobs"] == 2
+    assert summary["files"] == 4
+    assert summary["failed"] == 0
+    assert (job_dirs[1] / "ckpt" / "model.pt").read_bytes() == b"pt"
+    # The configs saved at launch are kept
+    assert "hydra" in (job_dirs[0] / ".hydra" / "config.yaml").read_text()
+
+    summary = collector.collect(sweep_dir)
+
+    assert summary["files"] == 0
+    assert summary["skipped_files"] == 4
+
+
+def test_resumes_partial_downloads(tmp_path: Path, bucket: LocalBucket) -> None:
+    sweep_dir = tmp_path / "multirun"
+    job_dir = save_job(sweep_dir, 0, "req-0")
+    bucket.write(RESULTS_BUCKET, get_bucket_key(job_dir, "data.bin"), b"0123456789")
+    (job_dir / "data.bin.part").write_bytes(b"01234")
+
+    summary = SweepCollector(bucket).collect(sweep_dir)
+
+    assert summary["files"] == 1
+    assert (job_dir / "data.bin").read_bytes() == b"0123456789"
+    assert not (job_dir / "data.bin.part").exists()
+
+
+def test_restarts_partial_downloads_larger_than_the_object(
+    tmp_path: Path,
+    bucket: LocalBucket,
+) -> None:
+    sweep_dir = tmp_path / "multirun"
+    job_dir = save_job(sweep_dir, 0, "req-0")
+    bucket.write(RESULTS_BUCKET, get_bucket_key(job_dir, "data.bin"), b"new")
+    (job_dir / "data.bin.part").write_bytes(b"stale content")
+
+    SweepCollector(bucket).collect(sweep_dir)
+
+    assert (job_dir / "data.bin").read_bytes() == b"new"
+
+
+def test_fans_out_the_logs_of_packed_jobs(
+    tmp_path: Path,
+    bucket: LocalBucket,
+    log_store: RecordingLogStore,
+) -> None:
+    sweep_dir = tmp_path / "multirun"
+    job_dirs = [
+        save_job(sweep_dir, 0, "req-0"),
+        save_job(sweep_dir, 1, "req-0"),
+        save_job(sweep_dir, 2, "req-1"),
+    ]
+    collector = SweepCollector(bucket, log_store)
+
+    summary = collector.collect(sweep_dir)
+
+    assert summary["logs"] == 2
+    assert sorted(log_store.requests) == ["req-0", "req-1"]
+    assert [(job_dir / "logs" / "run.log").read_text() for job_dir in job_dirs] == [
+        "req-0",
+        "req-0",
+        "req-1",
+    ]
+
+    summary = collector.collect(sweep_dir)
+
+    assert summary["logs"] == 0
+    assert summary["skipped_logs"] == 2
+    assert len(log_store.requests) == 2
+
+
+def test_skips_logs_of_pool_jobs(
+    tmp_path: Path,
+    bucket: LocalBucket,
+    log_store: RecordingLogStore,
+) -> None:
+    sweep_dir = tmp_path / "multirun"
+    save_job(sweep_dir, 0, "req-0", backend="POOL")
+    save_job(sweep_dir, 1, "req-1")
+
+    summary = SweepCollector(bucket, log_store).collect(sweep_dir)
+
+    assert summary["logs"] == 1
+    assert log_store.requests == ["req-1"]
+
+
+def test_skips_jobs_that_were_not_launched(
+    tmp_path: Path,
+    bucket: LocalBucket,
+) -> None:
+    sweep_dir = tmp_path / "multirun"
+    save_job(sweep_dir, 0, "")
+
+    assert SweepCollector(bucket).find_jobs(sweep_dir) == []
+
+
+def test_collects_only_the_logs_of_jobs_without_results(
+    tmp_path: Path,
+    bucket: LocalBucket,
+    log_store: RecordingLogStore,
+) -> None:
+    sweep_dir = tmp_path / "multirun"
+    job_dir = save_job(sweep_dir, 0, "req-0", results=False)
+    bucket.write(RESULTS_BUCKET, get_bucket_key(job_dir, "metrics.json"), b"{}")
+
+    summary = SweepCollector(bucket, log_store).collect(sweep_dir)
+
+    assert summary["jobs_without_outputs"] == 1
+    assert summary["files"] == 0
+    assert summary["logs"] == 1
+    assert not (job_dir / "metrics.json").exists()
+
+
+def test_fails_without_results_and_logs(tmp_path: Path, bucket: LocalBucket) -> None:
+    sweep_dir = tmp_path / "multirun"
+    save_job(sweep_dir, 0, "req-0", results=False)
+
+    with pytest.raises(ValueError, match="results.enabled=true"):
+        SweepCollector(bucket).collect(sweep_dir)
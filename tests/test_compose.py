@@ -0,0 +1,127 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the cache of the composed sweep configs."""
+
+from typing import Any
+
+import pytest
+from hydra._internal.config_loader_impl import ConfigLoaderImpl
+from hydra._internal.utils import create_config_search_path
+from hydra.core.config_store import ConfigStore
+from hydra.types import RunMode
+from omegaconf import DictConfig, OmegaConf
+
+from hydra_skypilot_launcher.config.compose import ComposeCache
+from hydra_skypilot_launcher.config.launcher import ComposeCacheConfig
+
+CONFIG_NAME = "compose_cache_test"
+
+JOB_OVERRIDES: list[list[str]] = [
+    [],
+    ["x=5"],
+    ["x=5", "y=b"],
+    ["+added=1"],
+    ["~y"],
+    ["++x=7", "++forced=2"],
+    ["db=b"],
+    ["db=b", "x=3"],
+    ["+db@other=a"],
+    ["db.port=9"],
+    ["+name=${y}-${x}", "y=${x}"],
+    ["hydra.job.name=renamed", "x=2"],
+    ["hydra.run.dir=elsewhere"],
+]
+
+
+@pytest.fixture(scope="module")
+def config_loader() -> ConfigLoaderImpl:
+    """Register the configs of a sweep and create its config loader."""
+    config_store = ConfigStore.instance()
+    config_store.store(group="db", name="a", node={"port": 1})
+    config_store.store(group="db", name="b", node={"port": 2, "host": "b"})
+    config_store.store(
+        name=CONFIG_NAME,
+        node={
+            "defaults": ["_self_", {"db": "a"}],
+            "x": 1,
+            "y": "a",
+            "z": "${x}",
+            "url": "${db.port}",
+        },
+    )
+    return ConfigLoaderImpl(config_search_path=create_config_search_path(None))
+
+
+@pytest.fixture(scope="module")
+def master_config(config_loader: ConfigLoaderImpl) -> DictConfig:
+    """Load the master config of the sweep."""
+    return config_loader.load_configuration(
+        CONFIG_NAME,
+        overrides=[],
+        run_mode=RunMode.MULTIRUN,
+    )
+
+
+def get_container(config: DictConfig) -> dict[str, Any]:
+    """Get a config as a container, with the job config resolved."""
+    container: dict[str, Any] = OmegaConf.to_container(config)  # type: ignore[invalid-assignment]
+    job_config = OmegaConf.masked_copy(
+        config, [key for key in config if key != "hydra"]
+    )
+    container.update(OmegaConf.to_container(job_config, resolve=True))  # type: ignore[no-matching-overload]
+    return container
+
+
+@pytest.mark.parametrize("overrides", JOB_OVERRIDES)
+def test_cached_config_equals_the_composed_config(
+    config_loader: ConfigLoaderImpl,
+    master_config: DictConfig,
+    overrides: list[str],
+) -> None:
+    compose_cache = ComposeCache(ComposeCacheConfig(), config_loader, master_config)
+    expected = config_loader.load_sweep_config(master_config, list(overrides))
+
+    # The second compose is served from the cache
+    for _ in range(2):
+        sweep_config = compose_cache.compose(overrides)
+        assert get_container(sweep_config) == get_container(expected)
+
+
+def test_prefetched_configs_equal_the_composed_configs(
+    config_loader: ConfigLoaderImpl,
+    master_config: DictConfig,
+) -> None:
+    compose_cache = ComposeCache(
+        ComposeCacheConfig(processes=2),
+        config_loader,
+        master_config,
+    )
+    compose_cache.prefetch(JOB_OVERRIDES)
+
+    assert compose_cache._composed
+    for overrides in JOB_OVERRIDES:
+        expected = config_loader.load_sweep_config(master_config, list(overrides))
+        assert get_container(compose_cache.compose(overrides)) == get_container(
+            expected,
+        )
@@ -0,0 +1,106 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the compact saving and rebuilding of job configs."""
+
+from pathlib import Path
+from typing import Any
+
+import yaml
+from omegaconf import DictConfig, OmegaConf
+
+from hydra_skypilot_launcher.config.handler import (
+    CompactConfigWriter,
+    load_job_config,
+    rebuild_configs,
+)
+
+RUN_COMMAND = "mapfile -t _hydra_args <<'HYDRA_ARGS'\nx=1\nHYDRA_ARGS\n"
+RUN_COMMAND += 'uv run app.py "${_hydra_args[@]}"'
+
+
+def get_job_config(sweep_dir: Path, job_num: int) -> DictConfig:
+    """Get the sweep config of a job like the launcher composes it."""
+    return OmegaConf.create(
+        {
+            "x": job_num,
+            "db": {"port": 1},
+            "hydra": {
+                "sweep": {"dir": sweep_dir.as_posix(), "subdir": str(job_num)},
+                "runtime": {"output_dir": None},
+                "output_subdir": ".hydra",
+                "overrides": {"task": [f"x={job_num}"]},
+                "job": {"id": f"pack:{job_num}", "num": job_num},
+                "launcher": {"secrets": {"TOKEN": "secret"}},
+            },
+        },
+    )
+
+
+def get_sky_config(job_num: int) -> dict[str, Any]:
+    """Get the SkyPilot job config of a job."""
+    return {
+        "name": f"main_{job_num}",
+        "run": RUN_COMMAND.replace("x=1", f"x={job_num}"),
+        "envs": {"HOME_DIR": "${HOME}"},
+        "resources": {"cpus": 4, "infra": "gcp"},
+    }
+
+
+def get_fields(config: Any, path: str = "") -> dict[str, Any]:
+    """Read every field of a config, keyed by its path."""
+    if isinstance(config, dict | DictConfig):
+        fields: dict[str, Any] = {}
+        for key in config:
+            fields.update(get_fields(config[key], f"{path}.{key}"))
+        return fields
+    return {path: config}
+
+
+def test_rebuilt_configs_equal_the_saved_configs(tmp_path: Path) -> None:
+    writer = CompactConfigWriter()
+    for job_num in range(3):
+        writer.save(get_job_config(tmp_path, job_num), get_sky_config(job_num))
+
+    for job_num in range(3):
+        job_dir = tmp_path / str(job_num)
+        config, sky_config = rebuild_configs(job_dir)
+
+        assert get_fields(sky_config) == get_fields(get_sky_config(job_num))
+        assert config.x == job_num
+        assert config.hydra.job.id == f"pack:{job_num}"
+        assert config.hydra.launcher.secrets.TOKEN == "<redacted>"
+        assert config.hydra.runtime.output_dir == str(job_dir.resolve())
+        assert load_job_config(job_dir) == OmegaConf.to_container(config)
+
+
+def test_rebuilt_sky_job_file_is_plain_yaml(tmp_path: Path) -> None:
+    writer = CompactConfigWriter()
+    writer.save(get_job_config(tmp_path, 0), get_sky_config(0))
+    writer.save(get_job_config(tmp_path, 1), get_sky_config(1))
+    rebuild_configs(tmp_path / "1")
+
+    with (tmp_path / "1" / ".hydra" / "sky_job.yaml").open() as file:
+        assert yaml.safe_load(file) == get_sky_config(1)
+    with (tmp_path / ".hydra" / "sky_job.yaml").open() as file:
+        assert yaml.safe_load(file) == get_sky_config(0)
@@ -0,0 +1,131 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the ranking of infrastructure candidates by provisioning history."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from hydra_skypilot_launcher.config.config_types import ResourcesConfig
+from hydra_skypilot_launcher.config.launcher import HistoryConfig
+from hydra_skypilot_launcher.launcher.history import ProvisioningHistory
+from hydra_skypilot_launcher.launcher.monitor import JobState, JobStatusUpdate
+
+RESOURCES = ResourcesConfig(
+    infrastructure="gcp",
+    accelerators="A100:1",
+    infrastructure_candidates=["aws", "azure", "lambda"],
+)
+
+
+def get_event(infra: str, event: str = "running", **values: Any) -> dict[str, Any]:
+    """Get a recorded event of the A100 resources."""
+    return {
+        "event": event,
+        "time": 0.0,
+        "infra": infra,
+        "accelerators": "A100:1",
+        "use_spot": False,
+        **values,
+    }
+
+
+def replay(path: Path, events: list[dict[str, Any]]) -> ProvisioningHistory:
+    """Write recorded events to a history file and load it."""
+    path.write_text("".join(json.dumps(event) + "\n" for event in events))
+    return ProvisioningHistory(HistoryConfig(enabled=True, window=3), path)
+
+
+def get_order(resources: ResourcesConfig) -> list[str]:
+    """Get the order in which the infrastructures of resources are tried."""
+    return [resources.infrastructure, *resources.infrastructure_candidates]
+
+
+def test_untried_candidates_come_first(tmp_path: Path) -> None:
+    history = replay(
+        tmp_path / "history.jsonl",
+        [get_event("gcp", latency=30.0), get_event("aws/us-east-1", latency=10.0)],
+    )
+
+    assert get_order(history.rank(RESOURCES)) == ["azure", "lambda", "aws", "gcp"]
+
+
+def test_candidates_are_ranked_by_score(tmp_path: Path) -> None:
+    history = replay(
+        tmp_path / "history.jsonl",
+        [
+            get_event("gcp", latency=100.0),
+            # Only the last jobs of the window count
+            *(get_event("aws", latency=latency) for latency in (900.0, 5.0, 5.0, 5.0)),
+            get_event("azure", latency=20.0),
+            get_event("azure", "finished", preemptions=0),
+            get_event("lambda", latency=10.0),
+            get_event("lambda", "finished", preemptions=1),
+        ],
+    )
+
+    assert history.get_score("aws", RESOURCES) == pytest.approx(5.0)
+    assert history.get_score("lambda", RESOURCES) == pytest.approx(610.0)
+    assert get_order(history.rank(RESOURCES)) == ["aws", "azure", "gcp", "lambda"]
+
+
+def test_history_of_other_resources_is_ignored(tmp_path: Path) -> None:
+    history = replay(
+        tmp_path / "history.jsonl",
+        [
+            get_event("gcp", latency=1.0) | {"use_spot": True},
+            get_event("aws", latency=1.0) | {"accelerators": "H100:1"},
+        ],
+    )
+
+    assert history.get_score("gcp", RESOURCES) is None
+    assert history.get_score("aws", RESOURCES) is None
+    assert history.rank(RESOURCES) == RESOURCES
+
+
+def test_corrupt_lines_are_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    path.write_text(json.dumps(get_event("gcp", latency=1.0)) + "\n{truncated")
+
+    assert len(ProvisioningHistory(HistoryConfig(enabled=True), path)) == 1
+
+
+def test_observed_jobs_are_recorded_and_replayed(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    history = ProvisioningHistory(HistoryConfig(enabled=True), path)
+    history.submit("req-0", RESOURCES)
+    history.observe("req-0", JobStatusUpdate(JobState.PENDING))
+    history.observe("req-0", JobStatusUpdate(JobState.RUNNING, infra="AWS/us-east-1"))
+    history.observe("req-0", JobStatusUpdate(JobState.SUCCEEDED, recoveries=2))
+
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    replayed = ProvisioningHistory(HistoryConfig(enabled=True), path)
+
+    assert [event["event"] for event in events] == ["running", "finished"]
+    assert events[0]["infra"] == "aws/us-east-1"
+    assert events[1]["preemptions"] == 2
+    assert len(replayed) == 2
+    assert get_order(replayed.rank(RESOURCES))[-1] == "aws"
@@ -0,0 +1,107 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of resuming sweeps from the journal of submissions."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from conftest import FakeLaunch
+from omegaconf import OmegaConf
+
+from hydra_skypilot_launcher.config.config_types import ResourcesConfig
+from hydra_skypilot_launcher.config.launcher import JournalConfig
+from hydra_skypilot_launcher.launcher.journal import SubmissionJournal
+
+JOB_OVERRIDES: list[list[str]] = [[f"x={job_num}"] for job_num in range(4)]
+JOURNAL = "hydra.launcher.journal.enabled=true"
+
+
+def get_request_ids(sweep_dir: Path) -> list[str]:
+    """Get the request ids the jobs of a sweep are saved with."""
+    return [
+        OmegaConf.load(
+            sweep_dir / str(job_num) / ".hydra" / "config.yaml"
+        ).hydra.job.request_id
+        for job_num in range(len(JOB_OVERRIDES))
+    ]
+
+
+def test_rerun_sweep_is_not_submitted_again(
+    tmp_path: Path,
+    launch_sweep: Callable[..., Any],
+    fake_launch: FakeLaunch,
+) -> None:
+    launch_sweep(JOB_OVERRIDES, JOURNAL)
+    request_ids = get_request_ids(tmp_path / "multirun")
+
+    launch_sweep(JOB_OVERRIDES, JOURNAL)
+
+    assert len(fake_launch.tasks) == len(JOB_OVERRIDES)
+    assert get_request_ids(tmp_path / "multirun") == request_ids
+
+
+def test_resumed_sweep_only_submits_the_missing_jobs(
+    launch_sweep: Callable[..., Any],
+    fake_launch: FakeLaunch,
+) -> None:
+    fake_launch.failing_names.add("task_function_1")
+    launch_sweep(JOB_OVERRIDES, JOURNAL)
+    fake_launch.failing_names.clear()
+
+    launch_sweep(JOB_OVERRIDES, JOURNAL)
+
+    assert len(fake_launch.tasks) == len(JOB_OVERRIDES)
+    assert fake_launch.tasks[-1].name == "task_function_1"
+
+
+def test_changed_jobs_are_submitted_again(
+    launch_sweep: Callable[..., Any],
+    fake_launch: FakeLaunch,
+) -> None:
+    launch_sweep(JOB_OVERRIDES, JOURNAL)
+
+    launch_sweep([["x=0"], ["x=5"]], JOURNAL)
+
+    assert len(fake_launch.tasks) == len(JOB_OVERRIDES) + 1
+
+
+def test_truncated_last_line_is_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "submissions.jsonl"
+    resources = ResourcesConfig(infrastructure="gcp")
+    keys = [
+        SubmissionJournal.get_key([[f"x={job_num}"]], resources, ["python app.py"])
+        for job_num in range(2)
+    ]
+    journal = SubmissionJournal(JournalConfig(), path)
+    journal.record(keys[0], "req-0", [0])
+    journal.record(keys[1], "req-1", [1])
+    journal.flush()
+    path.write_text(path.read_text()[:-10])
+
+    resumed = SubmissionJournal(JournalConfig(), path)
+
+    assert len(resumed) == 1
+    assert resumed.get(keys[0]) == "req-0"
+    assert resumed.get(keys[1]) is None
@@ -0,0 +1,98 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of launching sweeps."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import FakeLaunch
+from hydra.core.utils import JobStatus
+from omegaconf import OmegaConf
+
+from hydra_skypilot_launcher.launcher import launcher as launcher_module
+
+JOB_OVERRIDES: list[list[str]] = [[f"x={job_num}", "db=b"] for job_num in range(6)]
+
+
+@pytest.mark.parametrize("max_concurrent_submissions", [1, 4])
+def test_jobs_are_launched_and_saved_in_order(
+    tmp_path: Path,
+    launch_sweep: Callable[..., Any],
+    fake_launch: FakeLaunch,
+    max_concurrent_submissions: int,
+) -> None:
+    _, job_returns = launch_sweep(
+        JOB_OVERRIDES,
+        f"hydra.launcher.max_concurrent_submissions={max_concurrent_submissions}",
+    )
+
+    assert len(fake_launch.tasks) == len(JOB_OVERRIDES)
+    for job_num, job_return in enumerate(job_returns):
+        assert job_return.status is JobStatus.COMPLETED
+        assert job_return.overrides == JOB_OVERRIDES[job_num]
+        config = OmegaConf.load(
+            tmp_path / "multirun" / str(job_num) / ".hydra" / "config.yaml"
+        )
+        assert config.x == job_num
+        assert config.db.port == 2
+        assert config.hydra.launcher.secrets.TOKEN == "<redacted>"
+        assert config.hydra.job.request_id.startswith("req-")
+
+
+def test_failed_submission_only_fails_its_job(
+    launch_sweep: Callable[..., Any],
+    fake_launch: FakeLaunch,
+) -> None:
+    fake_launch.failing_names.add("task_function_2")
+
+    _, job_returns = launch_sweep(
+        JOB_OVERRIDES,
+        "hydra.launcher.max_concurrent_submissions=4",
+    )
+
+    assert [job_return.status for job_return in job_returns] == [
+        JobStatus.FAILED if job_num == 2 else JobStatus.COMPLETED
+        for job_num in range(len(JOB_OVERRIDES))
+    ]
+    with pytest.raises(RuntimeError, match="task_function_2"):
+        _ = job_returns[2].return_value
+
+
+def test_failing_to_save_configs_keeps_the_job_launched(
+    launch_sweep: Callable[..., Any],
+    fake_launch: FakeLaunch,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(**kwargs: Any) -> None:
+        msg = "disk full"
+        raise OSError(msg)
+
+    monkeypatch.setattr(launcher_module, "handle_output_dir_and_save_configs", fail)
+
+    _, job_returns = launch_sweep(JOB_OVERRIDES[:2])
+
+    assert len(fake_launch.tasks) == 2
+    assert all(job_return.status is JobStatus.COMPLETED for job_return in job_returns)
@@ -0,0 +1,149 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the polling of launched jobs."""
+
+from collections.abc import Iterator, Sequence
+
+import pytest
+
+from hydra_skypilot_launcher.config.launcher import MonitorConfig
+from hydra_skypilot_launcher.launcher import monitor
+from hydra_skypilot_launcher.launcher.monitor import (
+    JobMonitor,
+    JobState,
+    JobStatusUpdate,
+)
+
+
+class FakeClock:
+    """Clock advanced by the sleeps of the monitor instead of waiting."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at zero."""
+        self.now: float = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        """Get the current time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Advance the clock."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeStatusBackend:
+    """Status backend replaying a scripted state per poll and job."""
+
+    def __init__(self, states: dict[str, list[JobState]]) -> None:
+        """Initialize the backend with the states returned by each poll."""
+        self.states: dict[str, list[JobState]] = states
+        self.polls: list[list[str]] = []
+
+    def poll(self, request_ids: Sequence[str]) -> dict[str, JobStatusUpdate]:
+        """Get the next scripted state of the jobs."""
+        self.polls.append(list(request_ids))
+        statuses: dict[str, JobStatusUpdate] = {}
+        for request_id in request_ids:
+            states = self.states[request_id]
+            state = states.pop(0) if len(states) > 1 else states[0]
+            statuses[request_id] = JobStatusUpdate(state)
+        return statuses
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeClock]:
+    """Replace the clock of the monitor."""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(monitor.time, "monotonic", fake_clock.monotonic)
+    monkeypatch.setattr(monitor.time, "sleep", fake_clock.sleep)
+    yield fake_clock
+
+
+def test_poll_interval_backs_off_and_resets(clock: FakeClock) -> None:
+    pending, running, succeeded = JobState.PENDING, JobState.RUNNING, JobState.SUCCEEDED
+    backend = FakeStatusBackend(
+        {"a": [pending, pending, pending, running, running, succeeded]},
+    )
+    job_monitor = JobMonitor(
+        MonitorConfig(min_poll_interval=1, max_poll_interval=3, backoff=2),
+        backend,
+    )
+    job_monitor.track(["a"])
+
+    finished = job_monitor.wait()
+
+    assert list(finished) == ["a"]
+    assert finished["a"].state is succeeded
+    # Doubled while unchanged up to the maximum, reset when the job started
+    assert clock.sleeps == [2, 3, 3, 1, 2]
+
+
+def test_timeout_stops_waiting_on_unfinished_jobs(clock: FakeClock) -> None:
+    backend = FakeStatusBackend(
+        {
+            "done": [JobState.RUNNING, JobState.FAILED],
+            "stuck": [JobState.RUNNING],
+        },
+    )
+    job_monitor = JobMonitor(
+        MonitorConfig(min_poll_interval=4, max_poll_interval=4, timeout=10),
+        backend,
+    )
+    job_monitor.track(["done", "stuck"])
+
+    finished = job_monitor.wait()
+
+    assert list(finished) == ["done"]
+    assert clock.now == pytest.approx(10)
+    # The last sleep is cut short at the deadline
+    assert clock.sleeps == [4, 4, 2]
+
+
+def test_on_update_receives_every_polled_status(clock: FakeClock) -> None:
+    backend = FakeStatusBackend(
+        {
+            "a": [JobState.PENDING, JobState.SUCCEEDED],
+            "b": [JobState.CANCELLED],
+        },
+    )
+    updates: list[tuple[str, JobState]] = []
+    job_monitor = JobMonitor(
+        MonitorConfig(min_poll_interval=1),
+        backend,
+        on_update=lambda request_id, status: updates.append((request_id, status.state)),
+    )
+    job_monitor.track(["a", "b"])
+
+    finished = job_monitor.wait()
+
+    assert set(finished) == {"a", "b"}
+    assert updates == [
+        ("a", JobState.PENDING),
+        ("b", JobState.CANCELLED),
+        ("a", JobState.SUCCEEDED),
+    ]
+    assert backend.polls == [["a", "b"], ["a"]]
+    assert clock.sleeps == [1]
@@ -0,0 +1,134 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the encoding of overrides into run commands."""
+
+import shutil
+import subprocess
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from hydra_skypilot_launcher.launcher.overrides import (
+    ARGS_DELIMITER,
+    EncodedJob,
+    OverrideEncoder,
+    get_run_command,
+)
+from hydra_skypilot_launcher.launcher.packing import get_job_id_override
+
+pytestmark = pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+
+# Stands in for uv, printing the arguments passed to the job script
+FAKE_UV = "uv() { shift 2; printf '%s\\0' \"$@\"; }"
+
+
+def run_bash(commands: Sequence[str]) -> list[str]:
+    """Run commands with bash and get the arguments printed by the fake uv."""
+    output = subprocess.run(
+        ["bash", "-c", "\n".join([FAKE_UV, *commands])],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return output.split("\0")[:-1]
+
+
+def get_script_args(
+    job_override: Sequence[str],
+    extra_overrides: Sequence[str] = (),
+) -> tuple[EncodedJob, list[str]]:
+    """Encode the overrides of a job and get the arguments its script receives."""
+    job = OverrideEncoder().encode_job(job_override)
+    return job, run_bash(get_run_command(job, extra_overrides))
+
+
+@pytest.mark.parametrize(
+    "job_override",
+    [
+        ["x=1", "eq=a=b", "list=[1,2,3]", "spaces=a b"],
+        ["x='a,b'", 'y="c,d"', "msg='single quoted'", "choice=a,b"],
+        ["interpolation=${oc.env:HOME}", "dollar=$HOME", "cost=$5"],
+        ["backslash=a\\b", "escaped_quote=say \\'hi\\'", "path=C:\\dir\\"],
+        ['quote="it\'s"', "newline=line1\nline2", "tab=a\tb"],
+        [f"delimiter={ARGS_DELIMITER}", "equals=a=b=c"],
+        ["dict={a:1,b:2}", "glob=*", "semicolon=a;b", "paren=(1)"],
+    ],
+)
+def test_script_receives_the_overrides_verbatim(job_override: list[str]) -> None:
+    _, args = get_script_args(job_override)
+
+    assert args == job_override
+
+
+def test_newline_args_are_quoted_inline() -> None:
+    job = OverrideEncoder().encode_job(["a=1", "b=x", "multi=line1\nline2"])
+    job.args.append("raw\nvalue")
+    commands = get_run_command(job)
+
+    assert not any(command.startswith("mapfile") for command in commands)
+    assert run_bash(commands) == job.args
+
+
+def test_delimiter_arg_is_quoted_inline() -> None:
+    job = OverrideEncoder().encode_job(["a=1"])
+    job.args.append(ARGS_DELIMITER)
+
+    assert run_bash(get_run_command(job)) == ["a=1", ARGS_DELIMITER]
+
+
+def test_launch_and_extra_overrides() -> None:
+    job = OverrideEncoder().encode_job(
+        ["x=1", "+launch.trainer=$fast", "+launch.script=train.py"],
+    )
+    args = run_bash(get_run_command(job, [get_job_id_override("abc:0")]))
+
+    assert job.script == Path("train.py")
+    assert job.launch_args == ["trainer=$fast"]
+    assert args == ["x=1", 'hydra.job.id="abc:0"', "--", *job.launch_args]
+
+
+def test_resource_overrides_are_not_passed_to_the_job() -> None:
+    job, args = get_script_args(
+        ["x=1", "+launch.resource_shape=big", "+launch.resources.cpus=8"],
+    )
+
+    assert job.overrides == [
+        "x=1",
+        "+launch.resource_shape=big",
+        "+launch.resources.cpus=8",
+    ]
+    assert job.resource_shape == "big"
+    assert job.resource_overrides == ("cpus=8",)
+    assert args == ["x=1"]
+
+
+def test_encoded_overrides_are_memoized() -> None:
+    encoder = OverrideEncoder(maxsize=2)
+    encoded = encoder.encode("x=${y}")
+
+    assert encoder.encode("x=${y}") is encoded
+    encoder.encode("a=1")
+    encoder.encode("b=2")
+    assert encoder.encode("x=${y}") is not encoded
@@ -0,0 +1,144 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of packing several sweep jobs into one SkyPilot job."""
+
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import FakeLaunch
+from hydra.core.utils import JobStatus
+from omegaconf import OmegaConf
+
+from hydra_skypilot_launcher.config.config_types import ResourcesConfig
+from hydra_skypilot_launcher.config.launcher import PackingConfig
+from hydra_skypilot_launcher.launcher.packing import (
+    get_pack_id,
+    get_pack_size,
+    get_packed_run_command,
+    get_parallel_jobs,
+)
+
+
+def run_packed(run_commands: list[list[str]], parallel_jobs: int) -> int:
+    """Run a packed run section with bash, returning its exit code."""
+    script = "\n".join(get_packed_run_command(run_commands, parallel_jobs))
+    return subprocess.run(["bash", "-c", script], check=False).returncode
+
+
+def test_packed_jobs_all_run(tmp_path: Path) -> None:
+    run_commands = [[f"cd {tmp_path}", f"touch job_{job_num}"] for job_num in range(5)]
+
+    assert run_packed(run_commands, parallel_jobs=2) == 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"job_{job_num}" for job_num in range(5)
+    ]
+
+
+def test_failing_packed_job_fails_the_pack_after_the_others(tmp_path: Path) -> None:
+    run_commands = [
+        [f"touch {tmp_path / 'job_0'}"],
+        ["false"],
+        [f"sleep 0.2 && touch {tmp_path / 'job_2'}"],
+    ]
+
+    assert run_packed(run_commands, parallel_jobs=3) == 1
+    assert (tmp_path / "job_0").exists()
+    assert (tmp_path / "job_2").exists()
+
+
+def test_packed_jobs_respect_the_parallel_limit(tmp_path: Path) -> None:
+    running = tmp_path / "running"
+    # Each job records the number of jobs running next to it.
+    run_commands = []
+    for job_num in range(4):
+        job_dir = running / str(job_num)
+        command = (
+            f"mkdir {job_dir} && ls {running} | wc -l >> {tmp_path / 'seen'}"
+            f" && sleep 0.3 && rmdir {job_dir}"
+        )
+        run_commands.append([f"({command})"])
+    running.mkdir()
+
+    assert run_packed(run_commands, parallel_jobs=2) == 0
+    seen = [int(line) for line in (tmp_path / "seen").read_text().split()]
+    assert len(seen) == 4
+    assert max(seen) <= 2
+
+
+@pytest.mark.parametrize(
+    ("packing", "cpus", "parallel_jobs", "pack_size"),
+    [
+        (PackingConfig(), 4, 1, 1),
+        (PackingConfig(jobs_per_pack=8, parallel_jobs=2), 4, 2, 8),
+        (PackingConfig(job_cpus=2), "8+", 4, 1),
+        (PackingConfig(job_cpus=2, parallel_jobs=3), None, 3, 1),
+        (PackingConfig(job_minutes=10, max_pack_minutes=35, job_cpus=4), 8, 2, 6),
+    ],
+)
+def test_pack_size(
+    packing: PackingConfig,
+    cpus: int | str | None,
+    parallel_jobs: int,
+    pack_size: int,
+) -> None:
+    resources = ResourcesConfig(infrastructure="gcp", cpus=cpus)
+
+    assert get_parallel_jobs(packing, resources) == parallel_jobs
+    assert get_pack_size(packing, parallel_jobs) == pack_size
+
+
+def test_pack_id_only_depends_on_the_sweep_dir_and_first_job() -> None:
+    assert get_pack_id("multirun", 0) == get_pack_id("multirun", 0)
+    assert get_pack_id("multirun", 0) != get_pack_id("multirun", 4)
+    assert get_pack_id("multirun", 0) != get_pack_id("other", 0)
+
+
+def test_jobs_are_packed_and_keep_their_own_configs(
+    tmp_path: Path,
+    launch_sweep: Callable[..., Any],
+    fake_launch: FakeLaunch,
+) -> None:
+    job_overrides = [[f"x={job_num}"] for job_num in range(5)]
+
+    _, job_returns = launch_sweep(
+        job_overrides,
+        "hydra.launcher.packing.jobs_per_pack=2",
+        "hydra.launcher.packing.parallel_jobs=2",
+    )
+
+    assert len(fake_launch.tasks) == 3
+    assert all(job_return.status is JobStatus.COMPLETED for job_return in job_returns)
+    job_ids = []
+    for job_num in range(len(job_overrides)):
+        config = OmegaConf.load(
+            tmp_path / "multirun" / str(job_num) / ".hydra" / "config.yaml"
+        )
+        assert config.x == job_num
+        job_ids.append(config.hydra.job.id)
+    pack_ids = [job_id.split(":")[0] for job_id in job_ids]
+    assert pack_ids[0] == pack_ids[1] != pack_ids[2] == pack_ids[3] != pack_ids[4]
+    assert len(set(job_ids)) == len(job_ids)
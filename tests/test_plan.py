@@ -0,0 +1,103 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of planning sweeps without launching them."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import FakeLaunch
+from hydra.core.utils import JobStatus
+
+from hydra_skypilot_launcher.launcher.plan import get_accelerators
+
+
+def read_plan(sweep_dir: Path) -> list[dict[str, Any]]:
+    """Read the planned tasks of a sweep."""
+    with (sweep_dir / "sweep_plan.jsonl").open() as plan_file:
+        return [json.loads(line) for line in plan_file]
+
+
+def test_plan_renders_every_pack_without_launching(
+    tmp_path: Path,
+    launch_sweep: Callable[..., Any],
+    fake_launch: FakeLaunch,
+) -> None:
+    _, job_returns = launch_sweep(
+        [[f"x={job_num}"] for job_num in range(5)],
+        "hydra.launcher.plan.enabled=true",
+        "hydra.launcher.plan.workers=3",
+        "hydra.launcher.packing.jobs_per_pack=2",
+        "hydra.launcher.packing.parallel_jobs=2",
+        "hydra.launcher.packing.job_minutes=30",
+        "hydra.launcher.resources.accelerators=A100:2",
+    )
+
+    assert fake_launch.tasks == []
+    assert all(job_return.status is JobStatus.COMPLETED for job_return in job_returns)
+    tasks = read_plan(tmp_path / "multirun")
+    assert [task["job_nums"] for task in tasks] == [[0, 1], [2, 3], [4]]
+    assert tasks[0]["overrides"] == [["x=0"], ["x=1"]]
+    for task in tasks:
+        for job_num in task["job_nums"]:
+            assert f"x={job_num}" in task["task"]["run"]
+
+
+def test_plan_reports_invalid_overrides_on_their_jobs(
+    tmp_path: Path,
+    launch_sweep: Callable[..., Any],
+) -> None:
+    _, job_returns = launch_sweep(
+        [["x=1"], ["missing=1"], ["x=3"]],
+        "hydra.launcher.plan.enabled=true",
+        "hydra.launcher.plan.validate=true",
+    )
+
+    assert [job_return.status for job_return in job_returns] == [
+        JobStatus.COMPLETED,
+        JobStatus.FAILED,
+        JobStatus.COMPLETED,
+    ]
+    assert [task["job_nums"] for task in read_plan(tmp_path / "multirun")] == [
+        [0],
+        [2],
+    ]
+
+
+@pytest.mark.parametrize(
+    ("accelerators", "expected"),
+    [
+        (None, {}),
+        ("A100", {"A100": 1.0}),
+        ("H100:8", {"H100": 8.0}),
+        ({"L4": 2, "T4": None}, {"L4": 2.0, "T4": 1.0}),
+    ],
+)
+def test_accelerators_are_counted_per_type(
+    accelerators: str | dict[str, Any] | None,
+    expected: dict[str, float],
+) -> None:
+    assert get_accelerators(accelerators) == expected
@@ -0,0 +1,130 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of dispatching jobs to a pool of clusters."""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+import sky
+
+from hydra_skypilot_launcher.config.launcher import ClusterPoolConfig
+from hydra_skypilot_launcher.launcher.pool import ClusterPool
+
+
+class FakeSky:
+    """Stand-in for the SkyPilot cluster API recording the submissions."""
+
+    def __init__(self, up_clusters: set[str]) -> None:
+        """Initialize the stand-in with the clusters already up."""
+        self.up_clusters = up_clusters
+        self.launches: list[str] = []
+        self.execs: list[str] = []
+        self.failing_launches: set[str] = set()
+
+    def status(self, cluster_names: list[str]) -> list[dict[str, Any]]:
+        """Get the records of the clusters that are up."""
+        return [
+            {"name": name, "status": sky.ClusterStatus.UP}
+            for name in cluster_names
+            if name in self.up_clusters
+        ]
+
+    def launch(self, task: Any, cluster_name: str, **kwargs: Any) -> str:
+        """Bring up a cluster."""
+        if cluster_name in self.failing_launches:
+            msg = f"Simulated launch failure of {cluster_name}."
+            raise RuntimeError(msg)
+        self.launches.append(cluster_name)
+        self.up_clusters.add(cluster_name)
+        return f"launch-{len(self.launches)}"
+
+    def exec(self, task: Any, cluster_name: str) -> str:
+        """Run a task on a cluster that is up."""
+        self.execs.append(cluster_name)
+        return f"exec-{len(self.execs)}"
+
+
+@pytest.fixture
+def fake_sky(monkeypatch: pytest.MonkeyPatch) -> FakeSky:
+    """Replace the SkyPilot cluster API, with the first pool cluster up."""
+    fake = FakeSky({"pool-0"})
+    monkeypatch.setattr(sky, "status", fake.status)
+    monkeypatch.setattr(sky, "launch", fake.launch)
+    monkeypatch.setattr(sky, "exec", fake.exec)
+    monkeypatch.setattr(sky, "get", lambda result: result)
+    return fake
+
+
+def get_pool(size: int) -> ClusterPool:
+    """Get a refreshed pool of clusters."""
+    pool = ClusterPool(ClusterPoolConfig(size=size, name_prefix="pool"))
+    pool.refresh()
+    return pool
+
+
+def test_clusters_are_brought_up_once(fake_sky: FakeSky) -> None:
+    pool = get_pool(size=2)
+    task = SimpleNamespace(name="job")
+
+    request_ids = [pool.submit(task) for _ in range(4)]
+
+    assert fake_sky.launches == ["pool-1"]
+    assert fake_sky.execs == ["pool-0", "pool-0", "pool-1"]
+    assert [pool.get_cluster(request_id) for request_id in request_ids] == [
+        "pool-0",
+        "pool-1",
+        "pool-0",
+        "pool-1",
+    ]
+
+
+def test_jobs_go_to_the_least_loaded_cluster(fake_sky: FakeSky) -> None:
+    pool = get_pool(size=2)
+    task = SimpleNamespace(name="job")
+    first, second = pool.submit(task), pool.submit(task)
+
+    pool.release(first)
+    third = pool.submit(task)
+    pool.release(second)
+    fourth = pool.submit(task)
+
+    assert pool.get_cluster(third) == "pool-0"
+    assert pool.get_cluster(fourth) == "pool-1"
+
+
+def test_failed_bring_up_is_retried_by_the_next_job(fake_sky: FakeSky) -> None:
+    pool = get_pool(size=1)
+    fake_sky.up_clusters.clear()
+    pool.refresh()
+    fake_sky.failing_launches.add("pool-0")
+    task = SimpleNamespace(name="job")
+
+    with pytest.raises(RuntimeError, match="pool-0"):
+        pool.submit(task)
+    fake_sky.failing_launches.clear()
+    request_id = pool.submit(task)
+
+    assert fake_sky.launches == ["pool-0"]
+    assert pool.get_cluster(request_id) == "pool-0"
@@ -0,0 +1,83 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of timing the launch phases."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from hydra_skypilot_launcher.config.launcher import ProfilingConfig
+from hydra_skypilot_launcher.launcher.profiling import PhaseProfiler
+
+
+def test_disabled_profiler_records_nothing(tmp_path: Path) -> None:
+    profiler = PhaseProfiler(ProfilingConfig())
+
+    with profiler.phase("submit"):
+        profiler.count("jobs")
+    profiler.save(tmp_path)
+
+    assert profiler.get_summary() == {"phases": {}, "counters": {}}
+    assert not list(tmp_path.iterdir())
+
+
+def test_phases_are_summarised(tmp_path: Path) -> None:
+    profiler = PhaseProfiler(ProfilingConfig(enabled=True, trace=True))
+
+    for _ in range(3):
+        with profiler.phase("submit"):
+            profiler.count("jobs", 2)
+    with profiler.phase("save"):
+        pass
+    profiler.save(tmp_path)
+
+    summary = json.loads((tmp_path / "launch_profile.json").read_text())
+    assert summary["counters"] == {"jobs": 6}
+    assert summary["phases"]["submit"]["count"] == 3
+    assert summary["phases"]["save"]["count"] == 1
+    submit = summary["phases"]["submit"]
+    assert 0 <= submit["p50"] <= submit["p95"] <= submit["max"] <= submit["total"]
+    trace = json.loads((tmp_path / "launch_trace.json").read_text())
+    assert [event["name"] for event in trace["traceEvents"]] == [
+        *["submit"] * 3,
+        "save",
+    ]
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
+
+
+def test_launch_phases_are_saved_to_the_sweep_dir(
+    tmp_path: Path,
+    launch_sweep: Callable[..., Any],
+) -> None:
+    launch_sweep(
+        [[f"x={job_num}"] for job_num in range(3)],
+        "hydra.launcher.profiling.enabled=true",
+    )
+
+    summary = json.loads(
+        (tmp_path / "multirun" / "launch_profile.json").read_text(),
+    )
+    assert summary["phases"]["submit"]["count"] == 3
+    assert summary["counters"]["launched_jobs"] == 3
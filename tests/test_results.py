@@ -0,0 +1,134 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the job returns of launched jobs."""
+
+import json
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+from hydra.core.utils import JobStatus
+
+from hydra_skypilot_launcher.callbacks import ERROR_FILE, RETURN_VALUE_FILE
+from hydra_skypilot_launcher.config.launcher import MonitorConfig, ResultsConfig
+from hydra_skypilot_launcher.launcher import monitor
+from hydra_skypilot_launcher.launcher.monitor import (
+    JobMonitor,
+    JobState,
+    JobStatusUpdate,
+)
+from hydra_skypilot_launcher.launcher.results import (
+    LaunchedJobReturn,
+    ResultReader,
+    ResultStream,
+)
+from hydra_skypilot_launcher.launcher.sync import LocalBucket
+
+
+class FixedStatusBackend:
+    """Status backend reporting a fixed state per job."""
+
+    def __init__(self, states: dict[str, JobState]) -> None:
+        """Initialize the backend with the state of every job."""
+        self.states: dict[str, JobState] = states
+
+    def poll(self, request_ids: Sequence[str]) -> dict[str, JobStatusUpdate]:
+        """Get the state of the jobs."""
+        return {
+            request_id: JobStatusUpdate(self.states[request_id])
+            for request_id in request_ids
+        }
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Advance the clock of the monitor by its sleeps instead of waiting."""
+    now: list[float] = [0.0]
+    monkeypatch.setattr(monitor.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(
+        monitor.time,
+        "sleep",
+        lambda seconds: now.__setitem__(0, now[0] + seconds),
+    )
+
+
+def get_job_return(job_num: int, request_id: str) -> LaunchedJobReturn:
+    """Get the job return of a launched job."""
+    return LaunchedJobReturn(
+        overrides=[f"x={job_num}"],
+        status=JobStatus.COMPLETED,
+        working_dir=f"/multirun/{job_num}",
+        job_id=f"pack:{job_num}",
+        request_id=request_id,
+    )
+
+
+def test_packed_jobs_get_their_own_status(tmp_path: Path) -> None:
+    bucket = LocalBucket(tmp_path)
+    config = ResultsConfig(enabled=True)
+    bucket.write(config.bucket, f"multirun/0/{RETURN_VALUE_FILE}.json", b"0.5")
+    bucket.write(
+        config.bucket,
+        f"multirun/1/{ERROR_FILE}",
+        json.dumps({"type": "ValueError", "message": "bad x"}).encode(),
+    )
+    result_stream = ResultStream(
+        JobMonitor(
+            MonitorConfig(),
+            FixedStatusBackend({"req-0": JobState.FAILED}),
+        ),
+        ResultReader(config, bucket),
+    )
+    job_returns = [get_job_return(job_num, "req-0") for job_num in range(3)]
+    result_stream.add(job_returns)
+
+    assert list(result_stream) == job_returns
+    assert job_returns[0].status is JobStatus.COMPLETED
+    assert job_returns[0].return_value == 0.5
+    assert job_returns[1].status is JobStatus.FAILED
+    with pytest.raises(RuntimeError, match="ValueError: bad x"):
+        _ = job_returns[1].return_value
+    # The job that wrote nothing gets the status of its SkyPilot job
+    assert job_returns[2].status is JobStatus.FAILED
+    with pytest.raises(RuntimeError, match="req-0"):
+        _ = job_returns[2].return_value
+
+
+def test_unfinished_jobs_fail_with_a_timeout() -> None:
+    result_stream = ResultStream(
+        JobMonitor(
+            MonitorConfig(timeout=60),
+            FixedStatusBackend(
+                {"req-0": JobState.SUCCEEDED, "req-1": JobState.RUNNING},
+            ),
+        ),
+    )
+    finished, unfinished = get_job_return(0, "req-0"), get_job_return(1, "req-1")
+    result_stream.add([finished, unfinished])
+
+    assert list(result_stream) == [finished, unfinished]
+    assert finished.status is JobStatus.COMPLETED
+    assert unfinished.status is JobStatus.FAILED
+    with pytest.raises(TimeoutError, match="req-1"):
+        _ = unfinished.return_value
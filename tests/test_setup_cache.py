@@ -0,0 +1,118 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the cache of the environments built by the setup commands."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from hydra_skypilot_launcher.config.launcher import SetupCacheConfig
+from hydra_skypilot_launcher.launcher.setup_cache import SetupCache
+from hydra_skypilot_launcher.launcher.sync import LocalBucket
+
+pytestmark = pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+
+# Builds a virtual environment whose interpreter works
+BUILD_VENV = (
+    "mkdir -p .venv/bin && touch .venv/pyvenv.cfg && echo built >> builds && "
+    "printf '#!/bin/sh\\n' > .venv/bin/python && chmod +x .venv/bin/python"
+)
+
+
+@pytest.fixture
+def setup_cache(tmp_path: Path) -> SetupCache:
+    """Create a setup cache archiving to a local directory."""
+    config = SetupCacheConfig(enabled=True, destination=tmp_path / "cache")
+    (tmp_path / "cache").mkdir()
+    return SetupCache(config, LocalBucket(tmp_path / "buckets"))
+
+
+def run_setup(
+    setup_cache: SetupCache,
+    workdir: Path,
+    setup_commands: list[str],
+) -> subprocess.CompletedProcess[str]:
+    """Run the wrapped setup commands of a job with bash in its workdir."""
+    workdir.mkdir(exist_ok=True)
+    return subprocess.run(
+        [
+            "bash",
+            "-c",
+            "\n".join(setup_cache.get_setup_commands("key", setup_commands)),
+        ],
+        cwd=workdir,
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+
+
+def test_first_job_builds_and_later_jobs_restore(
+    tmp_path: Path,
+    setup_cache: SetupCache,
+) -> None:
+    first = run_setup(setup_cache, tmp_path / "first", [BUILD_VENV])
+    assert first.returncode == 0
+    assert "Setup cache miss" in first.stdout
+    assert (tmp_path / "cache" / "key.tar.gz").is_file()
+
+    second = run_setup(setup_cache, tmp_path / "second", [BUILD_VENV])
+    assert second.returncode == 0
+    assert "Setup cache hit" in second.stdout
+    assert (tmp_path / "second" / ".venv" / "pyvenv.cfg").is_file()
+    assert not (tmp_path / "second" / "builds").exists()
+
+
+def test_broken_restored_environment_is_rebuilt(
+    tmp_path: Path,
+    setup_cache: SetupCache,
+) -> None:
+    broken = tmp_path / "broken"
+    (broken / ".venv" / "bin").mkdir(parents=True)
+    (broken / ".venv" / "pyvenv.cfg").touch()
+    (broken / ".venv" / "bin" / "python").symlink_to("/nonexistent/python3")
+    subprocess.run(
+        ["tar", "-czf", str(tmp_path / "cache" / "key.tar.gz"), ".venv"],
+        cwd=broken,
+        check=True,
+    )
+
+    result = run_setup(setup_cache, tmp_path / "job", [BUILD_VENV])
+    assert result.returncode == 0
+    assert "restored environment is broken" in result.stdout
+    assert "Setup cache miss" in result.stdout
+    assert (tmp_path / "job" / "builds").read_text() == "built\n"
+
+
+def test_failing_setup_command_is_not_archived(
+    tmp_path: Path,
+    setup_cache: SetupCache,
+) -> None:
+    result = run_setup(setup_cache, tmp_path / "job", [BUILD_VENV, "false", "touch x"])
+
+    assert result.returncode == 1
+    assert not (tmp_path / "job" / "x").exists()
+    assert not (tmp_path / "cache" / "key.tar.gz").exists()
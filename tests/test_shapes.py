@@ -0,0 +1,88 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the resource shapes selected by the jobs of a sweep."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from conftest import FakeLaunch
+
+from hydra_skypilot_launcher.config.config_types import ResourcesConfig
+from hydra_skypilot_launcher.launcher.overrides import OverrideEncoder
+from hydra_skypilot_launcher.launcher.shapes import ResourceShapes
+
+DEFAULT = ResourcesConfig(infrastructure="gcp", cpus=4)
+BIG = ResourcesConfig(infrastructure="aws", cpus=32, accelerators="A100:8")
+
+
+@pytest.fixture
+def shapes() -> ResourceShapes:
+    """Create the resource shapes of a sweep."""
+    return ResourceShapes(DEFAULT, {"big": BIG})
+
+
+def test_shapes_and_field_overrides_select_resources(shapes: ResourceShapes) -> None:
+    assert shapes.get() == DEFAULT
+    assert shapes.get("big") == BIG
+    assert shapes.get(None, ["cpus=8"]) == ResourcesConfig(
+        infrastructure="gcp",
+        cpus=8,
+    )
+    assert shapes.get("big", ["use_spot=true"]).use_spot
+    # Every distinct selection is resolved once
+    assert shapes.get("big", ["use_spot=true"]) is shapes.get("big", ["use_spot=true"])
+
+
+def test_unknown_shape_is_rejected(shapes: ResourceShapes) -> None:
+    with pytest.raises(ValueError, match="Unknown resource shape 'huge'"):
+        shapes.get("huge")
+
+
+@pytest.mark.parametrize(
+    "override",
+    ["+launch/resources.cpus=8", "+launch/resource_shape=big"],
+)
+def test_config_group_form_is_rejected(override: str) -> None:
+    with pytest.raises(ValueError, match=r"\+launch\.resources\.<field>"):
+        OverrideEncoder().encode_job(["x=1", override])
+
+
+def test_jobs_are_launched_with_their_resources(
+    launch_sweep: Callable[..., Any],
+    fake_launch: FakeLaunch,
+) -> None:
+    launch_sweep(
+        [
+            ["x=0"],
+            ["x=1", "+launch.resource_shape=big"],
+            ["x=2", "+launch.resources.cpus=8"],
+        ],
+    )
+
+    cpus = [
+        next(iter(task.resources)).cpus
+        for task in sorted(fake_launch.tasks, key=lambda task: task.name)
+    ]
+    assert cpus == ["4", "32", "8"]
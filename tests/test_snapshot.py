@@ -0,0 +1,145 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the content-addressed workdir snapshot."""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from hydra_skypilot_launcher.config.config_types import FileMount
+from hydra_skypilot_launcher.config.launcher import WorkdirSnapshotConfig
+from hydra_skypilot_launcher.launcher.hashing import list_files
+from hydra_skypilot_launcher.launcher.snapshot import WorkdirSnapshot
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "test",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "test",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+    "GIT_CONFIG_GLOBAL": "/dev/null",
+}
+
+
+def git(directory: Path, *args: str) -> None:
+    """Run a git command in a directory."""
+    subprocess.run(
+        ["git", "-c", "protocol.file.allow=always", *args],
+        cwd=directory,
+        env={**GIT_ENV, "PATH": os.environ["PATH"]},
+        capture_output=True,
+        check=True,
+    )
+
+
+@pytest.fixture
+def workdir(tmp_path: Path) -> Path:
+    """Create a git repository with an ignored file and a submodule."""
+    library = tmp_path / "library"
+    library.mkdir()
+    (library / "lib.py").write_text("VALUE = 1\n")
+    git(library, "init", "-q")
+    git(library, "add", ".")
+    git(library, "commit", "-q", "-m", "library")
+
+    workdir = tmp_path / "workdir"
+    workdir.mkdir()
+    (workdir / ".gitignore").write_text("outputs/\n")
+    (workdir / "train.py").write_text("print('train')\n")
+    (workdir / "outputs").mkdir()
+    (workdir / "outputs" / "model.bin").write_text("weights")
+    git(workdir, "init", "-q")
+    git(workdir, "add", ".")
+    git(workdir, "submodule", "add", "-q", str(library), "library")
+    git(workdir, "commit", "-q", "-m", "workdir")
+    (workdir / "notes.txt").write_text("untracked\n")
+    return workdir
+
+
+@pytest.fixture
+def constructed(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the snapshots uploaded to a bucket instead of uploading them."""
+    names: list[str] = []
+
+    class Storage:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def construct(self) -> None:
+            names.append(self.name)
+
+    def to_sky_storage(self: FileMount) -> Any:
+        return Storage(str(self.name))
+
+    monkeypatch.setattr(FileMount, "to_sky_storage", to_sky_storage)
+    return names
+
+
+def test_files_ignored_by_git_are_skipped(workdir: Path) -> None:
+    assert list_files(workdir) == [
+        ".gitignore",
+        ".gitmodules",
+        "library/lib.py",
+        "notes.txt",
+        "train.py",
+    ]
+
+
+def test_all_files_are_listed_outside_of_git(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("")
+    (tmp_path / "outputs").mkdir()
+    (tmp_path / "outputs" / "model.bin").write_text("")
+
+    assert list_files(tmp_path) == ["outputs/model.bin", "src/main.py"]
+
+
+def test_digest_follows_the_content(tmp_path: Path, workdir: Path) -> None:
+    snapshot = WorkdirSnapshot(WorkdirSnapshotConfig(), tmp_path / "cache")
+    digest = snapshot.get_digest(workdir)
+
+    (workdir / "outputs" / "model.bin").write_text("other weights")
+    assert snapshot.get_digest(workdir) == digest
+    (workdir / "library" / "lib.py").write_text("VALUE = 2\n")
+    assert snapshot.get_digest(workdir) != digest
+
+
+def test_snapshot_is_uploaded_once(
+    tmp_path: Path,
+    workdir: Path,
+    constructed: list[str],
+) -> None:
+    config = WorkdirSnapshotConfig(name_prefix="snap")
+
+    file_mount = WorkdirSnapshot(config, tmp_path / "cache").prepare(workdir)
+    WorkdirSnapshot(config, tmp_path / "cache").prepare(workdir)
+    (workdir / "train.py").write_text("print('changed')\n")
+    changed = WorkdirSnapshot(config, tmp_path / "cache").prepare(workdir)
+
+    assert constructed == [file_mount.name, changed.name]
+    assert file_mount.name != changed.name
+    assert str(file_mount.name).startswith("snap-")
+    assert file_mount.source is None
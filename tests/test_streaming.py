@@ -0,0 +1,85 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of launching sweeps in streaming mode."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from conftest import FakeLaunch
+from hydra.core.utils import JobStatus
+from omegaconf import OmegaConf
+
+from hydra_skypilot_launcher.launcher.results import LaunchedJobReturn
+
+JOB_OVERRIDES: list[list[str]] = [
+    [f"x={job_num}", f"db={'ab'[job_num % 2]}"] for job_num in range(5)
+]
+
+
+def load_job(sweep_dir: Path, job_num: int) -> dict[str, Any]:
+    """Load the saved configs of a job, without the sweep specific values."""
+    hydra_dir = sweep_dir / str(job_num) / ".hydra"
+    config = OmegaConf.to_container(OmegaConf.load(hydra_dir / "config.yaml"))
+    assert isinstance(config, dict)
+    hydra_config = config.pop("hydra")
+    # The launcher configs only differ by the streaming mode
+    hydra_config["launcher"].pop("streaming")
+    return {
+        "config": config,
+        "overrides": OmegaConf.to_container(
+            OmegaConf.load(hydra_dir / "overrides.yaml")
+        ),
+        "task_overrides": hydra_config["overrides"]["task"],
+        "launcher": hydra_config["launcher"],
+        "files": sorted(path.name for path in hydra_dir.iterdir()),
+    }
+
+
+def test_streaming_saves_the_same_configs(
+    tmp_path: Path,
+    launch_sweep: Callable[..., Any],
+    fake_launch: FakeLaunch,
+) -> None:
+    launch_sweep(JOB_OVERRIDES, sweep_dir=tmp_path / "default")
+    _, job_returns = launch_sweep(
+        JOB_OVERRIDES,
+        "hydra.launcher.streaming.enabled=true",
+        "hydra.launcher.streaming.window=2",
+        sweep_dir=tmp_path / "streaming",
+    )
+
+    assert len(fake_launch.tasks) == 2 * len(JOB_OVERRIDES)
+    for job_num, job_return in enumerate(job_returns):
+        assert isinstance(job_return, LaunchedJobReturn)
+        assert job_return.status is JobStatus.COMPLETED
+        assert job_return.overrides == JOB_OVERRIDES[job_num]
+        assert job_return.request_id == f"req-{len(JOB_OVERRIDES) + job_num}"
+        streamed = load_job(tmp_path / "streaming", job_num)
+        assert streamed["config"] == {
+            "x": job_num,
+            "y": "a",
+            "db": {"port": job_num % 2 + 1},
+        }
+        assert streamed == load_job(tmp_path / "default", job_num)
@@ -0,0 +1,150 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the incremental upload of file mounts."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from hydra_skypilot_launcher.config.config_types import FileMount
+from hydra_skypilot_launcher.config.launcher import DeltaSyncConfig
+from hydra_skypilot_launcher.launcher.sync import DeltaSync, LocalBucket
+
+
+class RecordingBucket(LocalBucket):
+    """Local bucket recording the uploaded and deleted objects."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the bucket with empty records."""
+        super().__init__(root)
+        self.uploaded: list[str] = []
+        self.deleted: list[str] = []
+
+    def upload(self, bucket_name: str, key: str, file_path: Path) -> None:
+        """Record and upload a file."""
+        self.uploaded.append(key)
+        super().upload(bucket_name, key, file_path)
+
+    def delete(self, bucket_name: str, key: str) -> None:
+        """Record and delete an object."""
+        self.deleted.append(key)
+        super().delete(bucket_name, key)
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """Create the source directory of a file mount."""
+    source_dir = tmp_path / "data"
+    (source_dir / "nested").mkdir(parents=True)
+    (source_dir / "a.txt").write_text("a")
+    (source_dir / "b.txt").write_text("b")
+    (source_dir / "nested" / "c.txt").write_text("c")
+    return source_dir
+
+
+@pytest.fixture
+def bucket(tmp_path: Path) -> RecordingBucket:
+    """Create a local bucket."""
+    return RecordingBucket(tmp_path / "buckets")
+
+
+def get_delta_sync(cache_dir: Path, bucket: LocalBucket) -> DeltaSync:
+    """Create a delta sync with a single worker."""
+    return DeltaSync(DeltaSyncConfig(enabled=True, workers=1), cache_dir, bucket)
+
+
+def get_file_mount(source: Path) -> FileMount:
+    """Get a file mount of the source directory."""
+    return FileMount(name="data", source=source, destination=Path("/data"))
+
+
+def test_unchanged_files_are_skipped(
+    tmp_path: Path,
+    source: Path,
+    bucket: RecordingBucket,
+) -> None:
+    delta_sync = get_delta_sync(tmp_path / "cache", bucket)
+    file_mount = get_file_mount(source)
+    assert delta_sync.supports(file_mount)
+
+    synced = delta_sync.sync(file_mount)
+    assert synced.source is None
+    assert sorted(bucket.uploaded) == ["a.txt", "b.txt", "nested/c.txt"]
+
+    bucket.uploaded.clear()
+    delta_sync.sync(file_mount)
+    assert bucket.uploaded == []
+    assert bucket.deleted == []
+
+
+def test_changed_files_are_uploaded(
+    tmp_path: Path,
+    source: Path,
+    bucket: RecordingBucket,
+) -> None:
+    delta_sync = get_delta_sync(tmp_path / "cache", bucket)
+    file_mount = get_file_mount(source)
+    delta_sync.sync(file_mount)
+    bucket.uploaded.clear()
+
+    (source / "a.txt").write_text("changed")
+    (source / "d.txt").write_text("d")
+    (source / "b.txt").unlink()
+    delta_sync.sync(file_mount)
+
+    assert sorted(bucket.uploaded) == ["a.txt", "d.txt"]
+    assert bucket.deleted == ["b.txt"]
+    assert bucket.read("data", "a.txt") == b"changed"
+    assert not bucket.exists("data", "b.txt")
+
+
+def test_manifest_is_read_from_the_bucket(
+    tmp_path: Path,
+    source: Path,
+    bucket: RecordingBucket,
+) -> None:
+    get_delta_sync(tmp_path / "cache", bucket).sync(get_file_mount(source))
+    bucket.uploaded.clear()
+
+    # Another machine without a local manifest skips the unchanged files
+    get_delta_sync(tmp_path / "other_cache", bucket).sync(get_file_mount(source))
+    assert bucket.uploaded == []
+
+
+def test_deleted_bucket_is_uploaded_in_full(
+    tmp_path: Path,
+    source: Path,
+    bucket: RecordingBucket,
+) -> None:
+    delta_sync = get_delta_sync(tmp_path / "cache", bucket)
+    delta_sync.sync(get_file_mount(source))
+    bucket.uploaded.clear()
+
+    # The bucket was deleted, e.g. as its storage was not persistent
+    shutil.rmtree(bucket.root / "data")
+    delta_sync.sync(get_file_mount(source))
+
+    assert sorted(bucket.uploaded) == ["a.txt", "b.txt", "nested/c.txt"]
+    assert bucket.read("data", "nested/c.txt") == b"c"
@@ -0,0 +1,163 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: Hydra SkyPilot Launcher
+# Author: Carel van Niekerk
+# Year: 2025
+# Group: Dialogue Systems and Machine Learning Group
+# Institution: Heinrich Heine University Düsseldorf
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT, Bing Chat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http: //www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the client-side rate limiting of job submissions."""
+
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import pytest
+
+from hydra_skypilot_launcher.config.launcher import RateLimitConfig
+from hydra_skypilot_launcher.launcher import throttle
+from hydra_skypilot_launcher.launcher.throttle import SubmissionThrottle, is_retryable
+
+
+class HTTPError(Exception):
+    """Error of a request carrying the response of the API server."""
+
+    def __init__(self, status_code: int) -> None:
+        """Initialize the error with the status code of the response."""
+        super().__init__(f"HTTP {status_code}")
+        self.response = SimpleNamespace(status_code=status_code)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Advance the clock of the throttle by its sleeps instead of waiting."""
+    now: list[float] = [0.0]
+    recorded: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        recorded.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(throttle.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(throttle.time, "sleep", sleep)
+    return recorded
+
+
+def failing(errors: list[Exception]) -> Callable[[], str]:
+    """Get a submission function raising the errors before succeeding."""
+
+    def submit() -> str:
+        submit.calls += 1  # type: ignore[unresolved-attribute]
+        if errors:
+            raise errors.pop(0)
+        return "request"
+
+    submit.calls = 0  # type: ignore[unresolved-attribute]
+    return submit
+
+
+def chained_refusal() -> RuntimeError:
+    """Get an error raised while handling a refused connection."""
+    try:
+        try:
+            raise ConnectionRefusedError
+        except ConnectionRefusedError as error:
+            msg = "Could not connect to the API server."
+            raise RuntimeError(msg) from error
+    except RuntimeError as error:
+        return error
+
+
+@pytest.mark.parametrize(
+    ("error", "retryable"),
+    [
+        (ConnectionRefusedError(), True),
+        (HTTPError(429), True),
+        (HTTPError(503), True),
+        (chained_refusal(), True),
+        (HTTPError(500), False),
+        (TimeoutError("read timed out"), False),
+        (RuntimeError("submission failed"), False),
+        (ValueError("invalid task"), False),
+    ],
+)
+def test_only_errors_before_submission_are_retryable(
+    error: Exception,
+    retryable: bool,
+) -> None:
+    assert is_retryable(error) is retryable
+
+
+def test_refused_submissions_are_retried(sleeps: list[float]) -> None:
+    submission_throttle = SubmissionThrottle(RateLimitConfig(enabled=True))
+    submit = failing([ConnectionRefusedError(), HTTPError(429)])
+
+    assert submission_throttle.call(submit) == "request"
+    assert submit.calls == 3  # type: ignore[unresolved-attribute]
+    assert len(sleeps) == 2
+
+
+def test_possibly_submitted_jobs_are_not_retried(sleeps: list[float]) -> None:
+    submission_throttle = SubmissionThrottle(RateLimitConfig(enabled=True))
+    submit = failing([TimeoutError("read timed out")])
+
+    with pytest.raises(TimeoutError):
+        submission_throttle.call(submit)
+    assert submit.calls == 1  # type: ignore[unresolved-attribute]
+    assert sleeps == []
+
+
+def test_retries_stop_at_the_maximum(sleeps: list[float]) -> None:
+    submission_throttle = SubmissionThrottle(
+        RateLimitConfig(enabled=True, max_retries=2),
+    )
+    submit = failing([ConnectionRefusedError() for _ in range(5)])
+
+    with pytest.raises(ConnectionRefusedError):
+        submission_throttle.call(submit)
+    assert submit.calls == 3  # type: ignore[unresolved-attribute]
+
+
+def test_rate_grows_on_success_and_drops_on_failure(sleeps: list[float]) -> None:
+    submission_throttle = SubmissionThrottle(
+        RateLimitConfig(enabled=True, initial_rate=2, increase=1, decrease=0.5),
+    )
+    submission_throttle.call(failing([]))
+    assert submission_throttle.rate == 3
+
+    with pytest.raises(RuntimeError):
+        submission_throttle.call(failing([RuntimeError()]))
+    assert submission_throttle.rate == 1.5
+
+
+def test_submissions_wait_for_a_token(sleeps: list[float]) -> None:
+    submission_throttle = SubmissionThrottle(
+        RateLimitConfig(enabled=True, initial_rate=2, burst=1),
+    )
+    submission_throttle.acquire()
+    submission_throttle.acquire()
+
+    assert sleeps == [0.5]
+
+
+@pytest.mark.parametrize(
+    "config",
+    [RateLimitConfig(min_rate=0), RateLimitConfig(burst=0)],
+)
+def test_rate_limit_that_never_refills_is_rejected(config: RateLimitConfig) -> None:
+    with pytest.raises(ValueError, match="min_rate"):
+        SubmissionThrottle(config)